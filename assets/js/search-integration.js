@@ -1,12 +1,121 @@
 /**
  * Clean Search Integration for Influencer News CMS
- * Uses the local search API server at localhost:8080
+ * Uses the local search API server at localhost:8080, and the prebuilt
+ * sharded index (api/mobile/search/) when the server can't be reached
  */
 
+/**
+ * Offline search over the sharded index written by mobile_api_generator.py.
+ * Loads index.json, then only the prefix shards for the query terms and
+ * the doc buckets holding the top hits.
+ */
+class OfflineSearchIndex {
+    constructor(baseURL = '/api/mobile/search/') {
+        this.baseURL = baseURL;
+        this.index = null;
+        this.files = new Map();
+    }
+
+    /**
+     * Fetch a JSON file once; failed fetches are retried on the next call
+     * @param {string} path - Path relative to the index directory
+     * @returns {Promise<Object>} Parsed JSON
+     */
+    load(path) {
+        if (!this.files.has(path)) {
+            const request = fetch(this.baseURL + path).then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP ${response.status}: ${path}`);
+                }
+                return response.json();
+            }).catch(error => {
+                this.files.delete(path);
+                throw error;
+            });
+            this.files.set(path, request);
+        }
+        return this.files.get(path);
+    }
+
+    tokenize(text, minLength) {
+        return (text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [])
+            .filter(token => token.length >= minLength);
+    }
+
+    /**
+     * Best score per document for every indexed term starting with a token
+     * @param {string} token - Query word
+     * @returns {Promise<Map>} Document number -> score
+     */
+    async termScores(token) {
+        const scores = new Map();
+        const shard = this.index.shards[token.slice(0, this.index.prefix_length)];
+        if (!shard) return scores;
+
+        const { terms } = await this.load(`${shard}.json`);
+        for (const [term, postings] of Object.entries(terms)) {
+            if (!term.startsWith(token)) continue;
+            for (const [doc, score] of postings) {
+                scores.set(doc, Math.max(scores.get(doc) || 0, score));
+            }
+        }
+        return scores;
+    }
+
+    /**
+     * Search the index; results have the same shape as the API's
+     * @param {string} query - Search query
+     * @param {Object} options - limit and offset
+     * @returns {Promise<Object>} Search results
+     */
+    async search(query, options = {}) {
+        const { limit = 20, offset = 0 } = options;
+        this.index = this.index || await this.load('index.json');
+
+        const results = {
+            query, articles: [], authors: [], categories: [], trending: [],
+            total_results: 0, offline: true
+        };
+        const tokens = this.tokenize(query, this.index.prefix_length);
+        if (!tokens.length) return results;
+
+        // Every word must match, like the server's FTS query
+        let matches = null;
+        for (const scores of await Promise.all(tokens.map(token => this.termScores(token)))) {
+            if (matches === null) {
+                matches = scores;
+                continue;
+            }
+            const both = new Map();
+            for (const [doc, score] of scores) {
+                if (matches.has(doc)) both.set(doc, matches.get(doc) + score);
+            }
+            matches = both;
+        }
+
+        const ranked = [...matches].sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+        const page = ranked.slice(offset, offset + limit).map(([doc]) => doc);
+        const size = this.index.bucket_size;
+        const buckets = new Map(await Promise.all(
+            [...new Set(page.map(doc => Math.floor(doc / size)))]
+                .map(n => this.load(`docs/${n}.json`).then(bucket => [n, bucket.docs]))
+        ));
+
+        const groups = { article: 'articles', author: 'authors', category: 'categories', trending: 'trending' };
+        for (const doc of page) {
+            const meta = buckets.get(Math.floor(doc / size))[doc % size];
+            if (meta) results[groups[meta.type]].push(meta);
+        }
+        results.total_results = ranked.length;
+        return results;
+    }
+}
+
 class SearchAPI {
     constructor() {
         this.apiBaseURL = 'http://localhost:8080/api';
         this.isSearching = false;
+        this.offlineIndex = new OfflineSearchIndex();
     }
 
     /**
@@ -39,6 +148,10 @@ class SearchAPI {
             return results;
         } catch (error) {
             console.error('Search API error:', error);
+            // fetch() rejects with a TypeError when the server is unreachable
+            if (error instanceof TypeError) {
+                return await this.offlineIndex.search(query, { limit, offset });
+            }
             throw error;
         } finally {
             this.isSearching = false;
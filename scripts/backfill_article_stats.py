@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Backfill Article Stats
+======================
+Fills the article columns derived at ingest for rows written before they
+existed: word_count, read_time_minutes as whole minutes (older rows hold
+text such as '3 min'), and content_hash for articles whose content file
+is unchanged since the last file sync, so the next parse of that file can
+reuse the stored HTML.
+
+Usage:
+    python3 scripts/backfill_article_stats.py
+    python3 scripts/backfill_article_stats.py --all        # recount every row
+    python3 scripts/backfill_article_stats.py --dry-run
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_manager import DatabaseManager
+from src.integrators.article_integrator import ArticleIntegrator
+from src.integrators.sync_manifest import SyncManifest, hash_file
+from src.models.article import count_words, estimate_read_time, parse_read_time
+
+
+def backfill_counts(db: DatabaseManager, recount_all: bool = False, dry_run: bool = False) -> int:
+    """
+    Store word counts and whole-minute read times
+
+    Args:
+        db: Database to update
+        recount_all: Recount every row and re-derive every read time from it
+        dry_run: Only count the rows that would change
+
+    Returns:
+        Rows updated (or that would be)
+    """
+    where = "" if recount_all else """
+        WHERE word_count IS NULL OR typeof(read_time_minutes) != 'integer' OR read_time_minutes <= 0
+    """
+    updates = []
+    with db.get_connection() as conn:
+        for row in conn.execute(f"SELECT id, content, word_count, read_time_minutes FROM articles {where}"):
+            words = count_words(row['content'])
+            minutes = (0 if recount_all else parse_read_time(row['read_time_minutes'])) or estimate_read_time(words)
+            if (words, minutes) != (row['word_count'], row['read_time_minutes']):
+                updates.append((words, minutes, row['id']))
+        if updates and not dry_run:
+            conn.executemany("UPDATE articles SET word_count = ?, read_time_minutes = ? WHERE id = ?", updates)
+    return len(updates)
+
+
+def backfill_hashes(db: DatabaseManager, integrator: ArticleIntegrator, dry_run: bool = False) -> int:
+    """
+    Store the source hash of articles whose content file is unchanged since it was synced
+
+    Files are matched to rows through the sync manifest; a file edited
+    since then is left for the next sync, which stores its hash.
+
+    Returns:
+        Rows updated (or that would be)
+    """
+    manifest = SyncManifest('articles')
+    updates = []
+    for name, entry in manifest.entries.items():
+        path = integrator.content_dir / name
+        try:
+            if hash_file(path) != entry.get('hash'):
+                continue
+            sections = integrator.split_article_file(path.read_text(encoding='utf-8'))
+        except OSError:
+            continue
+        if sections:
+            updates.append((integrator.hash_article_body(sections[1]), entry['id']))
+
+    if updates and not dry_run:
+        with db.get_connection() as conn:
+            conn.executemany("UPDATE articles SET content_hash = ? WHERE id = ? AND content_hash IS NOT ?",
+                             [(content_hash, row_id, content_hash) for content_hash, row_id in updates])
+    return len(updates)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill derived article columns')
+    parser.add_argument('--all', action='store_true',
+                        help='Recount every article and re-derive read times from word counts')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing')
+    args = parser.parse_args()
+
+    db = DatabaseManager()
+    suffix = ' (dry run)' if args.dry_run else ''
+    print(f"🔢 Word counts and read times: {backfill_counts(db, args.all, args.dry_run)} articles updated{suffix}")
+    print(f"🔑 Source hashes: {backfill_hashes(db, ArticleIntegrator(), args.dry_run)} articles matched to "
+          f"unchanged content files{suffix}")
+
+
+if __name__ == "__main__":
+    main()
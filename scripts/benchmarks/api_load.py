@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+PWA API Load Test
+=================
+Drives scripts/pwa_api_server.py with concurrent keep-alive clients and
+reports latency percentiles and throughput per concurrency level.
+
+By default a server is started for the run (threaded, and with
+--compare also the old single-threaded server). Use --url to load an
+already running server instead.
+
+Usage:
+    python3 scripts/benchmarks/api_load.py
+    python3 scripts/benchmarks/api_load.py --concurrency 1,16,128 --duration 10 --compare
+    python3 scripts/benchmarks/api_load.py --url http://localhost:8080
+"""
+
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import subprocess
+import http.client
+from pathlib import Path
+from urllib.parse import urlparse
+
+project_root = Path(__file__).parent.parent.parent
+SERVER_SCRIPT = project_root / 'scripts' / 'pwa_api_server.py'
+
+
+def build_paths(host: str, port: int) -> list:
+    """A mix of list, detail, search and health requests"""
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    conn.request('GET', '/api/articles?limit=5')
+    articles = json.loads(conn.getresponse().read()).get('articles', [])
+    conn.close()
+
+    paths = ['/api/health', '/api/articles?limit=20', '/api/categories',
+             '/api/trending', '/api/search?q=creator', '/api/search?q=brand']
+    paths += [f"/api/articles/{article['id']}" for article in articles[:3]]
+    return paths
+
+
+def client_loop(host: str, port: int, paths: list, deadline: float,
+                latencies: list, errors: list) -> None:
+    """Send requests over one connection, reconnecting when the server closes it"""
+    conn = None
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection(host, port, timeout=30)
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            if response.status >= 500:
+                errors.append(response.status)
+            if response.will_close:
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(type(e).__name__)
+            if conn is not None:
+                conn.close()
+            conn = None
+            continue
+        latencies.append(time.perf_counter() - start)
+    if conn is not None:
+        conn.close()
+
+
+def run_level(host: str, port: int, paths: list, clients: int, duration: float) -> dict:
+    """Run one concurrency level and summarize it"""
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    threads = [threading.Thread(target=client_loop,
+                                args=(host, port, paths, deadline, latencies, errors))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(p):
+        if not latencies:
+            return float('nan')
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {'clients': clients, 'requests': len(latencies), 'errors': len(errors),
+            'rps': len(latencies) / elapsed, 'p50': percentile(0.50), 'p99': percentile(0.99)}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(extra_args: list) -> tuple:
+    """Start pwa_api_server.py on a free port and wait until it answers"""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT), '--port', str(port), '--quiet'] + extra_args,
+        cwd=str(project_root), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited: {process.stderr.read().decode(errors='replace')}")
+        try:
+            conn = http.client.HTTPConnection('localhost', port, timeout=2)
+            conn.request('GET', '/api/health')
+            conn.getresponse().read()
+            conn.close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start within 30s")
+
+
+def report(label: str, host: str, port: int, levels: list, duration: float) -> None:
+    paths = build_paths(host, port)
+    print(f"\n{label}")
+    print(f"{'clients':>8} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for clients in levels:
+        result = run_level(host, port, paths, clients, duration)
+        print(f"{result['clients']:8d} {result['requests']:9d} {result['rps']:9.0f} "
+              f"{result['p50']:9.2f} {result['p99']:9.2f} {result['errors']:7d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PWA API load test')
+    parser.add_argument('--url', help='Load an already running server (e.g. http://localhost:8080)')
+    parser.add_argument('--concurrency', default='1,16,128', help='Comma-separated client counts')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per concurrency level')
+    parser.add_argument('--workers', type=int, help='Worker threads for the started server')
+    parser.add_argument('--compare', action='store_true',
+                        help='Also load the old single-threaded server')
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(',') if level.strip()]
+
+    if args.url:
+        parsed = urlparse(args.url)
+        report(args.url, parsed.hostname, parsed.port or 80, levels, args.duration)
+        return
+
+    modes = [('Threaded server (keep-alive)',
+              ['--workers', str(args.workers)] if args.workers else [])]
+    if args.compare:
+        modes.append(('Single-threaded server (old)', ['--single-threaded']))
+
+    for label, extra_args in modes:
+        process, port = start_server(extra_args)
+        try:
+            report(label, 'localhost', port, levels, args.duration)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Content Parse Benchmark
+=======================
+Files per second of the file-sync parse stage (ArticleIntegrator.
+parse_files) over synthetic article files, serial and across worker
+processes, and whether the pool returns the same records as a serial
+parse.
+
+Usage:
+    python3 scripts/benchmarks/content_parse.py
+    python3 scripts/benchmarks/content_parse.py --files 10000 --workers 1,2,4,8
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.config import config
+from sync_manifest import write_articles
+
+# Parsed fields that are randomised or time-stamped on every parse
+VOLATILE_FIELDS = {'date', 'views', 'comments'}
+
+
+def stable(record: dict) -> dict:
+    return {key: value for key, value in record.items() if key not in VOLATILE_FIELDS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Content file parse stage benchmark')
+    parser.add_argument('--files', type=int, default=10000, help='Synthetic article files')
+    parser.add_argument('--workers', default=f"1,{os.cpu_count() or 1}",
+                        help='Comma-separated worker counts (1 = serial)')
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="infnews_parse_bench_"))
+    try:
+        config.set('paths.content_dir', str(workdir / 'content'))
+        config.set('paths.integrated_dir', str(workdir / 'integrated'))
+        config.set('build.parse_parallel_threshold', 0)
+
+        from src.integrators.article_integrator import ArticleIntegrator
+        from src.models.author import Author
+        from src.models.category import Category
+
+        integrator = ArticleIntegrator()
+        author, category = Author.find_all(limit=1)[0], Category.find_all(limit=1)[0]
+        write_articles(integrator.content_dir, args.files, author.name, category.slug)
+        paths = sorted(integrator.content_dir.glob('*.txt'))
+
+        print(f"📄 {len(paths)} files, {os.cpu_count()} CPU cores")
+        print(f"\n{'workers':>8} {'seconds':>9} {'files/s':>9} {'errors':>7} {'same as serial':>15}")
+        baseline = None
+        for workers in (int(w) for w in args.workers.split(',')):
+            integrator.parse_workers = workers
+            start = time.perf_counter()
+            with integrator.parse_files(paths) as parsed:
+                results = list(parsed)
+            elapsed = time.perf_counter() - start
+
+            records = [stable(data) if data else error for data, error in results]
+            baseline = baseline or records
+            errors = sum(1 for _, error in results if error)
+            print(f"{integrator.parse_stats['workers']:8d} {elapsed:9.2f} {len(paths) / elapsed:9.0f} "
+                  f"{errors:7d} {'yes' if records == baseline else 'NO':>15}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Database Read Latency Benchmark
+===============================
+Measures API-style read latency while a sync-style writer is running,
+comparing SQLite defaults against the ``database.pragmas`` profile
+from config.yaml.
+
+Usage:
+    python3 scripts/benchmarks/db_read_latency.py
+    python3 scripts/benchmarks/db_read_latency.py --articles 5000 --duration 10
+"""
+
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import statistics
+import multiprocessing
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_manager import ConnectionPool
+from src.utils.config import config
+
+READ_QUERY = "SELECT * FROM article_full_view ORDER BY publish_date DESC LIMIT 20"
+
+
+def seed_database(db_path: str, article_count: int, journal_mode: str) -> None:
+    """Fill a copy of the database with synthetic articles"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+    author_id = conn.execute("SELECT id FROM authors LIMIT 1").fetchone()[0]
+    category_id = conn.execute("SELECT id FROM categories LIMIT 1").fetchone()[0]
+    body = "Lorem ipsum dolor sit amet. " * 200
+    conn.executemany(
+        """INSERT INTO articles (title, slug, excerpt, content, author_id, category_id, publish_date)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        [(f"Bench article {i}", f"bench-article-{i}", "Excerpt", body,
+          author_id, category_id, f"2025-01-{(i % 28) + 1:02d}T00:00:{i % 60:02d}")
+         for i in range(article_count)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def writer_process(db_path: str, pragmas: dict, stop_at: float, batch_size: int, counter) -> None:
+    """Simulate a sync: rewrite article rows in large transactions"""
+    pool = ConnectionPool(db_path, pragmas=pragmas)
+    conn = pool.acquire()
+    ids = [row[0] for row in conn.execute("SELECT id FROM articles")]
+    position = 0
+    while time.time() < stop_at:
+        batch = ids[position:position + batch_size] or ids[:batch_size]
+        position = (position + batch_size) % max(len(ids), 1)
+        try:
+            conn.executemany(
+                "UPDATE articles SET content = content || ' ', last_modified = ? WHERE id = ?",
+                [(time.time(), article_id) for article_id in batch]
+            )
+            conn.commit()
+            counter.value += len(batch)
+        except sqlite3.OperationalError:
+            conn.rollback()
+    pool.close_all()
+
+
+def measure_reads(db_path: str, pragmas: dict, stop_at: float) -> dict:
+    """Run the read query in a loop until stop_at, recording latency"""
+    pool = ConnectionPool(db_path, pragmas=pragmas)
+    latencies = []
+    errors = 0
+    while time.time() < stop_at:
+        conn = pool.acquire()
+        start = time.perf_counter()
+        try:
+            conn.execute(READ_QUERY).fetchall()
+            latencies.append((time.perf_counter() - start) * 1000)
+        except sqlite3.OperationalError:
+            errors += 1
+        finally:
+            pool.release(conn)
+    pool.close_all()
+    return summarize(latencies, errors)
+
+
+def summarize(latencies: list, errors: int) -> dict:
+    """Percentiles in milliseconds"""
+    if not latencies:
+        return {'reads': 0, 'errors': errors}
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+    return {
+        'reads': len(latencies),
+        'errors': errors,
+        'p50': pct(0.50),
+        'p95': pct(0.95),
+        'p99': pct(0.99),
+        'max': latencies[-1],
+        'mean': statistics.fmean(latencies),
+    }
+
+
+def run_profile(name: str, pragmas: dict, args) -> dict:
+    """Benchmark one PRAGMA profile on a fresh database copy"""
+    workdir = tempfile.mkdtemp(prefix=f"infnews_bench_{name}_")
+    db_path = str(Path(workdir) / "bench.db")
+    try:
+        shutil.copy(config.get_database_path(), db_path)
+        seed_database(db_path, args.articles, pragmas.get('journal_mode', 'DELETE'))
+
+        idle = measure_reads(db_path, pragmas, time.time() + 1.0)
+
+        counter = multiprocessing.Value('i', 0)
+        stop_at = time.time() + args.duration
+        writer = multiprocessing.Process(
+            target=writer_process, args=(db_path, pragmas, stop_at, args.batch_size, counter)
+        )
+        writer.start()
+        time.sleep(0.2)  # Let the writer take its first lock
+        busy = measure_reads(db_path, pragmas, stop_at)
+        writer.join()
+        busy['rows_written'] = counter.value
+        return {'idle': idle, 'busy': busy}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def print_result(name: str, result: dict) -> None:
+    print(f"\n📊 {name}")
+    for phase in ('idle', 'busy'):
+        stats = result[phase]
+        if not stats.get('reads'):
+            print(f"  {phase:5}: no successful reads ({stats['errors']} errors)")
+            continue
+        line = (f"  {phase:5}: {stats['reads']:6d} reads  p50 {stats['p50']:7.2f}ms  "
+                f"p95 {stats['p95']:7.2f}ms  p99 {stats['p99']:7.2f}ms  "
+                f"max {stats['max']:8.2f}ms  errors {stats['errors']}")
+        if 'rows_written' in stats:
+            line += f"  rows written {stats['rows_written']}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Read latency during sync benchmark')
+    parser.add_argument('--articles', type=int, default=2000, help='Synthetic articles to seed')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds of concurrent writes')
+    parser.add_argument('--batch-size', type=int, default=500, help='Rows per write transaction')
+    args = parser.parse_args()
+
+    profiles = {
+        'SQLite defaults (rollback journal)': {'journal_mode': 'DELETE'},
+        'Tuned profile (config.yaml database.pragmas)': config.get('database.pragmas', {}),
+    }
+
+    print("🔬 Read latency while a sync is writing")
+    print(f"   {args.articles} articles, {args.duration}s writer, {args.batch_size} rows/transaction")
+    for name, pragmas in profiles.items():
+        print_result(name, run_profile(name.split()[0].lower(), pragmas, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+JSON Payload Benchmark
+======================
+Measures response size and encode time for the generated api/mobile
+payloads: the old indented JSON vs compact JSON, gzip and brotli (when
+the brotli package is installed).
+
+Usage:
+    python3 scripts/benchmarks/json_payloads.py
+    python3 scripts/benchmarks/json_payloads.py --dir api/mobile --bandwidth 1.6
+"""
+
+import sys
+import json
+import timeit
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.json_response import encode_json, compress, brotli
+
+
+def encode_pretty(data) -> bytes:
+    """What the API servers sent before"""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def best_us(fn, runs: int) -> float:
+    """Best-of-5 microseconds per call"""
+    return min(timeit.repeat(fn, number=runs, repeat=5)) / runs * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API JSON payload size/latency benchmark')
+    parser.add_argument('--dir', default=str(project_root / 'api' / 'mobile'),
+                        help='Directory of generated JSON payloads')
+    parser.add_argument('--runs', type=int, default=200, help='Encodes per timing round')
+    parser.add_argument('--bandwidth', type=float, default=1.6,
+                        help='Link speed in Mbit/s for the transfer estimate (default: slow 3G)')
+    args = parser.parse_args()
+
+    files = sorted(Path(args.dir).rglob('*.json'))
+    if not files:
+        print(f"❌ No JSON files under {args.dir} (run scripts/mobile/mobile_api_generator.py)")
+        sys.exit(1)
+
+    variants = [
+        ('indent=2 (old)', encode_pretty),
+        ('compact', lambda data: encode_json(data)),
+        ('compact + gzip', lambda data: compress(encode_json(data), 'gzip')),
+    ]
+    if brotli is not None:
+        variants.append(('compact + br', lambda data: compress(encode_json(data), 'br')))
+
+    payloads = [json.loads(path.read_text(encoding='utf-8')) for path in files]
+    runs = max(1, args.runs // len(payloads))
+
+    print(f"📦 {len(payloads)} payloads from {args.dir}")
+    if brotli is None:
+        print("   (brotli not installed; skipping br)")
+    print(f"\n{'variant':18} {'bytes':>10} {'vs old':>8} {'encode µs':>10} {'transfer ms':>12}")
+
+    baseline = None
+    for label, encode in variants:
+        total = sum(len(encode(data)) for data in payloads)
+        encode_us = sum(best_us(lambda data=data: encode(data), runs) for data in payloads)
+        transfer_ms = total * 8 / (args.bandwidth * 1e6) * 1000
+        baseline = baseline or total
+        print(f"{label:18} {total:10,d} {total / baseline:7.0%} {encode_us:10.0f} {transfer_ms:12.1f}")
+
+    print(f"\nencode µs: time to serialize all payloads once; "
+          f"transfer ms: all payloads at {args.bandwidth} Mbit/s")
+
+
+if __name__ == "__main__":
+    main()
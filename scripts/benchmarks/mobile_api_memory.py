@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Mobile API Memory Benchmark
+===========================
+Peak Python memory of generating the article endpoints (articles.json
+plus one detail file per article): the streaming generator against the
+old approach of loading every row, building the whole list and dumping
+it in one go. Runs on database copies seeded with synthetic articles.
+
+Usage:
+    python3 scripts/benchmarks/mobile_api_memory.py
+    python3 scripts/benchmarks/mobile_api_memory.py --articles 1000,10000,50000
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import datetime
+import tempfile
+import tracemalloc
+from pathlib import Path
+from dataclasses import asdict
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'scripts' / 'mobile'))
+
+from src.database.db_manager import DatabaseManager
+from src.utils.config import config
+from search_latency import seed_database
+from mobile_api_generator import MobileAPIGenerator, MobileResponse
+
+
+def materialized_articles(generator: MobileAPIGenerator) -> int:
+    """The pre-streaming article endpoints: every row and payload in memory at once"""
+    with generator.db.get_connection() as conn:
+        cursor = conn.execute("""
+            SELECT a.*,
+                   auth.name as author_name, auth.slug as author_slug,
+                   cat.name as category_name, cat.slug as category_slug
+            FROM articles a
+            LEFT JOIN authors auth ON a.author_id = auth.id
+            LEFT JOIN categories cat ON a.category_id = cat.id
+            ORDER BY a.publish_date DESC
+        """)
+        articles_data = [dict(row) for row in cursor.fetchall()]
+
+    meta = {'total': len(articles_data), 'generated_at': datetime.datetime.now().isoformat()}
+    response = MobileResponse(success=True, meta=meta,
+                              data=[generator.optimize_article_for_mobile(a) for a in articles_data])
+    with open(generator.api_dir / "articles.json", 'w', encoding='utf-8') as f:
+        json.dump(asdict(response), f, indent=2, ensure_ascii=False)
+
+    detail_dir = generator.api_dir / "articles"
+    detail_dir.mkdir(exist_ok=True)
+    for article_data in articles_data:
+        detail = MobileResponse(success=True, meta={'generated_at': meta['generated_at']},
+                                data=generator.optimize_article_for_mobile(article_data, include_full_content=True))
+        with open(detail_dir / f"{article_data['id']}.json", 'w', encoding='utf-8') as f:
+            json.dump(asdict(detail), f, indent=2, ensure_ascii=False)
+    return len(articles_data)
+
+
+def measure(fn) -> tuple:
+    """Peak traced memory in MB and wall time in seconds of one call"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mobile API generation memory benchmark')
+    parser.add_argument('--articles', default='1000,5000,20000',
+                        help='Comma-separated synthetic article counts')
+    args = parser.parse_args()
+
+    counts = [int(count) for count in args.articles.split(',') if count.strip()]
+    original_cwd = os.getcwd()
+
+    print(f"{'articles':>9} {'materialized MB':>16} {'streaming MB':>13} {'materialized s':>15} {'streaming s':>12}")
+    for count in counts:
+        workdir = tempfile.mkdtemp(prefix="infnews_mobile_bench_")
+        db_path = str(Path(workdir) / "bench.db")
+        try:
+            shutil.copy(config.get_database_path(), db_path)
+            seed_database(db_path, count)
+            db = DatabaseManager(db_path)
+
+            # The generator writes to ./api/mobile
+            os.chdir(workdir)
+            generator = MobileAPIGenerator(db=db)
+            old_mb, old_s = measure(lambda: materialized_articles(generator))
+            shutil.rmtree(generator.api_dir / "articles")
+            new_mb, new_s = measure(generator.create_article_endpoints)
+
+            print(f"{count:9d} {old_mb:16.1f} {new_mb:13.1f} {old_s:15.1f} {new_s:12.1f}")
+        finally:
+            os.chdir(original_cwd)
+            DatabaseManager(db_path).close()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Pagination Latency Benchmark
+============================
+Compares LIMIT/OFFSET pages with keyset (cursor) pages of the article
+list at increasing depth, on a database copy seeded with synthetic
+articles.
+
+Usage:
+    python3 scripts/benchmarks/pagination_latency.py
+    python3 scripts/benchmarks/pagination_latency.py --articles 100000 --page-size 20
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_manager import DatabaseManager
+from src.database.pagination import encode_cursor
+from src.utils.config import config
+from search_latency import seed_database
+
+PAGES = [1, 10, 100, 1000]
+
+
+def median_ms(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def cursor_before(db: DatabaseManager, position: int) -> str:
+    """Cursor a client would hold after reading `position` articles"""
+    row = db.execute_one(
+        "SELECT IFNULL(publish_date, '') AS sort_date, id FROM articles "
+        "ORDER BY IFNULL(publish_date, '') DESC, id DESC LIMIT 1 OFFSET ?",
+        (position - 1,)
+    )
+    return encode_cursor([row['sort_date'], row['id']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OFFSET vs keyset pagination benchmark')
+    parser.add_argument('--articles', type=int, default=100000, help='Synthetic articles to seed')
+    parser.add_argument('--page-size', type=int, default=20, help='Articles per page')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per measurement')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="infnews_pagination_bench_")
+    db_path = str(Path(workdir) / "bench.db")
+    try:
+        shutil.copy(config.get_database_path(), db_path)
+
+        print(f"🌱 Seeding {args.articles} articles...")
+        seed_database(db_path, args.articles)
+        db = DatabaseManager(db_path)  # Creates the keyset indexes
+
+        size = args.page_size
+        print(f"\n{'page':>6} {'OFFSET p50':>12} {'cursor p50':>12} {'speedup':>8}")
+        for page in PAGES:
+            position = (page - 1) * size
+            if position >= args.articles:
+                break
+            cursor = cursor_before(db, position) if position else None
+            offset_ms = median_ms(lambda: db.get_articles(limit=size, offset=position), args.runs)
+            cursor_ms = median_ms(lambda: db.get_articles_page(limit=size, cursor=cursor), args.runs)
+            print(f"{page:6d} {offset_ms:10.2f}ms {cursor_ms:10.2f}ms {offset_ms / cursor_ms:7.0f}x")
+    finally:
+        DatabaseManager(db_path).close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Sanitize Cache Benchmark
+========================
+Time to sanitize the strings of one site build (titles and excerpts
+sanitized once per page they appear on, article bodies once) without the
+cache, on a first build (empty store), on a rebuild in a new process
+(persistent store only) and within the same process (in-memory LRU).
+Finally sanitizes one page per article in render pool workers and checks
+that every result the workers produced reached the persistent store.
+
+Usage:
+    python3 scripts/benchmarks/sanitize_cache.py
+    python3 scripts/benchmarks/sanitize_cache.py --articles 2000 --appearances 6
+"""
+
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.integrators.render_pool import render_in_pool
+from src.utils.sanitize_cache import SanitizeCache
+from src.utils.trusted_security import TrustedSanitizer, HAS_BLEACH, trusted_sanitizer
+
+
+class NoCache:
+    """Stand-in that never hits, for the uncached baseline"""
+
+    make_key = staticmethod(SanitizeCache.make_key)
+
+    def get(self, key):
+        return None
+
+    def put(self, key, result):
+        pass
+
+
+class PageSanitizer:
+    """Integrator stand-in whose page method only sanitizes, for the pooled run"""
+
+    def sanitize_page(self, calls):
+        for content, allow_tags in calls:
+            trusted_sanitizer.sanitize_html(content, allow_tags=allow_tags)
+
+
+def build_strings(articles: int, appearances: int) -> list:
+    """(content, allow_tags) calls of one build"""
+    calls = []
+    for n in range(articles):
+        title = f"Breaking: Story {n} & what it means for <em>everyone</em>"
+        excerpt = f"Excerpt of story {n}, with a <a href=\"https://example.com/{n}\">link</a> and <script>x()</script>."
+        body = "".join(f"<p>Paragraph {p} of story {n} with <strong>markup</strong> "
+                       f"and <span onclick=\"y()\">handlers</span>.</p>" for p in range(12))
+        calls += [(title, False), (excerpt, False)] * appearances
+        calls.append((body, True))
+    return calls
+
+
+def timed_build(sanitizer: TrustedSanitizer, calls: list) -> float:
+    start = time.perf_counter()
+    for content, allow_tags in calls:
+        sanitizer.sanitize_html(content, allow_tags=allow_tags)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sanitizer cache benchmark')
+    parser.add_argument('--articles', type=int, default=1000, help='Synthetic articles')
+    parser.add_argument('--appearances', type=int, default=4,
+                        help='Pages each title and excerpt is sanitized on')
+    args = parser.parse_args()
+
+    if not HAS_BLEACH:
+        print("❌ bleach is not installed; the cache only applies to bleach sanitization")
+        return
+
+    calls = build_strings(args.articles, args.appearances)
+    workdir = Path(tempfile.mkdtemp(prefix="infnews_sanitize_bench_"))
+    try:
+        sanitizer = TrustedSanitizer()
+        store = str(workdir / "sanitize_cache.db")
+
+        print(f"🧼 {len(calls)} sanitize calls, {args.articles * 3} distinct strings")
+        print(f"\n{'run':30} {'seconds':>9} {'hit rate':>9}")
+
+        def report(label, cache):
+            sanitizer.cache = cache
+            elapsed = timed_build(sanitizer, calls)
+            hit_rate = cache.get_stats()['hit_rate'] if hasattr(cache, 'get_stats') else 0.0
+            print(f"{label:30} {elapsed:9.3f} {hit_rate:9.1%}")
+            if hasattr(cache, 'flush'):
+                cache.flush()
+
+        report('no cache', NoCache())
+        report('first build (empty store)', SanitizeCache(sanitizer.policy_version, path=store))
+        cache = SanitizeCache(sanitizer.policy_version, path=store)
+        report('rebuild, new process', cache)
+        cache.reset_stats()
+        report('rebuild, same process', cache)
+
+        # Workers inherit the module sanitizer, so point it at an empty store
+        pooled_store = str(workdir / "pooled_cache.db")
+        trusted_sanitizer.cache = SanitizeCache(trusted_sanitizer.policy_version, path=pooled_store)
+        pages = [(calls[n:n + 2 * args.appearances + 1],)
+                 for n in range(0, len(calls), 2 * args.appearances + 1)]
+        start = time.perf_counter()
+        render_in_pool(PageSanitizer, 'sanitize_page', pages, workers=4)
+        elapsed = time.perf_counter() - start
+        conn = sqlite3.connect(pooled_store)
+        stored, = conn.execute("SELECT COUNT(*) FROM sanitized").fetchone()
+        conn.close()
+        print(f"{'pooled build (4 workers)':30} {elapsed:9.3f} {stored:>9d} stored")
+        assert stored == args.articles * 3, \
+            f"expected {args.articles * 3} results stored by the workers, found {stored}"
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Search Latency Benchmark
+========================
+Compares the FTS5 search index against the old LIKE '%q%' scans on a
+database copy seeded with synthetic articles.
+
+Usage:
+    python3 scripts/benchmarks/search_latency.py
+    python3 scripts/benchmarks/search_latency.py --articles 100000 --runs 20
+"""
+
+import sys
+import time
+import random
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root, src and scripts to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'src'))
+sys.path.insert(0, str(project_root / 'scripts'))
+
+from src.database.db_manager import DatabaseManager
+from src.utils.config import config
+from search_backend import SearchBackend
+
+# Topic words that queries target; each appears in a small share of articles
+TOPIC_WORDS = ("creator platform algorithm brand deal audience revenue stream video "
+               "podcast viral trend music gaming fashion beauty fitness travel tech "
+               "sponsorship analytics growth community launch update policy").split()
+QUERIES = ['algorithm', 'viral video', 'brand sponsorship', 'podc', 'fitness travel']
+
+
+def build_vocabulary(rng: random.Random, size: int = 20000) -> list:
+    """Pseudo-words standing in for the long tail of article vocabulary"""
+    syllables = ['ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'ti', 'vo', 'ze', 'po', 'qu', 'ly']
+    return [''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(size)]
+
+
+LEGACY_ARTICLE_QUERY = """
+SELECT a.id, a.title, a.slug, a.excerpt, a.views, a.publish_date,
+       au.name as author_name, c.name as category_name, c.icon as category_icon
+FROM articles a
+JOIN authors au ON a.author_id = au.id
+JOIN categories c ON a.category_id = c.id
+WHERE (a.title LIKE ? OR a.excerpt LIKE ? OR a.content LIKE ?)
+ORDER BY a.publish_date DESC
+LIMIT ? OFFSET ?
+"""
+
+
+def seed_database(db_path: str, article_count: int) -> None:
+    """Insert synthetic articles (FTS triggers index them as they go)"""
+    rng = random.Random(42)
+    conn = sqlite3.connect(db_path)
+    author_id = conn.execute("SELECT id FROM authors LIMIT 1").fetchone()[0]
+    category_id = conn.execute("SELECT id FROM categories LIMIT 1").fetchone()[0]
+
+    vocabulary = build_vocabulary(rng)
+
+    def words(n):
+        # Zipf-like draw from the vocabulary plus the occasional topic word
+        chosen = [vocabulary[min(int(rng.paretovariate(1.1)) - 1, len(vocabulary) - 1)]
+                  if rng.random() > 0.002 else rng.choice(TOPIC_WORDS) for _ in range(n)]
+        return ' '.join(chosen)
+
+    batch = []
+    for i in range(article_count):
+        batch.append((f"{words(6).title()} {i}", f"bench-{i}", words(25), words(300),
+                      author_id, category_id, f"2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}"))
+        if len(batch) == 5000:
+            conn.executemany(
+                """INSERT INTO articles (title, slug, excerpt, content, author_id, category_id, publish_date)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""", batch)
+            batch = []
+    if batch:
+        conn.executemany(
+            """INSERT INTO articles (title, slug, excerpt, content, author_id, category_id, publish_date)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""", batch)
+    conn.commit()
+    conn.close()
+
+
+def time_calls(fn, runs: int) -> dict:
+    """Run fn repeatedly and return latency percentiles in milliseconds"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {'p50': statistics.median(samples), 'max': samples[-1]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='FTS5 vs LIKE search benchmark')
+    parser.add_argument('--articles', type=int, default=100000, help='Synthetic articles to seed')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per query')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="infnews_search_bench_")
+    db_path = str(Path(workdir) / "bench.db")
+    try:
+        shutil.copy(config.get_database_path(), db_path)
+        db = DatabaseManager(db_path)
+        backend = SearchBackend(db)  # Installs the FTS index and triggers
+
+        print(f"🌱 Seeding {args.articles} articles...")
+        start = time.perf_counter()
+        seed_database(db_path, args.articles)
+        print(f"   done in {time.perf_counter() - start:.1f}s")
+
+        print(f"\n{'query':20} {'LIKE p50':>10} {'FTS5 p50':>10} {'FTS5 max':>10} {'speedup':>8}")
+        for query in QUERIES:
+            pattern = f"%{query}%"
+            legacy = time_calls(lambda: db.execute_query(
+                LEGACY_ARTICLE_QUERY, (pattern, pattern, pattern, 20, 0)), max(1, args.runs // 5))
+            fts = time_calls(lambda: backend.search_all(query, 20, 0), args.runs)
+            speedup = legacy['p50'] / fts['p50'] if fts['p50'] else float('inf')
+            print(f"{query:20} {legacy['p50']:9.1f}ms {fts['p50']:9.2f}ms {fts['max']:9.2f}ms {speedup:7.0f}x")
+    finally:
+        DatabaseManager(db_path).close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Sync Manifest Benchmark
+=======================
+Times ArticleIntegrator.sync_with_files() over a directory of synthetic
+article files whose rows are already in the database: without a sync
+manifest (every file parsed and compared field by field), with the
+manifest (no-op), after touching files without changing them, and after
+editing one file.
+
+Usage:
+    python3 scripts/benchmarks/sync_manifest.py
+    python3 scripts/benchmarks/sync_manifest.py --files 50000 --touch 500
+"""
+
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import datetime
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.config import config
+
+ARTICLE_TEMPLATE = """Title: Bench Article {n}
+Author: {author}
+Category: {category}
+Image: https://images.unsplash.com/photo-{n}?w=600&h=300&fit=crop
+Tags: bench, sync
+Excerpt: Synthetic article {n} for the sync benchmark.
+
+---
+
+Opening paragraph of article {n}.
+
+## Section
+
+Body text for article {n}, long enough to look like a short news item.
+"""
+
+
+def write_articles(content_dir: Path, count: int, author: str, category: str) -> None:
+    content_dir.mkdir(parents=True, exist_ok=True)
+    for n in range(count):
+        (content_dir / f"bench-{n}.txt").write_text(
+            ARTICLE_TEMPLATE.format(n=n, author=author, category=category), encoding='utf-8')
+
+
+def seed_rows(integrator, db_path: str, content_dir: Path) -> None:
+    """Insert the row each file would produce, so a sync has nothing to change"""
+    conn = sqlite3.connect(db_path)
+    author_id, = conn.execute("SELECT id FROM authors LIMIT 1").fetchone()
+    category_id, = conn.execute("SELECT id FROM categories LIMIT 1").fetchone()
+    # Rows newer than the files, so the mtime check does not flag them
+    modified = (datetime.datetime.now() + datetime.timedelta(hours=1)).isoformat()
+    rows = []
+    for path in sorted(content_dir.glob('*.txt')):
+        data = integrator.parse_content_file(path)
+        rows.append((data['title'], integrator.generate_slug_from_content(data), data['excerpt'],
+                     data['content'], author_id, category_id, modified))
+    conn.executemany("""INSERT INTO articles (title, slug, excerpt, content, author_id, category_id, last_modified)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)""", rows)
+    conn.commit()
+    conn.close()
+
+
+def timed_sync(integrator) -> tuple:
+    start = time.perf_counter()
+    stats = integrator.sync_with_files()
+    return time.perf_counter() - start, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Content file sync benchmark')
+    parser.add_argument('--files', type=int, default=50000, help='Synthetic article files')
+    parser.add_argument('--touch', type=int, default=500, help='Files to touch without changing')
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="infnews_sync_bench_"))
+    try:
+        db_path = str(workdir / "bench.db")
+        shutil.copy(config.get_database_path(), db_path)
+        config.set('database.path', db_path)
+        config.set('paths.content_dir', str(workdir / 'content'))
+        config.set('paths.integrated_dir', str(workdir / 'integrated'))
+        config.set('build.sync_manifest_dir', str(workdir / 'sync_manifest'))
+
+        from src.integrators.article_integrator import ArticleIntegrator
+        from src.models.author import Author
+        from src.models.category import Category
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM articles")
+        conn.commit()
+        conn.close()
+
+        integrator = ArticleIntegrator()
+        author, category = Author.find_all(limit=1)[0], Category.find_all(limit=1)[0]
+        content_dir = integrator.content_dir
+        for path in content_dir.glob('*.txt'):
+            path.unlink()
+
+        print(f"🌱 Writing {args.files} article files and their rows...")
+        write_articles(content_dir, args.files, author.name, category.slug)
+        seed_rows(integrator, db_path, content_dir)
+
+        print(f"\n{'run':34} {'seconds':>9} {'+':>4} {'~':>4} {'-':>4} {'=':>7}")
+
+        def report(label, result):
+            elapsed, stats = result
+            print(f"{label:34} {elapsed:9.3f} {stats['added']:4d} {stats['updated']:4d} "
+                  f"{stats['removed']:4d} {stats['skipped']:7d}")
+
+        report('no manifest (parse every file)', timed_sync(integrator))
+        report('manifest, nothing changed', timed_sync(integrator))
+
+        now = time.time()
+        for n in range(min(args.touch, args.files)):
+            os.utime(content_dir / f"bench-{n}.txt", (now, now))
+        report(f'manifest, {args.touch} touched', timed_sync(integrator))
+
+        edited = content_dir / f"bench-{args.files - 1}.txt"
+        edited.write_text(edited.read_text(encoding='utf-8') + "\nOne more line.\n", encoding='utf-8')
+        result = timed_sync(integrator)
+        report('manifest, 1 edited', result)
+        assert result[1]['updated'] == 1, f"expected the edited file to update, got {result[1]}"
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
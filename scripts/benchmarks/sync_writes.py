@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Sync Write Benchmark
+====================
+Rows per second of a file sync that adds every article, by transaction
+chunk size: one commit per file (the old behaviour had at least one per
+file, one per statement in fact), chunks of files, and a single
+transaction. Each run starts from a fresh database copy without manifest.
+
+Usage:
+    python3 scripts/benchmarks/sync_writes.py
+    python3 scripts/benchmarks/sync_writes.py --files 5000 --chunks 1,100,500,0
+    python3 scripts/benchmarks/sync_writes.py --synchronous FULL   # fsync on every commit
+"""
+
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.config import config
+from sync_manifest import write_articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='File sync transaction chunking benchmark')
+    parser.add_argument('--files', type=int, default=5000, help='Synthetic article files')
+    parser.add_argument('--chunks', default='1,100,500,0',
+                        help='Comma-separated chunk sizes (0 = one transaction)')
+    parser.add_argument('--synchronous', default=None,
+                        help='Override the synchronous PRAGMA of the database.pragmas profile')
+    args = parser.parse_args()
+
+    if args.synchronous:
+        config.set('database.pragmas', dict(config.get('database.pragmas', {}), synchronous=args.synchronous))
+
+    workdir = Path(tempfile.mkdtemp(prefix="infnews_sync_writes_bench_"))
+    try:
+        source_db = config.get_database_path()
+        config.set('paths.content_dir', str(workdir / 'content'))
+        config.set('paths.integrated_dir', str(workdir / 'integrated'))
+
+        print(f"\n{'chunk size':>10} {'seconds':>9} {'added':>7} {'rows':>8} {'commits':>8} {'rows/s':>9}")
+        for run, chunk_size in enumerate(int(c) for c in args.chunks.split(',')):
+            # A new database file per run; pools are keyed by path
+            db_path = str(workdir / f"bench_{run}.db")
+            shutil.copy(source_db, db_path)
+            conn = sqlite3.connect(db_path)
+            conn.execute("DELETE FROM articles")
+            conn.commit()
+            conn.close()
+            config.set('database.path', db_path)
+            config.set('build.sync_manifest_dir', str(workdir / f'sync_manifest_{run}'))
+
+            from src.integrators.article_integrator import ArticleIntegrator
+            from src.models import Article, Author, Category, TrendingTopic, Image
+            # Models cache a DatabaseManager per class
+            for model in (Article, Author, Category, TrendingTopic, Image):
+                model._db = None
+
+            integrator = ArticleIntegrator()
+            integrator.sync_chunk_size = chunk_size
+            # Pages are not what is being measured
+            integrator.update_all_listing_pages = lambda: None
+            content_dir = integrator.content_dir
+            if content_dir.exists():
+                shutil.rmtree(content_dir)
+            author, category = Author.find_all(limit=1)[0], Category.find_all(limit=1)[0]
+            write_articles(content_dir, args.files, author.name, category.slug)
+
+            start = time.perf_counter()
+            stats = integrator.sync_with_files()
+            elapsed = time.perf_counter() - start
+            writes = integrator.write_stats
+            print(f"{chunk_size or 'all':>10} {elapsed:9.2f} {stats['added']:7d} {writes['rows']:8d} "
+                  f"{writes['chunks']:8d} {writes['rows_per_second']:9.0f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
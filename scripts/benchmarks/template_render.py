@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Template Render Benchmark
+=========================
+Compares the compiled template engine against the previous regex-based
+engine (reproduced below) on templates/article.html, and checks that both
+produce the same HTML.
+
+Usage:
+    python3 scripts/benchmarks/template_render.py
+    python3 scripts/benchmarks/template_render.py --runs 5000
+"""
+
+import re
+import sys
+import html
+import time
+import timeit
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.template_engine import TemplateEngine
+
+TEMPLATE_PATH = project_root / 'templates' / 'article.html'
+
+
+class LegacyTemplateEngine:
+    """The regex engine TemplateEngine.render used before compilation"""
+
+    def render(self, template, context):
+        template = self._process_conditionals(template, context)
+        template = self._process_loops(template, context)
+        return self._process_variables(template, context)
+
+    def _process_conditionals(self, template, context):
+        pattern = r'\{\{#if\s+(\w+(?:\.\w+)*)\}\}(.*?)\{\{/if\}\}'
+        return re.sub(pattern, lambda m: m.group(2) if self._get(context, m.group(1)) else '',
+                      template, flags=re.DOTALL)
+
+    def _process_loops(self, template, context):
+        pattern = r'\{\{#each\s+(\w+(?:\.\w+)*)\}\}(.*?)\{\{/each\}\}'
+
+        def replace_loop(match):
+            items = self._get(context, match.group(1))
+            if not items or not hasattr(items, '__iter__'):
+                return ''
+            result = []
+            for item in items:
+                loop_context = context.copy()
+                loop_context['this'] = item
+                result.append(self._process_variables(match.group(2), loop_context))
+            return ''.join(result)
+
+        return re.sub(pattern, replace_loop, template, flags=re.DOTALL)
+
+    def _process_variables(self, template, context):
+        path = r'([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)'
+        template = re.sub(r'\{\{!' + path + r'\}\}',
+                          lambda m: str(self._get(context, m.group(1)) or ''), template)
+        return re.sub(r'\{\{' + path + r'\}\}',
+                      lambda m: html.escape(str(self._get(context, m.group(1)) or '')), template)
+
+    def _get(self, obj, path):
+        current = obj
+        for part in path.split('.'):
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            elif hasattr(current, part):
+                current = getattr(current, part)
+            else:
+                return None
+        return current
+
+
+def build_context() -> dict:
+    """A context shaped like ArticleTemplate.render_article builds"""
+    base_path = '../../'
+    article = {
+        'title': 'Creator Fund Expands to 40 Countries',
+        'slug': 'creator-fund-expands',
+        'excerpt': 'The fund now covers creators in 40 countries & territories.',
+        'content': '<p>' + 'Creators across the platform will see new payouts. ' * 120 + '</p>',
+        'author_name': 'Alex Rivera',
+        'author_title': 'Senior Reporter',
+        'author_bio': 'Covers the creator economy.',
+        'author_image': 'https://example.com/alex.jpg',
+        'author_location': 'Los Angeles',
+        'author_article_count': 42,
+        'category_name': 'Business',
+        'category_color': 'indigo',
+        'category_icon': '💼',
+        'image_url': 'https://example.com/hero.jpg',
+        'read_time': '6 min',
+        'publish_date': '2025-06-01',
+        'publish_date_relative': '2 days ago',
+        'is_breaking': True,
+        'tags': ['creators', 'monetization', 'youtube', 'policy'],
+        'related_articles': [
+            {'title': f'Related story {i}', 'url': f'article_related-{i}.html',
+             'author_name': 'Sam Lee', 'publish_date': '2025-05-30'}
+            for i in range(3)
+        ],
+    }
+    return {
+        'base_path': base_path,
+        'nonce': 'bm9uY2U=',
+        'article': article,
+        'meta': {'title': f"{article['title']} - Influencer News"},
+        'links': {name: f"{base_path}{name}.html" for name in
+                  ('home', 'search', 'authors', 'categories', 'trending', 'author', 'category')},
+        'stats': {'views': '12,345', 'likes': '246', 'comments': '31', 'shares': '62'},
+    }
+
+
+def time_renders(renders: list, runs: int, repeat: int = 7) -> list:
+    """
+    Best-of-repeat microseconds per render for each callable
+
+    Rounds alternate between the callables so background load affects
+    them alike.
+    """
+    best = [float('inf')] * len(renders)
+    for _ in range(repeat):
+        for i, render in enumerate(renders):
+            best[i] = min(best[i], timeit.timeit(render, number=runs))
+    return [seconds / runs * 1e6 for seconds in best]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Template engine render benchmark')
+    parser.add_argument('--runs', type=int, default=2000, help='Renders per timing round')
+    args = parser.parse_args()
+
+    template = TEMPLATE_PATH.read_text(encoding='utf-8')
+    context = build_context()
+    legacy = LegacyTemplateEngine()
+    engine = TemplateEngine()
+
+    if legacy.render(template, context) != engine.render(template, context):
+        print("❌ Compiled engine output differs from the legacy engine")
+        sys.exit(1)
+    print(f"✅ Output identical on {TEMPLATE_PATH.name} ({len(template):,} bytes)")
+
+    start = time.perf_counter()
+    TemplateEngine.compile_file(str(TEMPLATE_PATH))
+    compile_us = (time.perf_counter() - start) * 1e6
+
+    legacy_us, compiled_us = time_renders([lambda: legacy.render(template, context),
+                                           lambda: engine.render(template, context)], args.runs)
+
+    print(f"\n{'engine':22} {'µs/render':>10}")
+    print(f"{'legacy (regex passes)':22} {legacy_us:10.1f}")
+    print(f"{'compiled (cached)':22} {compiled_us:10.1f}")
+    print(f"{'one-time compile':22} {compile_us:10.1f}")
+    print(f"\n⚡ Speedup: {legacy_us / compiled_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,11 @@ import os
 import sys
 import json
 import sqlite3
+import hashlib
+import argparse
 import datetime
+import textwrap
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
@@ -19,6 +23,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 try:
     from src.database.db_manager import DatabaseManager
+    from src.utils.config import config
+    from src.utils.search_shards import ShardedSearchIndex
+    from src.utils.variant_store import VariantStore
 except ImportError as e:
     print(f"Error: Could not import DatabaseManager: {e}")
     print("Please ensure you're running from the project root directory")
@@ -35,11 +42,72 @@ class MobileResponse:
     mobile_optimized: bool = True
 
 
+class ListEndpointWriter:
+    """
+    Streams a MobileResponse list endpoint to a temp file one item at a time
+    
+    The output matches json.dump(asdict(MobileResponse(...)), indent=2)
+    byte for byte. The content hash is built as items are written and,
+    like MobileAPIGenerator.content_hash(), ignores generated_at.
+    """
+    
+    def __init__(self, file_path: Path, meta: Dict[str, Any]):
+        """
+        Open the temp file and write the response head
+        
+        Args:
+            file_path: Final endpoint path
+            meta: Response meta; 'total' is filled in when finished
+        """
+        self.file_path = file_path
+        self.tmp_file = file_path.with_suffix('.tmp')
+        self.meta = meta
+        self.count = 0
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._file = open(self.tmp_file, 'w', encoding='utf-8')
+        self._file.write('{\n  "success": true,\n  "data": [')
+    
+    def add(self, item: Dict[str, Any]) -> None:
+        """Append one item to the data list"""
+        encoded = json.dumps(item, indent=2, ensure_ascii=False)
+        self._file.write((',\n' if self.count else '\n') + textwrap.indent(encoded, '    '))
+        self._hash.update(json.dumps(item, sort_keys=True, separators=(',', ':'),
+                                     ensure_ascii=False, default=str).encode('utf-8'))
+        self._hash.update(b'\n')
+        self.count += 1
+    
+    def finish(self) -> str:
+        """Write meta and close the file; returns the content hash"""
+        meta = {'total': self.count, **self.meta}
+        self._file.write('\n  ]' if self.count else ']')
+        self._file.write(',\n  "error": null,\n  "meta": ')
+        self._file.write(json.dumps(meta, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        self._file.write(',\n  "mobile_optimized": true\n}')
+        self._file.close()
+        
+        self._hash.update(json.dumps({key: value for key, value in meta.items() if key != 'generated_at'},
+                                     sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        return self._hash.hexdigest()
+    
+    def abort(self) -> None:
+        """Close and delete the temp file"""
+        self._file.close()
+        self.tmp_file.unlink(missing_ok=True)
+
+
 class MobileAPIGenerator:
     """Generate mobile-optimized API endpoints"""
     
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, incremental: bool = False, db: Optional[DatabaseManager] = None):
+        """
+        Initialize the generator
+        
+        Args:
+            incremental: Only rewrite endpoints whose content changed
+            db: Database to read (defaults to the configured one)
+        """
+        self.db = db or DatabaseManager()
+        self.incremental = incremental
         
         # Mobile-specific configuration
         self.mobile_config = {
@@ -50,7 +118,7 @@ class MobileAPIGenerator:
                 'tablet': {'width': 768, 'height': 432},
                 'desktop': {'width': 1200, 'height': 675}
             },
-            'cache_duration': 300,  # 5 minutes
+            'cache_duration': config.get('server.api_cache_duration', 300),  # 5 minutes
             'pagination_limit': 20
         }
         
@@ -59,6 +127,16 @@ class MobileAPIGenerator:
         self.api_dir.mkdir(parents=True, exist_ok=True)
         
         print(f"📁 API directory created: {self.api_dir}")
+        
+        # Content hashes of the endpoints, published in manifest.json
+        self.manifest_file = self.api_dir / "manifest.json"
+        self.etags = self.load_etags()
+        self._generated = set()
+        self.write_stats = {'written': 0, 'unchanged': 0, 'removed': 0}
+        
+        # Hero image URLs come from the variants written to the variant store
+        self.variant_store = VariantStore(Path(config.get('paths.images_dir', 'assets/images')) / "responsive", self.db)
+        self._hero_images: Dict[int, Dict[str, str]] = {}
     
     def generate_all_endpoints(self) -> Dict[str, int]:
         """Generate all mobile-optimized API endpoints"""
@@ -69,7 +147,8 @@ class MobileAPIGenerator:
             'authors': 0,
             'categories': 0,
             'trending': 0,
-            'search': 0
+            'search': 0,
+            'search_shards': 0
         }
         
         try:
@@ -93,11 +172,18 @@ class MobileAPIGenerator:
             print("🔍 Creating mobile search endpoints...")
             stats['search'] = self.create_search_endpoints()
             
+            # Generate the sharded offline search index
+            print("🗂️ Creating sharded search index...")
+            stats['search_shards'] = self.create_search_shards()
+            
             # Create mobile manifest
             print("📋 Creating mobile API manifest...")
             self.create_api_manifest(stats)
             
             print("✅ Mobile API endpoints generated successfully!")
+            print(f"   📝 {self.write_stats['written']} written, "
+                  f"{self.write_stats['unchanged']} unchanged, "
+                  f"{self.write_stats['removed']} removed")
             
         except Exception as e:
             print(f"❌ Error generating mobile endpoints: {str(e)}")
@@ -106,9 +192,22 @@ class MobileAPIGenerator:
         return stats
     
     def create_article_endpoints(self) -> int:
-        """Create mobile-optimized article API endpoints"""
+        """
+        Create mobile-optimized article API endpoints
+        
+        Rows are streamed from the cursor: each article's detail file and
+        its articles.json entry are written as the row is read, so memory
+        stays flat however many articles there are.
+        """
         try:
-            # Get all articles from database
+            articles_detail_dir = self.api_dir / "articles"
+            articles_detail_dir.mkdir(exist_ok=True)
+            
+            list_meta = {
+                'generated_at': datetime.datetime.now().isoformat(),
+                'cache_duration': self.mobile_config['cache_duration']
+            }
+            
             with self.db.get_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute("""
@@ -119,58 +218,35 @@ class MobileAPIGenerator:
                     LEFT JOIN authors auth ON a.author_id = auth.id
                     LEFT JOIN categories cat ON a.category_id = cat.id
                     ORDER BY a.publish_date DESC
-                    LIMIT 1000
                 """)
                 
-                articles_data = [dict(row) for row in cursor.fetchall()]
+                with self.stream_list_endpoint(self.api_dir / "articles.json", list_meta) as articles_list:
+                    for row in cursor:
+                        article_data = dict(row)
+                        articles_list.add(self.optimize_article_for_mobile(article_data))
+                        
+                        mobile_article = self.optimize_article_for_mobile(article_data, include_full_content=True)
+                        
+                        article_response = MobileResponse(
+                            success=True,
+                            data=mobile_article,
+                            meta={
+                                'generated_at': datetime.datetime.now().isoformat(),
+                                'cache_duration': self.mobile_config['cache_duration']
+                            }
+                        )
+                        
+                        article_file = articles_detail_dir / f"{article_data['id']}.json"
+                        self.write_endpoint(article_file, asdict(article_response))
+            
+            self.prune_endpoints(articles_detail_dir)
             
-            if not articles_data:
+            if not articles_list.count:
                 print("⚠️ No articles found in database")
                 return 0
             
-            # Create articles list endpoint
-            mobile_articles = []
-            for article_data in articles_data:
-                mobile_article = self.optimize_article_for_mobile(article_data)
-                mobile_articles.append(mobile_article)
-            
-            # Save articles list endpoint
-            articles_response = MobileResponse(
-                success=True,
-                data=mobile_articles,
-                meta={
-                    'total': len(mobile_articles),
-                    'generated_at': datetime.datetime.now().isoformat(),
-                    'cache_duration': self.mobile_config['cache_duration']
-                }
-            )
-            
-            articles_file = self.api_dir / "articles.json"
-            with open(articles_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(articles_response), f, indent=2, ensure_ascii=False)
-            
-            # Create individual article endpoints
-            articles_detail_dir = self.api_dir / "articles"
-            articles_detail_dir.mkdir(exist_ok=True)
-            
-            for article_data in articles_data:
-                mobile_article = self.optimize_article_for_mobile(article_data, include_full_content=True)
-                
-                article_response = MobileResponse(
-                    success=True,
-                    data=mobile_article,
-                    meta={
-                        'generated_at': datetime.datetime.now().isoformat(),
-                        'cache_duration': self.mobile_config['cache_duration']
-                    }
-                )
-                
-                article_file = articles_detail_dir / f"{article_data['id']}.json"
-                with open(article_file, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(article_response), f, indent=2, ensure_ascii=False)
-            
-            print(f"   ✅ Created {len(articles_data)} article endpoints")
-            return len(articles_data)
+            print(f"   ✅ Created {articles_list.count} article endpoints")
+            return articles_list.count
             
         except Exception as e:
             print(f"   ❌ Error creating article endpoints: {str(e)}")
@@ -207,8 +283,7 @@ class MobileAPIGenerator:
             )
             
             authors_file = self.api_dir / "authors.json"
-            with open(authors_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(authors_response), f, indent=2, ensure_ascii=False)
+            self.write_endpoint(authors_file, asdict(authors_response))
             
             # Create individual author endpoints
             authors_detail_dir = self.api_dir / "authors"
@@ -227,8 +302,9 @@ class MobileAPIGenerator:
                 )
                 
                 author_file = authors_detail_dir / f"{author_data['slug']}.json"
-                with open(author_file, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(author_response), f, indent=2, ensure_ascii=False)
+                self.write_endpoint(author_file, asdict(author_response))
+            
+            self.prune_endpoints(authors_detail_dir)
             
             print(f"   ✅ Created {len(authors_data)} author endpoints")
             return len(authors_data)
@@ -268,8 +344,7 @@ class MobileAPIGenerator:
             )
             
             categories_file = self.api_dir / "categories.json"
-            with open(categories_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(categories_response), f, indent=2, ensure_ascii=False)
+            self.write_endpoint(categories_file, asdict(categories_response))
             
             # Create individual category endpoints
             categories_detail_dir = self.api_dir / "categories"
@@ -288,8 +363,9 @@ class MobileAPIGenerator:
                 )
                 
                 category_file = categories_detail_dir / f"{category_data['slug']}.json"
-                with open(category_file, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(category_response), f, indent=2, ensure_ascii=False)
+                self.write_endpoint(category_file, asdict(category_response))
+            
+            self.prune_endpoints(categories_detail_dir)
             
             print(f"   ✅ Created {len(categories_data)} category endpoints")
             return len(categories_data)
@@ -329,8 +405,7 @@ class MobileAPIGenerator:
             )
             
             trending_file = self.api_dir / "trending.json"
-            with open(trending_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(trending_response), f, indent=2, ensure_ascii=False)
+            self.write_endpoint(trending_file, asdict(trending_response))
             
             # Create individual trending endpoints
             trending_detail_dir = self.api_dir / "trending"
@@ -349,8 +424,9 @@ class MobileAPIGenerator:
                 )
                 
                 topic_file = trending_detail_dir / f"{topic_data['slug']}.json"
-                with open(topic_file, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(topic_response), f, indent=2, ensure_ascii=False)
+                self.write_endpoint(topic_file, asdict(topic_response))
+            
+            self.prune_endpoints(trending_detail_dir)
             
             print(f"   ✅ Created {len(trending_data)} trending endpoints")
             return len(trending_data)
@@ -449,8 +525,7 @@ class MobileAPIGenerator:
             )
             
             search_file = self.api_dir / "search.json"
-            with open(search_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(search_response), f, indent=2, ensure_ascii=False)
+            self.write_endpoint(search_file, asdict(search_response))
             
             total_indexed = sum(len(search_index[key]) for key in search_index)
             print(f"   ✅ Created search index with {total_indexed} items")
@@ -460,6 +535,199 @@ class MobileAPIGenerator:
             print(f"   ❌ Error creating search endpoints: {str(e)}")
             return 0
     
+    def create_search_shards(self) -> int:
+        """
+        Create the prefix-sharded inverted index used for offline search
+        
+        Documents are numbered categories, trending, authors, then
+        articles by id, so new articles append to the last bucket
+        instead of renumbering everything.
+        """
+        try:
+            index = ShardedSearchIndex(
+                prefix_length=config.get('build.search_shard_prefix', 2),
+                bucket_size=config.get('build.search_bucket_size', 500)
+            )
+            max_excerpt = self.mobile_config['max_excerpt_length']
+            
+            with self.db.get_connection() as conn:
+                conn.row_factory = sqlite3.Row
+                
+                for row in conn.execute("SELECT slug, name, description, icon FROM categories ORDER BY id"):
+                    index.add({
+                        'type': 'category',
+                        'slug': row['slug'],
+                        'name': row['name'],
+                        'icon': row['icon'],
+                        'url': f"integrated/categories/category_{row['slug']}.html"
+                    }, [(row['name'], 3), (row['description'], 1)])
+                
+                for row in conn.execute("SELECT slug, title, description FROM trending_topics ORDER BY id"):
+                    index.add({
+                        'type': 'trending',
+                        'slug': row['slug'],
+                        'title': row['title'],
+                        'description': self.truncate_text(row['description'] or '', max_excerpt),
+                        'url': f"integrated/trending/trend_{row['slug']}.html"
+                    }, [(row['title'], 3), (row['description'], 1)])
+                
+                for row in conn.execute("SELECT slug, name, title, bio FROM authors ORDER BY id"):
+                    index.add({
+                        'type': 'author',
+                        'slug': row['slug'],
+                        'name': row['name'],
+                        'bio': self.truncate_text(row['bio'] or '', max_excerpt),
+                        'url': f"integrated/authors/author_{row['slug']}.html"
+                    }, [(row['name'], 3), (row['title'], 1), (row['bio'], 1)])
+                
+                cursor = conn.execute("""
+                    SELECT a.id, a.title, a.excerpt, a.slug, a.publish_date,
+                           auth.name as author_name, cat.name as category_name,
+                           cat.icon as category_icon
+                    FROM articles a
+                    LEFT JOIN authors auth ON a.author_id = auth.id
+                    LEFT JOIN categories cat ON a.category_id = cat.id
+                    ORDER BY a.id
+                """)
+                for row in cursor:
+                    index.add({
+                        'type': 'article',
+                        'id': row['id'],
+                        'slug': row['slug'],
+                        'title': row['title'],
+                        'excerpt': self.truncate_text(row['excerpt'] or '', max_excerpt),
+                        'author_name': row['author_name'] or '',
+                        'category_name': row['category_name'] or '',
+                        'category_icon': row['category_icon'] or '',
+                        'publication_date': row['publish_date'],
+                        'url': f"integrated/articles/article_{row['slug']}.html"
+                    }, [(row['title'], 3), (row['author_name'], 2), (row['category_name'], 2),
+                        (row['excerpt'], 1)])
+            
+            search_dir = self.api_dir / "search"
+            docs_dir = search_dir / "docs"
+            docs_dir.mkdir(parents=True, exist_ok=True)
+            
+            shards = index.shards()
+            for name, shard in shards.items():
+                self.write_endpoint(search_dir / f"{name}.json", shard, compact=True)
+            for bucket in index.buckets():
+                self.write_endpoint(docs_dir / f"{bucket['bucket']}.json", bucket, compact=True)
+            
+            index_payload = index.index_payload(shards)
+            index_payload['generated_at'] = datetime.datetime.now().isoformat()
+            self.write_endpoint(search_dir / "index.json", index_payload)
+            
+            self.prune_endpoints(search_dir)
+            self.prune_endpoints(docs_dir)
+            
+            print(f"   ✅ Indexed {index_payload['doc_count']} items, "
+                  f"{index_payload['term_count']} terms in {len(shards)} shards")
+            return len(shards)
+            
+        except Exception as e:
+            print(f"   ❌ Error creating search shards: {str(e)}")
+            return 0
+    
+    def load_etags(self) -> Dict[str, str]:
+        """Endpoint hashes recorded by the previous run, plus the manifest's own"""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        etags = dict(manifest.get('etags', {}))
+        etags[self.manifest_file.name] = self.content_hash(manifest)
+        return etags
+    
+    @staticmethod
+    def content_hash(payload: Dict[str, Any]) -> str:
+        """Hash of an endpoint payload, ignoring its generated_at timestamp"""
+        content = {key: value for key, value in payload.items() if key != 'generated_at'}
+        if isinstance(content.get('meta'), dict):
+            content['meta'] = {key: value for key, value in content['meta'].items()
+                               if key != 'generated_at'}
+        encoded = json.dumps(content, sort_keys=True, separators=(',', ':'),
+                             ensure_ascii=False, default=str)
+        return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def write_endpoint(self, file_path: Path, payload: Dict[str, Any], compact: bool = False) -> bool:
+        """
+        Write an endpoint file atomically and record its hash
+        
+        In incremental mode the file is left alone (timestamp included)
+        when its content hash matches the previous run.
+        
+        Args:
+            file_path: Endpoint file under the API directory
+            payload: JSON-serializable response
+            compact: Write without indentation (large machine-read files)
+            
+        Returns:
+            True if the file was written
+        """
+        key = file_path.relative_to(self.api_dir).as_posix()
+        etag = self.content_hash(payload)
+        self._generated.add(key)
+        
+        if self.incremental and self.etags.get(key) == etag and file_path.exists():
+            self.write_stats['unchanged'] += 1
+            return False
+        
+        # Write to a temp file and rename, so readers never see a partial file
+        tmp_file = file_path.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(payload, f, separators=(',', ':'), ensure_ascii=False)
+            else:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, file_path)
+        
+        self.etags[key] = etag
+        self.write_stats['written'] += 1
+        return True
+    
+    @contextmanager
+    def stream_list_endpoint(self, file_path: Path, meta: Dict[str, Any]):
+        """
+        Stream a list endpoint item by item (see ListEndpointWriter)
+        
+        The temp file replaces the endpoint when the block exits, unless
+        incremental mode finds the content hash unchanged.
+        
+        Yields:
+            ListEndpointWriter: call add() for every item
+        """
+        writer = ListEndpointWriter(file_path, meta)
+        try:
+            yield writer
+            etag = writer.finish()
+        except BaseException:
+            writer.abort()
+            raise
+        
+        key = file_path.relative_to(self.api_dir).as_posix()
+        self._generated.add(key)
+        if self.incremental and self.etags.get(key) == etag and file_path.exists():
+            writer.tmp_file.unlink()
+            self.write_stats['unchanged'] += 1
+            return
+        os.replace(writer.tmp_file, file_path)
+        self.etags[key] = etag
+        self.write_stats['written'] += 1
+    
+    def prune_endpoints(self, directory: Path) -> int:
+        """Delete endpoint files in a detail directory that were not generated this run"""
+        removed = 0
+        for file_path in directory.glob('*.json'):
+            key = file_path.relative_to(self.api_dir).as_posix()
+            if key not in self._generated:
+                file_path.unlink()
+                self.etags.pop(key, None)
+                removed += 1
+        self.write_stats['removed'] += removed
+        return removed
+    
     def create_api_manifest(self, stats: Dict[str, int]):
         """Create API manifest with endpoint information"""
         try:
@@ -491,17 +759,23 @@ class MobileAPIGenerator:
                     },
                     'search': {
                         'index': '/api/mobile/search.json',
-                        'count': stats['search']
+                        'count': stats['search'],
+                        'sharded_index': '/api/mobile/search/index.json',
+                        'shard': '/api/mobile/search/{shard}.json',
+                        'docs': '/api/mobile/search/docs/{bucket}.json',
+                        'shard_count': stats['search_shards']
                     }
                 },
-                'mobile_config': self.mobile_config
+                'mobile_config': self.mobile_config,
+                # Content hash per endpoint, usable as its ETag
+                'etags': {key: self.etags[key] for key in sorted(self.etags)
+                          if key != self.manifest_file.name and (self.api_dir / key).exists()}
             }
             
-            manifest_file = self.api_dir / "manifest.json"
-            with open(manifest_file, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
-            
-            print(f"   ✅ Created API manifest: {manifest_file}")
+            if self.write_endpoint(self.manifest_file, manifest):
+                print(f"   ✅ Created API manifest: {self.manifest_file}")
+            else:
+                print(f"   ✅ API manifest unchanged: {self.manifest_file}")
                 
         except Exception as e:
             print(f"   ❌ Error creating API manifest: {str(e)}")
@@ -526,27 +800,14 @@ class MobileAPIGenerator:
                     'slug': article_data.get('category_slug') or ''
                 },
                 'publication_date': article_data.get('publish_date'),
-                'read_time': article_data.get('read_time') or 5,
+                'read_time': article_data.get('read_time_minutes') or 5,
+                'word_count': article_data.get('word_count') or 0,
                 'views': article_data.get('view_count') or 0,
                 'mobile_optimized': True
             }
             
             # Add mobile image information
-            mobile_hero_image_id = article_data.get('mobile_hero_image_id')
-            if mobile_hero_image_id:
-                mobile_article['image'] = {
-                    'mobile': f'/assets/images/responsive/img_{mobile_hero_image_id}_mobile_320x180.webp',
-                    'tablet': f'/assets/images/responsive/img_{mobile_hero_image_id}_tablet_768x432.webp',
-                    'desktop': f'/assets/images/responsive/img_{mobile_hero_image_id}_desktop_1200x675.webp',
-                    'fallback': f'/assets/images/responsive/img_{mobile_hero_image_id}_mobile_320x180.jpeg'
-                }
-            else:
-                mobile_article['image'] = {
-                    'mobile': '/assets/placeholders/article_placeholder.svg',
-                    'tablet': '/assets/placeholders/article_placeholder.svg',
-                    'desktop': '/assets/placeholders/article_placeholder.svg',
-                    'fallback': '/assets/placeholders/article_placeholder.svg'
-                }
+            mobile_article['image'] = self.hero_image_urls(article_data.get('mobile_hero_image_id'))
             
             # Include full content if requested
             if include_full_content:
@@ -560,6 +821,32 @@ class MobileAPIGenerator:
             print(f"   ⚠️ Error optimizing article {article_data.get('id', 'unknown')}: {str(e)}")
             return {}
     
+    def hero_image_urls(self, image_id: Optional[int]) -> Dict[str, str]:
+        """
+        Mobile, tablet, desktop and fallback URLs of an article's hero image
+        
+        Each is the smallest written variant of that kind (WebP per device,
+        mobile JPEG as the fallback); kinds with no variant, or articles
+        without a hero image, get the placeholder.
+        """
+        placeholder = '/assets/placeholders/article_placeholder.svg'
+        if not image_id:
+            return dict.fromkeys(('mobile', 'tablet', 'desktop', 'fallback'), placeholder)
+        
+        if image_id not in self._hero_images:
+            files = self.variant_store.smallest_variants(image_id)
+            kinds = {
+                'mobile': ('mobile', 'webp'),
+                'tablet': ('tablet', 'webp'),
+                'desktop': ('desktop', 'webp'),
+                'fallback': ('mobile', 'jpeg')
+            }
+            self._hero_images[image_id] = {
+                name: f'/assets/images/responsive/{files[kind]}' if kind in files else placeholder
+                for name, kind in kinds.items()
+            }
+        return dict(self._hero_images[image_id])
+    
     def optimize_author_for_mobile(self, author_data: Dict[str, Any], include_articles: bool = False) -> Dict[str, Any]:
         """Optimize author data for mobile consumption"""
         try:
@@ -738,12 +1025,17 @@ class MobileAPIGenerator:
 
 def main():
     """Main function for generating mobile API endpoints"""
+    parser = argparse.ArgumentParser(description='Generate mobile API endpoints')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only rewrite endpoints whose content changed')
+    args = parser.parse_args()
+    
     print("🚀 Mobile API Generator for Influencer News")
     print("=" * 50)
     
     try:
         # Initialize mobile API generator
-        generator = MobileAPIGenerator()
+        generator = MobileAPIGenerator(incremental=args.incremental)
         
         # Generate all endpoints
         stats = generator.generate_all_endpoints()
@@ -754,7 +1046,7 @@ def main():
         print(f"👥 Authors: {stats['authors']} endpoints")
         print(f"📂 Categories: {stats['categories']} endpoints")
         print(f"🔥 Trending: {stats['trending']} endpoints")
-        print(f"🔍 Search: {stats['search']} endpoints")
+        print(f"🔍 Search: {stats['search']} endpoints, {stats['search_shards']} index shards")
         
         # Show additional stats
         mobile_stats = generator.get_stats()
@@ -2,31 +2,122 @@
 """
 PWA API Server for Influencer News
 Provides all necessary API endpoints for Progressive Web App functionality
+
+Requests are served by a bounded pool of worker threads over HTTP/1.1
+keep-alive connections. All workers share one database connection pool
+and search backend.
 """
 
 import json
 import sys
 import os
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer, ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import datetime
 from pathlib import Path
 
-# Add src to path
+# Add project root and scripts to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.database.db_manager import DatabaseManager
+from src.database.pagination import encode_cursor, check_limit, MAX_PAGE_SIZE
 from src.models.article import Article
 from src.models.author import Author
 from src.models.category import Category
 from src.models.trending import TrendingTopic
+from src.utils.config import config
+from src.utils.response_cache import ResponseCache, CachedResponse
+from src.utils.json_response import encode_json, is_pretty, negotiate_encoding, compress
+from search_backend import SearchBackend
+
+
+def create_response_cache(db: DatabaseManager):
+    """Response cache for read-only endpoints, or None when caching is disabled"""
+    if not config.get('performance.enable_caching', True):
+        return None
+    return ResponseCache(db.db_path, max_entries=config.get('server.api_cache_entries', 256))
+
+
+class PWAAPIServer(ThreadingHTTPServer):
+    """
+    HTTP server that hands connections to a bounded pool of worker threads
+    
+    A keep-alive connection holds its worker until the client goes idle
+    or disconnects. While connections are queued for a free worker,
+    handlers close their connection after the current response so the
+    queue keeps moving.
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, server_address, handler_class, workers: int = 32,
+                 backlog: int = 256):
+        self.request_queue_size = backlog
+        super().__init__(server_address, handler_class)
+        self.workers = max(1, int(workers))
+        self.executor = ThreadPoolExecutor(max_workers=self.workers,
+                                           thread_name_prefix='pwa-api')
+        self._queued = 0
+        self._queued_lock = threading.Lock()
+        
+        # Shared by every request
+        self.db = DatabaseManager()
+        self.search_backend = SearchBackend(self.db)
+        self.response_cache = create_response_cache(self.db)
+    
+    def process_request(self, request, client_address):
+        """Queue the connection for a worker thread instead of starting a new thread"""
+        with self._queued_lock:
+            self._queued += 1
+        self.executor.submit(self._process_queued, request, client_address)
+    
+    def _process_queued(self, request, client_address):
+        with self._queued_lock:
+            self._queued -= 1
+        self.process_request_thread(request, client_address)
+    
+    def is_saturated(self) -> bool:
+        """Whether connections are waiting for a free worker"""
+        return self._queued > 0
+    
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
 
 class PWAAPIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for PWA API endpoints"""
     
-    def __init__(self, *args, **kwargs):
-        self.db = DatabaseManager()
-        super().__init__(*args, **kwargs)
+    protocol_version = 'HTTP/1.1'
+    
+    # Headers and body go out in separate writes; don't let Nagle hold
+    # the body back on keep-alive connections
+    disable_nagle_algorithm = True
+    
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = 15
+    
+    # Set by main(); request logging costs a stderr write per request
+    quiet = False
+    
+    # Read-only endpoints served from the response cache
+    CACHED_PATHS = ('/api/articles', '/api/categories', '/api/trending')
+    CACHED_PREFIXES = ('/api/authors/',)
+    
+    # Seconds clients may reuse a cached response (matches the mobile API)
+    cache_max_age = 300
+    
+    # Indented JSON for the current request (?pretty=1)
+    _pretty = False
+    
+    @property
+    def db(self) -> DatabaseManager:
+        """Database manager shared by all requests"""
+        return self.server.db
     
     def do_GET(self):
         """Handle GET requests"""
@@ -34,6 +125,10 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
             parsed_url = urlparse(self.path)
             path = parsed_url.path
             query_params = parse_qs(parsed_url.query)
+            self._pretty = is_pretty(query_params)
+            
+            if self.serve_from_cache(path, parsed_url.query):
+                return
             
             # Route requests to appropriate handlers
             if path == '/api/search':
@@ -72,10 +167,13 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
         try:
             parsed_url = urlparse(self.path)
             path = parsed_url.path
+            self._pretty = False
             
             if path == '/api/analytics':
                 self.handle_analytics_post()
             else:
+                # The request body was not read, so the connection can't be reused
+                self.close_connection = True
                 self.send_error_response(404, "Endpoint not found")
                 
         except Exception as e:
@@ -87,53 +185,87 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
+        self.send_connection_header()
         self.end_headers()
     
+    def parse_limit(self, query_params, default=20):
+        """Read ?limit=, sending a 400 and returning None if it is not a valid page size"""
+        try:
+            return check_limit(int(query_params.get('limit', [default])[0]))
+        except ValueError:
+            self.send_error_response(400, f"Page limit must be between 1 and {MAX_PAGE_SIZE}")
+            return None
+    
+    def parse_offset(self, query_params):
+        """Read ?offset=, sending a 400 and returning None if it is not a non-negative integer"""
+        try:
+            offset = int(query_params.get('offset', [0])[0])
+        except ValueError:
+            offset = -1
+        if offset < 0:
+            self.send_error_response(400, "Page offset must be a non-negative integer")
+            return None
+        return offset
+    
     def handle_search(self, query_params):
         """Handle search API requests"""
         query = query_params.get('q', [''])[0]
-        limit = int(query_params.get('limit', [20])[0])
-        offset = int(query_params.get('offset', [0])[0])
+        limit = self.parse_limit(query_params)
+        if limit is None:
+            return
+        offset = self.parse_offset(query_params)
+        if offset is None:
+            return
         
-        # Import search backend
-        search_script_dir = os.path.dirname(__file__)
-        if search_script_dir not in sys.path:
-            sys.path.insert(0, search_script_dir)
-        from search_backend import SearchBackend
+        cursor = query_params.get('cursor', [None])[0]
+        facets = query_params.get('facets', ['1'])[0] not in ('0', 'false', 'no')
         
-        search_backend = SearchBackend()
-        results = search_backend.search_all(query, limit, offset)
+        results = self.server.search_backend.search_all(query, limit, offset, cursor=cursor,
+                                                        facets=facets)
         
         self.send_json_response(results)
     
     def handle_articles(self, query_params):
-        """Handle articles list API"""
-        limit = int(query_params.get('limit', [20])[0])
-        offset = int(query_params.get('offset', [0])[0])
-        category = query_params.get('category', [None])[0]
+        """
+        Handle articles list API
         
-        # Build query
-        query = """
-            SELECT 
-                a.id, a.title, a.slug, a.excerpt, a.views, a.likes,
-                a.read_time_minutes, a.publish_date, a.image_url,
-                au.name as author_name, au.slug as author_slug,
-                c.name as category_name, c.slug as category_slug,
-                c.color as category_color, c.icon as category_icon
-            FROM articles a
-            JOIN authors au ON a.author_id = au.id
-            JOIN categories c ON a.category_id = c.id
+        Pages follow ``next_cursor`` (?cursor=...). ?offset= is still
+        accepted for old clients but gets slower the deeper it goes.
         """
+        limit = self.parse_limit(query_params)
+        if limit is None:
+            return
+        cursor = query_params.get('cursor', [None])[0]
+        offset = None
+        if 'offset' in query_params:
+            offset = self.parse_offset(query_params)
+            if offset is None:
+                return
+        category = query_params.get('category', [None])[0]
         
-        params = []
+        category_id = None
         if category:
-            query += " AND c.slug = ?"
-            params.append(category)
-        
-        query += " ORDER BY a.publish_date DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-        
-        articles = self.db.execute_query(query, params)
+            category_obj = Category.find_by_slug(category)
+            if not category_obj:
+                self.send_error_response(404, "Category not found")
+                return
+            category_id = category_obj.id
+        
+        if offset is not None and not cursor:
+            articles = self.db.get_articles(category_id=category_id, limit=limit, offset=offset)
+            has_more = len(articles) == limit
+            next_cursor = (encode_cursor([articles[-1]['publish_date'] or '', articles[-1]['id']])
+                           if has_more else None)
+        else:
+            try:
+                page = self.db.get_articles_page(category_id=category_id, limit=limit, cursor=cursor)
+            except ValueError as e:
+                self.send_error_response(400, str(e))
+                return
+            articles = page['items']
+            has_more = page['has_more']
+            next_cursor = page['next_cursor']
         
         # Format articles for API
         formatted_articles = []
@@ -153,6 +285,7 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
                 'views': article['views'] or 0,
                 'likes': article['likes'] or 0,
                 'read_time_minutes': article['read_time_minutes'],
+                'word_count': article.get('word_count'),
                 'image_url': article['image_url'] or 'assets/images/default-article.jpg',
                 'url': f"integrated/articles/article_{article['slug']}.html"
             })
@@ -162,9 +295,9 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
             'articles': formatted_articles,
             'pagination': {
                 'limit': limit,
-                'offset': offset,
                 'total': len(formatted_articles),
-                'has_more': len(formatted_articles) == limit
+                'has_more': has_more,
+                'next_cursor': next_cursor
             },
             'timestamp': datetime.datetime.now().isoformat()
         }
@@ -220,6 +353,7 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
                     'views': article_data['views'] or 0,
                     'likes': article_data['likes'] or 0,
                     'read_time': article_data['read_time_minutes'],
+                    'word_count': article_data.get('word_count'),
                     'image_url': article_data['image_url'] or 'assets/images/default-article.jpg'
                 },
                 'timestamp': datetime.datetime.now().isoformat()
@@ -231,11 +365,30 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
             self.send_error_response(400, "Invalid article ID")
     
     def handle_authors(self, query_params):
-        """Handle authors list API"""
-        limit = int(query_params.get('limit', [20])[0])
-        offset = int(query_params.get('offset', [0])[0])
+        """Handle authors list API (pages follow ``next_cursor``; ?offset= still accepted)"""
+        limit = self.parse_limit(query_params)
+        if limit is None:
+            return
+        cursor = query_params.get('cursor', [None])[0]
+        offset = None
+        if 'offset' in query_params:
+            offset = self.parse_offset(query_params)
+            if offset is None:
+                return
         
-        authors = Author.find_all(limit=limit + offset)[offset:]
+        if offset is not None and not cursor:
+            authors = Author.find_all(limit=limit, offset=offset)
+            has_more = len(authors) == limit
+            next_cursor = encode_cursor([authors[-1].name, authors[-1].id]) if has_more else None
+        else:
+            try:
+                page = Author.find_page(limit=limit, cursor=cursor)
+            except ValueError as e:
+                self.send_error_response(400, str(e))
+                return
+            authors = page['items']
+            has_more = page['has_more']
+            next_cursor = page['next_cursor']
         
         formatted_authors = []
         for author in authors:
@@ -254,8 +407,9 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
             'authors': formatted_authors,
             'pagination': {
                 'limit': limit,
-                'offset': offset,
-                'total': len(formatted_authors)
+                'total': len(formatted_authors),
+                'has_more': has_more,
+                'next_cursor': next_cursor
             },
             'timestamp': datetime.datetime.now().isoformat()
         }
@@ -444,9 +598,9 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
             'description': 'Progressive Web App API for Influencer News',
             'endpoints': {
                 'search': '/api/search?q={query}&limit={limit}&offset={offset}',
-                'articles': '/api/articles?limit={limit}&offset={offset}&category={category}',
+                'articles': '/api/articles?limit={limit}&cursor={next_cursor}&category={category}',
                 'article_detail': '/api/articles/{id}',
-                'authors': '/api/authors?limit={limit}&offset={offset}',
+                'authors': '/api/authors?limit={limit}&cursor={next_cursor}',
                 'author_detail': '/api/authors/{slug}',
                 'categories': '/api/categories',
                 'category_detail': '/api/categories/{slug}',
@@ -475,41 +629,161 @@ class PWAAPIHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error_response(503, f"Health check failed: {str(e)}")
     
+    def send_connection_header(self):
+        """Tell the client whether the connection stays open after this response"""
+        saturated = getattr(self.server, 'is_saturated', None)
+        if saturated is not None and saturated():
+            self.close_connection = True
+        if self.request_version == 'HTTP/1.1' and self.protocol_version == 'HTTP/1.1':
+            self.send_header('Connection', 'close' if self.close_connection else 'keep-alive')
+    
+    def serve_from_cache(self, path: str, query: str) -> bool:
+        """
+        Answer a cacheable GET from the response cache
+        
+        On a miss the cache key is remembered, and send_json_response
+        caches the response the handler builds.
+        
+        Returns:
+            True if the response was sent
+        """
+        self._cache_key = None
+        cache = getattr(self.server, 'response_cache', None)
+        if cache is None:
+            return False
+        if path not in self.CACHED_PATHS and not path.startswith(self.CACHED_PREFIXES):
+            return False
+        
+        key = cache.make_key(path, query)
+        entry = cache.get(key)
+        if entry is None:
+            self._cache_key = key
+            self._cache_version = cache.data_version()
+            return False
+        
+        self.send_cached_response(entry)
+        return True
+    
+    def send_cached_response(self, entry: CachedResponse):
+        """Send a cached body, or 304 Not Modified if the client already has it"""
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'), len(entry.body))
+        body, etag = entry.encoded(encoding)
+        not_modified = ResponseCache.etag_matches(self.headers.get('If-None-Match'), etag)
+        
+        self.send_response(304 if not_modified else 200)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', f'public, max-age={self.cache_max_age}')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if not not_modified:
+            self.send_header('Content-Type', 'application/json')
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_connection_header()
+        self.end_headers()
+        
+        if not not_modified:
+            self.wfile.write(body)
+    
     def send_json_response(self, data):
-        """Send JSON response with CORS headers"""
+        """Send JSON response with CORS headers, compressed when the client allows it"""
+        json_data = encode_json(data, pretty=self._pretty)
+        
+        if getattr(self, '_cache_key', None):
+            entry = self.server.response_cache.put(self._cache_key, json_data, self._cache_version)
+            self._cache_key = None
+            self.send_cached_response(entry)
+            return
+        
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'), len(json_data))
+        body = compress(json_data, encoding)
+        
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_connection_header()
         self.end_headers()
         
-        json_data = json.dumps(data, indent=2, ensure_ascii=False)
-        self.wfile.write(json_data.encode('utf-8'))
+        self.wfile.write(body)
     
     def send_error_response(self, code, message):
         """Send error response"""
-        self.send_response(code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        
         error_data = {
             'success': False,
             'error': message,
             'timestamp': datetime.datetime.now().isoformat()
         }
+        json_data = encode_json(error_data, pretty=self._pretty)
+        
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(json_data)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_connection_header()
+        self.end_headers()
         
-        json_data = json.dumps(error_data, indent=2)
-        self.wfile.write(json_data.encode('utf-8'))
+        self.wfile.write(json_data)
+    
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class SingleThreadedAPIServer(HTTPServer):
+    """The original one-request-at-a-time server, kept for comparison"""
+    
+    def __init__(self, server_address, handler_class):
+        super().__init__(server_address, handler_class)
+        self.db = DatabaseManager()
+        self.search_backend = SearchBackend(self.db)
+        self.response_cache = create_response_cache(self.db)
+
+
+class HTTP10APIHandler(PWAAPIHandler):
+    """One request per connection; a single-threaded server can't hold keep-alives"""
+    
+    protocol_version = 'HTTP/1.0'
+
 
 def main():
     """Main function to start the PWA API server"""
-    port = int(os.environ.get('PORT', 8080))
+    parser = argparse.ArgumentParser(description='PWA API Server')
+    parser.add_argument('--host', default='localhost', help='Interface to bind (default: localhost)')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8080)),
+                        help='Port to listen on (default: $PORT or 8080)')
+    parser.add_argument('--workers', type=int, default=config.get('server.api_workers', 32),
+                        help='Worker threads (default: server.api_workers)')
+    parser.add_argument('--single-threaded', action='store_true',
+                        help='Serve one request at a time without keep-alive (old behaviour)')
+    parser.add_argument('--quiet', action='store_true', help='Do not log every request')
+    args = parser.parse_args()
+    
+    # Worker threads borrow from one bounded connection pool; this must be
+    # set before any DatabaseManager (including the models') is created
+    config.set('database.pool.mode', 'shared')
+    PWAAPIHandler.timeout = config.get('server.keep_alive_timeout', 15)
+    PWAAPIHandler.cache_max_age = config.get('server.api_cache_duration', 300)
+    PWAAPIHandler.quiet = args.quiet
     
-    server = HTTPServer(('localhost', port), PWAAPIHandler)
+    port = args.port
+    if args.single_threaded:
+        server = SingleThreadedAPIServer((args.host, port), HTTP10APIHandler)
+        mode = "single-threaded"
+    else:
+        server = PWAAPIServer((args.host, port), PWAAPIHandler, workers=args.workers,
+                              backlog=config.get('server.api_backlog', 256))
+        mode = f"{server.workers} worker threads, keep-alive"
     
-    print(f"PWA API Server starting on http://localhost:{port}")
+    print(f"PWA API Server starting on http://{args.host}:{port} ({mode})")
     print("Available endpoints:")
     print("  GET  /api/search?q={query}")
     print("  GET  /api/articles")
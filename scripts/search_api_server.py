@@ -4,7 +4,6 @@ Simple HTTP API Server for Search Functionality
 Provides a REST endpoint for the search backend
 """
 
-import json
 import sys
 import os
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -17,6 +16,7 @@ sys.path.insert(0, os.path.join(project_root, 'src'))
 sys.path.insert(0, os.path.dirname(__file__))
 
 from search_backend import SearchBackend
+from utils.json_response import encode_json, is_pretty, negotiate_encoding, compress
 
 # Import configuration
 try:
@@ -38,13 +38,6 @@ class SearchAPIHandler(BaseHTTPRequestHandler):
         """Handle GET requests"""
         parsed_path = urlparse(self.path)
         
-        # CORS headers for development
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        
         if parsed_path.path == '/api/search':
             self.handle_search(parsed_path)
         elif parsed_path.path == '/api/suggestions':
@@ -52,6 +45,25 @@ class SearchAPIHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404, 'Endpoint not found')
     
+    def send_json(self, data, query_params):
+        """Send compact (or ?pretty=1) JSON, compressed when the client allows it"""
+        body = encode_json(data, pretty=is_pretty(query_params))
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'), len(body))
+        body = compress(body, encoding)
+        
+        # CORS headers for development
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
+        self.wfile.write(body)
+    
     def do_OPTIONS(self):
         """Handle preflight CORS requests"""
         self.send_response(200)
@@ -69,14 +81,15 @@ class SearchAPIHandler(BaseHTTPRequestHandler):
         default_limit = config.get('limits.search_results_per_page', 20) if config else 20
         limit = int(query_params.get('limit', [str(default_limit)])[0])
         offset = int(query_params.get('offset', ['0'])[0])
+        cursor = query_params.get('cursor', [None])[0]
+        facets = query_params.get('facets', ['1'])[0] not in ('0', 'false', 'no')
         
         # Perform search
         search_backend = SearchBackend()
-        results = search_backend.search_all(query, limit, offset)
+        results = search_backend.search_all(query, limit, offset, cursor=cursor, facets=facets)
         
         # Send response
-        self.end_headers()
-        self.wfile.write(json.dumps(results, indent=2).encode())
+        self.send_json(results, query_params)
     
     def handle_suggestions(self, parsed_path):
         """Handle suggestions endpoint"""
@@ -91,11 +104,10 @@ class SearchAPIHandler(BaseHTTPRequestHandler):
         suggestions = search_backend.get_suggestions(query, limit)
         
         # Send response
-        self.end_headers()
-        self.wfile.write(json.dumps({
+        self.send_json({
             'query': query,
             'suggestions': suggestions
-        }, indent=2).encode())
+        }, query_params)
     
     def log_message(self, format, *args):
         """Override to use logger instead of stderr"""
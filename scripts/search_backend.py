@@ -10,26 +10,42 @@ import sys
 import os
 from typing import List, Dict, Any, Optional
 
-# Add src to path  
+# Add src to path (project root too, for the src.* fallback imports)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from database.db_manager import DatabaseManager
+from database.search_index import SearchIndex
+from database.pagination import decode_cursor, build_page, check_limit
 
 try:
     from utils.config import config
-    from utils.trusted_security import trusted_validator
- except ImportError:
+    from utils.security_middleware import input_validator
+    HAS_SECURITY = True
+except ImportError:
     config = None
-    trusted_validator = None
+    input_validator = None
+    HAS_SECURITY = False
 
 class SearchBackend:
-    """Unified search backend using direct database queries"""
+    """Unified search backend using the FTS5 search index"""
     
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        self.db = db or DatabaseManager()
+        self.index = SearchIndex(self.db)
+        self.index.ensure()
     
-    def search_all(self, query: str, limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
-        """Search across all content types with input validation"""
+    def search_all(self, query: str, limit: Optional[int] = None, offset: int = 0,
+                   cursor: Optional[str] = None, facets: bool = True) -> Dict[str, Any]:
+        """
+        Search across all content types with input validation
+        
+        Articles page by ``cursor`` (the previous response's ``next_cursor``)
+        when one is given, otherwise by ``offset``. With ``facets``,
+        ``total_results`` and ``totals`` are real hit counts and
+        ``facets`` holds category/author counts; without, they only
+        count the returned page.
+        """
         # Use config default if limit not specified
         if limit is None:
             try:
@@ -43,13 +59,23 @@ class SearchBackend:
             'categories': [],
             'trending': [],
             'total_results': 0,
-            'page': offset // limit + 1,
+            'page': 1,
             'per_page': limit,
-            'has_more': False
+            'has_more': False,
+            'next_cursor': None,
+            'totals': {},
+            'facets': {}
         }
         
-        # Validate and sanitize input
-        if HAS_SECURITY:
+        try:
+            check_limit(limit)
+        except ValueError as e:
+            results['error'] = str(e)
+            return results
+        results['page'] = offset // limit + 1
+        
+        # Validate and sanitize input (an empty query lists latest articles)
+        if HAS_SECURITY and query and query.strip():
             try:
                 # Validate search query
                 query = input_validator.validate_search_query(query)
@@ -69,22 +95,17 @@ class SearchBackend:
         
         # Handle empty query - return all articles for homepage pagination
         if not query or len(query.strip()) == 0:
-            # Get all published articles for homepage
-            article_query = """
-            SELECT 
-                a.id, a.title, a.slug, a.excerpt, a.views, a.likes, 
-                a.read_time_minutes, a.publish_date, a.image_url,
-                au.name as author_name, au.slug as author_slug,
-                c.name as category_name, c.slug as category_slug,
-                c.color as category_color, c.icon as category_icon
-            FROM articles a
-            JOIN authors au ON a.author_id = au.id
-            JOIN categories c ON a.category_id = c.id
-            ORDER BY a.publish_date DESC
-            LIMIT ? OFFSET ?
-            """
-            
-            article_results = self.db.execute_query(article_query, (limit, offset))
+            # Get all published articles for homepage, newest first
+            if cursor or not offset:
+                try:
+                    page = self.db.get_articles_page(limit=limit, cursor=cursor)
+                except ValueError as e:
+                    results['error'] = str(e)
+                    return results
+                article_results = page['items']
+                results['next_cursor'] = page['next_cursor']
+            else:
+                article_results = self.db.get_articles(limit=limit, offset=offset)
             
             for article_data in article_results:
                 results['articles'].append({
@@ -101,118 +122,120 @@ class SearchBackend:
                 })
             
             results['total_results'] = len(results['articles'])
-            results['has_more'] = len(results['articles']) == limit
+            results['has_more'] = (results['next_cursor'] is not None if cursor or not offset
+                                   else len(results['articles']) == limit)
+            if facets:
+                self._add_facets(results, '')
+                results['total_results'] = results['totals']['articles']
+                if offset and not cursor:
+                    results['has_more'] = offset + len(results['articles']) < results['total_results']
             return results
         
         # Original behavior for search queries
         if len(query.strip()) < 2:
             return results
         
-        search_pattern = f"%{query}%"
-        
-        # Search articles
-        article_query = """
-        SELECT 
-            a.id, a.title, a.slug, a.excerpt, a.views, a.likes, 
-            a.read_time_minutes, a.publish_date, a.image_url,
-            au.name as author_name, au.slug as author_slug,
-            c.name as category_name, c.slug as category_slug,
-            c.color as category_color, c.icon as category_icon
-        FROM articles a
-        JOIN authors au ON a.author_id = au.id
-        JOIN categories c ON a.category_id = c.id
-        WHERE (a.title LIKE ? OR a.excerpt LIKE ? OR a.content LIKE ?)
-        ORDER BY a.publish_date DESC
-        LIMIT ? OFFSET ?
-        """
-        
-        article_results = self.db.execute_query(
-            article_query, 
-            (search_pattern, search_pattern, search_pattern, limit, offset)
+        # Search articles (bm25-ranked, one extra row to detect a next page)
+        try:
+            after = decode_cursor(cursor, 2) if cursor else None
+        except ValueError as e:
+            results['error'] = str(e)
+            return results
+        article_results = self.index.search(
+            'articles', query,
+            select="""s.id, s.title, s.slug, s.excerpt, s.views, s.publish_date,
+                      au.name AS author_name, c.name AS category_name,
+                      c.icon AS category_icon""",
+            joins="""JOIN authors au ON s.author_id = au.id
+                     JOIN categories c ON s.category_id = c.id""",
+            limit=limit + 1, offset=0 if cursor else offset, after=after
         )
+        page = build_page(article_results, limit, ('score', 'id'))
+        article_results = page['items']
+        results['has_more'] = page['has_more']
+        results['next_cursor'] = page['next_cursor']
         
         for article_data in article_results:
             results['articles'].append({
                 'id': article_data['id'],
                 'title': article_data['title'],
+                'highlighted_title': article_data['highlighted_title'],
                 'excerpt': article_data['excerpt'] or 'No excerpt available',
+                'snippet': article_data['snippet'],
                 'author_name': article_data['author_name'],
                 'category_name': article_data['category_name'],
                 'category_icon': article_data['category_icon'],
                 'publish_date': article_data['publish_date'],
                 'url': f"integrated/articles/article_{article_data['slug']}.html",
                 'type': 'article',
+                'score': article_data['score'],
                 'views': article_data['views'] or 0
             })
         
+        # Other content types get a quarter of the page each
+        secondary_limit = max(1, limit // 4)
+        
         # Search authors
-        author_query = """
-        SELECT id, name, slug, bio, expertise, article_count
-        FROM authors 
-        WHERE name LIKE ? OR bio LIKE ? OR expertise LIKE ?
-        LIMIT ?
-        """
-        author_results = self.db.execute_query(
-            author_query, 
-            (search_pattern, search_pattern, search_pattern, limit//4)
+        author_results = self.index.search(
+            'authors', query,
+            select="s.id, s.name, s.slug, s.bio, s.expertise, s.article_count",
+            limit=secondary_limit
         )
         
         for author_data in author_results:
             results['authors'].append({
                 'id': author_data['id'],
                 'name': author_data['name'],
+                'highlighted_title': author_data['highlighted_title'],
                 'bio': author_data['bio'] or '',
+                'snippet': author_data['snippet'],
                 'expertise': author_data['expertise'] or '',
                 'article_count': author_data['article_count'] or 0,
                 'url': f"integrated/authors/author_{author_data['slug']}.html",
-                'type': 'author'
+                'type': 'author',
+                'score': author_data['score']
             })
         
         # Search categories
-        category_query = """
-        SELECT id, name, slug, description, icon, article_count
-        FROM categories 
-        WHERE name LIKE ? OR description LIKE ?
-        LIMIT ?
-        """
-        category_results = self.db.execute_query(
-            category_query, 
-            (search_pattern, search_pattern, limit//4)
+        category_results = self.index.search(
+            'categories', query,
+            select="s.id, s.name, s.slug, s.description, s.icon, s.article_count",
+            limit=secondary_limit
         )
         
         for category_data in category_results:
             results['categories'].append({
                 'id': category_data['id'],
                 'name': category_data['name'],
+                'highlighted_title': category_data['highlighted_title'],
                 'description': category_data['description'] or '',
+                'snippet': category_data['snippet'],
                 'icon': category_data['icon'] or '📁',
                 'article_count': category_data['article_count'] or 0,
                 'url': f"integrated/categories/category_{category_data['slug']}.html",
-                'type': 'category'
+                'type': 'category',
+                'score': category_data['score']
             })
         
         # Search trending topics
-        trending_query = """
-        SELECT id, title, slug, description, heat_score, article_count
-        FROM trending_topics 
-        WHERE title LIKE ? OR description LIKE ?
-        ORDER BY heat_score DESC
-        LIMIT ?
-        """
-        trending_results = self.db.execute_query(
-            trending_query, 
-            (search_pattern, search_pattern, limit//4)
+        trending_results = self.index.search(
+            'trending', query,
+            select="s.id, s.title, s.slug, s.description, s.heat_score, s.article_count",
+            limit=secondary_limit
         )
         
         for trending_data in trending_results:
             results['trending'].append({
                 'id': trending_data['id'],
                 'title': trending_data['title'],
+                'highlighted_title': trending_data['highlighted_title'],
                 'description': trending_data['description'] or '',
+                'snippet': trending_data['snippet'],
                 'heat_score': trending_data['heat_score'] or 0,
                 'article_count': trending_data['article_count'] or 0,
                 'url': f"integrated/trending/trend_{trending_data['slug']}.html",
-                'type': 'trending'
+                'type': 'trending',
+                'score': trending_data['score']
             })
         
         # Calculate total results
@@ -222,30 +245,29 @@ class SearchBackend:
             len(results['categories']) + 
             len(results['trending'])
         )
+        if facets:
+            self._add_facets(results, query)
+            results['total_results'] = sum(results['totals'].values())
         
         return results
     
+    def _add_facets(self, results: Dict[str, Any], query: str) -> None:
+        """Fill in real hit counts per content type and category/author facets"""
+        try:
+            counts = self.index.facets(query)
+        except Exception as e:
+            # Counts are an extra; keep the page if they fail
+            print(f"Warning: Could not compute search facets: {e}")
+            return
+        results['totals'] = counts['totals']
+        results['facets'] = counts['facets']
+    
     def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
         """Get search suggestions"""
         if not query or len(query.strip()) < 2:
             return []
         
-        suggestions = []
-        search_pattern = f"%{query}%"
-        
-        # Get article title suggestions
-        article_titles = self.db.execute_query(
-            "SELECT title FROM articles WHERE title LIKE ? LIMIT ?",
-            (search_pattern, limit)
-        )
-        suggestions.extend([row['title'] for row in article_titles])
-        
-        # Get author name suggestions
-        author_names = self.db.execute_query(
-            "SELECT name FROM authors WHERE name LIKE ? LIMIT ?",
-            (search_pattern, limit)
-        )
-        suggestions.extend([row['name'] for row in author_names])
+        suggestions = self.index.suggest(query, limit)
         
         # Remove duplicates and limit
         unique_suggestions = list(dict.fromkeys(suggestions))
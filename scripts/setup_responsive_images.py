@@ -8,8 +8,13 @@ import os
 import sqlite3
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.variant_store import VariantStore, hash_file
+
+# Encoding quality per format (part of the variant store filename)
+QUALITY = {'jpeg': 85, 'webp': 80, 'avif': 75}
 
 def setup_responsive_images():
     """Set up responsive image system"""
@@ -126,13 +131,27 @@ def setup_responsive_images():
         return False
 
 def register_image_variants(cursor, image_id, original_width, original_height, breakpoints, formats):
-    """Register image variants in database"""
+    """Register planned image variants (variant store filenames) in database"""
     try:
+        # Store filenames are derived from the source file's hash
+        cursor.execute("SELECT local_filename FROM images WHERE id = ?", (image_id,))
+        image = cursor.fetchone()
+        try:
+            source_hash = hash_file(Path('assets/images') / image['local_filename'])
+        except (OSError, TypeError):
+            print(f"  ⏭️ No source file for image {image_id}; variants are registered when it is processed")
+            return
+        
+        cursor.execute("SELECT 1 FROM image_variants WHERE image_id = ? AND is_optimized = 1", (image_id,))
+        if cursor.fetchone():
+            print(f"  ✓ Image {image_id} already has processed variants")
+            return
+        
         aspect_ratio = original_width / original_height
         variant_count = 0
         
-        # Clear existing variants
-        cursor.execute("DELETE FROM image_variants WHERE image_id = ?", (image_id,))
+        # Clear earlier planned variants
+        cursor.execute("DELETE FROM image_variants WHERE image_id = ? AND is_optimized = 0", (image_id,))
         
         # Calculate variants for each device type
         for device_type, widths in breakpoints.items():
@@ -145,12 +164,12 @@ def register_image_variants(cursor, image_id, original_width, original_height, b
                 
                 # Register variants in different formats
                 for format_name in formats:
-                    filename = f"img_{image_id}_{device_type}_{width}x{height}.{format_name}"
-                    quality = 85 if format_name == 'jpeg' else 80
+                    quality = QUALITY[format_name]
+                    filename = VariantStore.relative_path(source_hash, width, height, format_name, quality)
                     
                     cursor.execute("""
                         INSERT INTO image_variants 
-                        (image_id, variant_type, width, height, format, filename, file_size, quality)
+                        (image_id, variant_type, width, height, format, local_filename, file_size, quality)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """, (image_id, device_type, width, height, format_name, filename, 0, quality))
                     
@@ -201,15 +220,15 @@ def generate_responsive_html(image_id, alt_text='', css_classes='', loading='laz
                 desktop_webp = [v for v in webp_variants if v['variant_type'] == 'desktop']
                 
                 if mobile_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in mobile_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in mobile_webp])
                     html_parts.append(f'    <source media="(max-width: 640px)" srcset="{srcset}" type="image/webp" sizes="100vw">')
                 
                 if tablet_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in tablet_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in tablet_webp])
                     html_parts.append(f'    <source media="(max-width: 1024px)" srcset="{srcset}" type="image/webp" sizes="50vw">')
                 
                 if desktop_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in desktop_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in desktop_webp])
                     html_parts.append(f'    <source srcset="{srcset}" type="image/webp" sizes="33vw">')
             
             # JPEG fallback sources
@@ -218,16 +237,16 @@ def generate_responsive_html(image_id, alt_text='', css_classes='', loading='laz
                 tablet_jpeg = [v for v in jpeg_variants if v['variant_type'] == 'tablet']
                 
                 if mobile_jpeg:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in mobile_jpeg])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in mobile_jpeg])
                     html_parts.append(f'    <source media="(max-width: 640px)" srcset="{srcset}" sizes="100vw">')
                 
                 if tablet_jpeg:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in tablet_jpeg])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in tablet_jpeg])
                     html_parts.append(f'    <source media="(max-width: 1024px)" srcset="{srcset}" sizes="50vw">')
             
             # Fallback img element
             fallback_variant = jpeg_variants[0] if jpeg_variants else dict(variants[0])
-            fallback_src = f"assets/images/responsive/{fallback_variant['filename']}"
+            fallback_src = f"assets/images/responsive/{fallback_variant['local_filename']}"
             html_parts.append(f'    <img src="{fallback_src}" alt="{alt_text}" class="{css_classes}" loading="{loading}">')
             
             html_parts.append('</picture>')
@@ -6,6 +6,7 @@ Command-line tool for syncing content from database to HTML pages
 """
 
 import sys
+import time
 import argparse
 from pathlib import Path
 
@@ -26,6 +27,10 @@ try:
     
     # Now try importing - this should work since we're running as a script from project root
     from src.database.db_manager import DatabaseManager
+    from src.database.search_index import SearchIndex
+    from src.integrators.build_graph import BuildGraph
+    from src.utils.template_engine import template_registry
+    from src.utils.trusted_security import trusted_sanitizer
     from src.models.article import Article
     from src.models.author import Author
     from src.models.category import Category
@@ -53,8 +58,10 @@ except ImportError as e:
 class ContentSyncTool:
     """Command-line content sync tool"""
     
-    def __init__(self):
+    def __init__(self, incremental: bool = False, workers: int = None, chunk_size: int = None):
         self.db = DatabaseManager()
+        # Install FTS triggers before any writes so the search index stays current
+        SearchIndex(self.db).ensure()
         self.integrators = {
             'site': SiteIntegrator(),
             'static': StaticPageIntegrator(),
@@ -66,20 +73,56 @@ class ContentSyncTool:
         # Homepage integrator is handled separately
         self.homepage_integrator = HomepageIntegrator()
         
+        # Every sync records page dependencies; incremental syncs use them
+        # to skip pages whose inputs have not changed
+        self.incremental = incremental
+        self.build_graph = BuildGraph(incremental=incremental, db=self.db)
+        for integrator in self.integrators.values():
+            integrator.build_graph = self.build_graph
+            integrator.render_workers = workers
+            integrator.parse_workers = workers
+            integrator.sync_chunk_size = chunk_size
+        self.homepage_integrator.build_graph = self.build_graph
+        
     def sync_all(self):
         """Sync all content types with bidirectional sync"""
-        print("🔄 Starting full content sync...")
+        mode = "incremental" if self.incremental else "full"
+        print(f"🔄 Starting {mode} content sync...")
         print("=" * 50)
         
+        # Ingest every content type before rendering, so pages that depend
+        # on other types (e.g. author pages listing articles) see fresh data
+        if not self.sync_files() or not self.render_all():
+            return False
+        
+        print("\n" + "=" * 50)
+        print("🎉 All content synced successfully!")
+        return True
+    
+    def sync_files(self):
+        """Sync content files into the database for every content type"""
         for content_type, integrator in self.integrators.items():
-            print(f"\n📦 Syncing {content_type}...")
+            print(f"\n📁 Syncing {content_type} files...")
             try:
                 # First sync files with database (bidirectional)
                 stats = integrator.sync_with_files()
                 print(f"  📁 File sync: +{stats['added']} ~{stats['updated']} -{stats['removed']} ={stats['skipped']} skipped")
-                
+                self.report_parse_stats(integrator)
+                self.report_write_stats(integrator)
+            except Exception as e:
+                print(f"❌ Failed to sync {content_type} files: {e}")
+                return False
+        self.build_graph.invalidate()
+        return True
+    
+    def render_all(self):
+        """Regenerate pages for every content type and the homepage"""
+        for content_type, integrator in self.integrators.items():
+            print(f"\n📦 Rendering {content_type}...")
+            try:
                 # Then regenerate all HTML pages
                 integrator.sync_all()
+                self.report_render_stats(integrator)
                 
                 # Update listing pages to reflect changes
                 integrator.update_all_listing_pages()
@@ -97,9 +140,100 @@ class ContentSyncTool:
             print(f"⚠️ Homepage update failed: {e}")
             # Don't fail the entire sync for homepage issues
             
-        print("\n" + "=" * 50)
-        print("🎉 All content synced successfully!")
+        # Fold the write-ahead log back into the database file
+        try:
+            self.db.checkpoint()
+        except Exception as e:
+            print(f"⚠️ Database checkpoint failed: {e}")
+            
+        self.finish_build()
         return True
+    
+    def watched_files(self):
+        """Modification times of templates and content files"""
+        paths = set(template_registry.loaded_files())
+        paths.update(str(p) for p in (project_root / 'templates').rglob('*') if p.is_file())
+        for integrator in self.integrators.values():
+            if hasattr(integrator, 'content_dir'):
+                paths.update(str(p) for p in Path(integrator.content_dir).glob('*.txt'))
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+        return mtimes
+    
+    def watch(self, interval: float = 1.0):
+        """
+        Development mode: re-render when templates or content files change
+        
+        Templates are hot-reloaded from the process-wide registry and only
+        pages whose inputs changed are rendered again.
+        """
+        self.incremental = self.build_graph.incremental = True
+        snapshot = self.watched_files()
+        print("\n👀 Watching templates and content for changes (Ctrl+C to stop)...")
+        try:
+            while True:
+                time.sleep(interval)
+                current = self.watched_files()
+                if current == snapshot:
+                    continue
+                changed = sorted(path for path in set(current) | set(snapshot)
+                                 if current.get(path) != snapshot.get(path))
+                snapshot = current
+                
+                print(f"\n🔁 Changed: {', '.join(os.path.relpath(path) for path in changed)}")
+                self.build_graph.reset_stats()
+                self.build_graph.invalidate()
+                if any(path.endswith('.txt') for path in changed):
+                    self.sync_all()
+                else:
+                    self.render_all()
+                print("\n👀 Watching for changes...")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+        
+    def report_render_stats(self, integrator):
+        """Print page throughput of the integrator's last parallel render"""
+        stats = integrator.render_stats
+        if stats.get('pages'):
+            print(f"  ⚡ Rendered {stats['pages']} pages in {stats['seconds']:.2f}s "
+                  f"({stats['pages_per_second']:.1f} pages/s, {stats['workers']} workers)")
+        
+    def report_parse_stats(self, integrator):
+        """Print how many content files the last file sync parsed, and with how many workers"""
+        stats = integrator.parse_stats
+        if stats.get('workers', 1) > 1:
+            print(f"  ⚡ Parsed {stats['files']} files in {stats['workers']} worker processes")
+        
+    def report_write_stats(self, integrator):
+        """Print rows written by the integrator's last file sync and their rate"""
+        stats = integrator.write_stats
+        if stats.get('rows'):
+            print(f"  💾 Wrote {stats['rows']} rows in {stats['chunks']} transactions "
+                  f"({stats['rows_per_second']:.0f} rows/s)")
+        if stats.get('failed_chunks'):
+            print(f"  ⚠️ {stats['failed_chunks']} chunks rolled back ({stats['failed_items']} files will be retried)")
+        
+    def finish_build(self):
+        """Persist the build graph and report rendered/skipped pages"""
+        try:
+            self.build_graph.save()
+        except Exception as e:
+            print(f"⚠️ Could not save build graph: {e}")
+        stats = self.build_graph.get_stats()
+        print(f"\n📄 Pages rendered: {stats['rendered']}, skipped (unchanged): {stats['skipped']}")
+        self.report_sanitize_stats()
+        
+    def report_sanitize_stats(self):
+        """Print the sanitizer cache hit rate of this process and persist new results"""
+        trusted_sanitizer.cache.flush()
+        stats = trusted_sanitizer.cache.get_stats()
+        if stats['lookups']:
+            print(f"🧼 Sanitizer cache: {stats['lookups']} lookups, {stats['hit_rate']:.1%} hits "
+                  f"({stats['store_hits']} from the persistent cache, {stats['misses']} sanitized)")
         
     def sync_type(self, content_type):
         """Sync specific content type with bidirectional sync"""
@@ -115,13 +249,18 @@ class ContentSyncTool:
             # First sync files with database (bidirectional)
             stats = integrator.sync_with_files()
             print(f"  📁 File sync: +{stats['added']} ~{stats['updated']} -{stats['removed']} ={stats['skipped']} skipped")
+            self.report_parse_stats(integrator)
+            self.report_write_stats(integrator)
+            self.build_graph.invalidate()
             
             # Then regenerate all HTML pages
             integrator.sync_all()
+            self.report_render_stats(integrator)
             
             # Update listing pages to reflect changes
             integrator.update_all_listing_pages()
             print(f"✅ {content_type.title()} synced successfully")
+            self.finish_build()
             return True
         except Exception as e:
             print(f"❌ Failed to sync {content_type}: {e}")
@@ -190,6 +329,10 @@ def main():
         epilog="""
 Common Usage:
   python3 sync_content.py                    # Sync all content (most common)
+  python3 sync_content.py --incremental      # Only re-render pages whose inputs changed
+  python3 sync_content.py --workers 4        # Parse files and render pages with 4 worker processes
+  python3 sync_content.py --chunk-size 0     # Whole file sync in one transaction
+  python3 sync_content.py --watch            # Sync, then re-render on template/content edits
   python3 sync_content.py articles          # Sync only articles
   python3 sync_content.py stats             # Show content statistics
   python3 sync_content.py status            # Check database connection
@@ -201,15 +344,30 @@ Content Types: site, articles, authors, categories, trending, homepage
                        choices=['sync', 'site', 'articles', 'authors', 'categories', 'trending', 'homepage', 'stats', 'status'],
                        help='What to do: sync all content (default), sync specific type, or show info')
     
+    parser.add_argument('--incremental', '-i', action='store_true',
+                       help='Skip pages whose database rows, templates and site config are unchanged')
+    
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                       help='Worker processes for page rendering and content file parsing '
+                            '(default: build.render_workers / build.parse_workers, 0 = one per core, 1 = serial)')
+    
+    parser.add_argument('--chunk-size', type=int, default=None,
+                       help='Content files per database transaction during file sync (default: build.sync_chunk_size, 0 = one transaction)')
+    
+    parser.add_argument('--watch', action='store_true',
+                       help='After syncing, keep running and re-render when templates or content files change')
+    
     args = parser.parse_args()
     
     # Create tool instance
-    tool = ContentSyncTool()
+    tool = ContentSyncTool(incremental=args.incremental, workers=args.workers, chunk_size=args.chunk_size)
     
     # Execute action - much simpler logic
     if args.action == 'sync':
         print("🔄 Syncing all content...")
         success = tool.sync_all()
+        if args.watch:
+            tool.watch()
         sys.exit(0 if success else 1)
         
     elif args.action in ['articles', 'authors', 'categories', 'trending']:
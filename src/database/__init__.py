@@ -1,5 +1,6 @@
 """Database module for Influencer News CMS"""
 
 from .db_manager import DatabaseManager
+from .search_index import SearchIndex
 
-__all__ = ['DatabaseManager']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'SearchIndex']
\ No newline at end of file
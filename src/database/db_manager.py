@@ -6,7 +6,12 @@ Handles all database operations with connection pooling and transaction support
 import sqlite3
 import json
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import queue
+import re
+import threading
+import time
+import weakref
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from contextlib import contextmanager
 from datetime import datetime
 import logging
@@ -14,18 +19,471 @@ import logging
 # Import configuration
 try:
     from ..utils.config import config
+    from .pagination import decode_cursor, build_page, check_limit
 except ImportError:
     from src.utils.config import config
+    from src.database.pagination import decode_cursor, build_page, check_limit
+
+
+# Idempotent schema updates (CREATE ... IF NOT EXISTS) applied whenever a
+# database is opened. They are not versioned migrations: SchemaMigrator
+# only runs the numbered scripts in migrations/
+SCHEMA_UPDATES_DIR = os.path.join(os.path.dirname(__file__), 'schema_updates')
+
+# Index scripts applied to every database, in order
+INDEX_UPDATES = ['keyset_pagination.sql', 'search_facets.sql', 'article_derived_fields.sql']
+
+# Columns added to existing databases before the index scripts run
+# (SQLite has no ADD COLUMN IF NOT EXISTS)
+COLUMN_UPDATES = [
+    ('articles', 'word_count', 'INTEGER'),
+    ('articles', 'content_hash', 'TEXT'),
+]
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection subclass so the pool can track connections weakly"""
+
+
+class ConnectionPool:
+    """
+    Process-wide pool of long-lived SQLite connections for one database file
+
+    Two checkout modes are supported:
+      - 'thread': every thread keeps one persistent connection (CLI / sync)
+      - 'shared': threads borrow from a bounded queue of connections (servers)
+
+    Nested checkouts on the same thread reuse the connection already held,
+    so only the outermost ``DatabaseManager.get_connection()`` commits.
+    """
+
+    _pools: Dict[Tuple[str, str], 'ConnectionPool'] = {}
+    _pools_lock = threading.Lock()
+
+    # PRAGMA names and values from config are interpolated, so keep them simple
+    _PRAGMA_NAME = re.compile(r'^[a-z_]+$')
+    _PRAGMA_VALUE = re.compile(r'^-?[A-Za-z0-9_]+$')
+
+    def __init__(self, db_path: str, mode: str = 'thread', size: int = 8,
+                 timeout: float = 30.0, pragmas: Optional[Dict[str, Any]] = None,
+                 maintenance_interval: float = 0):
+        self.db_path = db_path
+        self.mode = mode
+        self.size = max(1, int(size))
+        self.timeout = float(timeout)
+        self.pragmas = dict(pragmas or {})
+        self.maintenance_interval = float(maintenance_interval or 0)
+        self._last_maintenance = time.monotonic()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle = queue.LifoQueue()
+        self._connections = weakref.WeakSet()
+        self._created = 0
+        self._pid = os.getpid()
+        self._stats = {'hits': 0, 'misses': 0, 'waits': 0, 'wait_time': 0.0,
+                       'timeouts': 0, 'maintenance_runs': 0}
+
+    @classmethod
+    def get_pool(cls, db_path: str, mode: str = 'thread', size: int = 8,
+                 timeout: float = 30.0, pragmas: Optional[Dict[str, Any]] = None,
+                 maintenance_interval: float = 0) -> 'ConnectionPool':
+        """Return the pool for a database path and mode, creating it once"""
+        key = (os.path.abspath(db_path), mode)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls(db_path, mode=mode, size=size, timeout=timeout,
+                           pragmas=pragmas, maintenance_interval=maintenance_interval)
+                cls._pools[key] = pool
+            return pool
+
+    @classmethod
+    def close_all_pools(cls) -> None:
+        """Close every pooled connection in this process"""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+        for pool in pools:
+            pool.close_all()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        conn = sqlite3.connect(self.db_path, factory=PooledConnection,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        self._apply_pragmas(conn)
+        with self._lock:
+            self._connections.add(conn)
+            self._created += 1
+            self._stats['misses'] += 1
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Apply the configured PRAGMA profile to a new connection"""
+        for name, value in self.pragmas.items():
+            name = str(name).lower()
+            value = str(value)
+            if not self._PRAGMA_NAME.match(name) or not self._PRAGMA_VALUE.match(value):
+                logging.getLogger(__name__).warning(f"Ignoring invalid PRAGMA {name}={value}")
+                continue
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error as e:
+                logging.getLogger(__name__).warning(f"Could not apply PRAGMA {name}={value}: {e}")
+
+    def maintenance_due(self) -> bool:
+        """Whether the periodic checkpoint/optimize interval has elapsed"""
+        if self.maintenance_interval <= 0:
+            return False
+        return time.monotonic() - self._last_maintenance >= self.maintenance_interval
+
+    def run_maintenance(self, conn: sqlite3.Connection, checkpoint_mode: str = 'PASSIVE') -> Dict[str, Any]:
+        """Checkpoint the WAL and let SQLite refresh planner statistics"""
+        self._last_maintenance = time.monotonic()
+        result = {}
+        row = conn.execute(f"PRAGMA wal_checkpoint({checkpoint_mode})").fetchone()
+        if row is not None:
+            result['checkpoint'] = {'busy': row[0], 'log_frames': row[1],
+                                    'checkpointed_frames': row[2]}
+        conn.execute("PRAGMA optimize")
+        with self._lock:
+            self._stats['maintenance_runs'] += 1
+        return result
+
+    def _check_fork(self) -> None:
+        """Drop inherited connections after os.fork() (e.g. in worker processes)"""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._idle = queue.LifoQueue()
+            self._connections = weakref.WeakSet()
+            self._created = 0
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection for the calling thread"""
+        self._check_fork()
+        local = self._local
+        conn = getattr(local, 'conn', None)
+
+        if conn is not None:
+            # Nested checkout or persistent per-thread connection
+            if local.depth > 0 or self.mode == 'thread':
+                local.depth += 1
+                with self._lock:
+                    self._stats['hits'] += 1
+                return conn
+
+        if self.mode == 'thread':
+            conn = self._connect()
+        else:
+            conn = self._acquire_shared()
+
+        local.conn = conn
+        local.depth = 1
+        return conn
+
+    def _acquire_shared(self) -> sqlite3.Connection:
+        """Borrow a connection from the bounded shared pool"""
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self._stats['hits'] += 1
+            return conn
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                # Reserve the slot before connecting outside the lock
+                self._created += 1
+        if can_create:
+            try:
+                conn = self._connect()
+            finally:
+                with self._lock:
+                    self._created -= 1
+            return conn
+
+        start = time.perf_counter()
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise sqlite3.OperationalError(
+                f"Timed out after {self.timeout}s waiting for a database connection "
+                f"(pool size {self.size})"
+            )
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._stats['waits'] += 1
+            self._stats['wait_time'] += waited
+            self._stats['hits'] += 1
+        return conn
+
+    def is_outermost(self) -> bool:
+        """Whether the calling thread holds exactly one checkout"""
+        return getattr(self._local, 'depth', 0) == 1
+    
+    @property
+    def unit_of_work(self) -> Optional['UnitOfWork']:
+        """The unit of work open on the calling thread, if any"""
+        return getattr(self._local, 'unit_of_work', None)
+    
+    @unit_of_work.setter
+    def unit_of_work(self, uow: Optional['UnitOfWork']) -> None:
+        self._local.unit_of_work = uow
+    
+    def depth(self) -> int:
+        """Checkouts currently held by the calling thread"""
+        return getattr(self._local, 'depth', 0)
+    
+    def release(self, conn: sqlite3.Connection) -> bool:
+        """
+        Return a connection checked out by the calling thread
+
+        Returns:
+            True when this released the outermost checkout
+        """
+        local = self._local
+        if getattr(local, 'conn', None) is not conn:
+            # Connection was opened before a fork or by another pool state
+            return True
+
+        local.depth -= 1
+        if local.depth > 0:
+            return False
+
+        if self.mode == 'shared':
+            local.conn = None
+            self._idle.put(conn)
+        return True
+
+    def discard(self, conn: sqlite3.Connection) -> None:
+        """Close a broken connection so it is not handed out again"""
+        local = self._local
+        if getattr(local, 'conn', None) is conn:
+            local.conn = None
+            local.depth = 0
+        with self._lock:
+            if conn in self._connections:
+                self._connections.discard(conn)
+                self._created = max(0, self._created - 1)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self) -> None:
+        """Close every connection owned by this pool"""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections = weakref.WeakSet()
+            self._created = 0
+        self._idle = queue.LifoQueue()
+        self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool hit/miss/wait counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['open_connections'] = len(self._connections)
+        stats['mode'] = self.mode
+        stats['size'] = self.size
+        stats['idle'] = self._idle.qsize()
+        checkouts = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / checkouts, 4) if checkouts else 0.0
+        stats['avg_wait_ms'] = (round(stats['wait_time'] / stats['waits'] * 1000, 3)
+                                if stats['waits'] else 0.0)
+        return stats
+
+    def reset_stats(self) -> None:
+        """Zero the pool counters"""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0.0 if key == 'wait_time' else 0
+
+
+class UnitOfWork:
+    """
+    Batches the writes of many items into chunked transactions
+
+    Opened with ``DatabaseManager.unit_of_work()``. It holds the thread's
+    connection, so every ``get_connection()`` block on that thread, from
+    any DatabaseManager or model for the same file, joins its
+    transaction. Each item runs in a SAVEPOINT, and so does every nested
+    ``get_connection()`` block: a failure undoes only that item's or that
+    block's writes, as the separate commits did before. The transaction
+    is committed every ``chunk_size`` items (0 = once, at the end). If a
+    commit fails, that chunk alone is rolled back and its on_commit
+    callbacks are dropped.
+    """
+
+    def __init__(self, manager: 'DatabaseManager', chunk_size: int = 0):
+        self.manager = manager
+        self.pool = manager.pool
+        self.chunk_size = max(0, int(chunk_size or 0))
+        self.conn: Optional[sqlite3.Connection] = None
+        self._pending_items = 0
+        self._pending_callbacks: List[Callable[[], None]] = []
+        self._chunk_changes = 0
+        # Bumped whenever a chunk is rolled back, invalidating open savepoints
+        self._generation = 0
+        self._started = 0.0
+        self.stats = {'items': 0, 'failed_items': 0, 'chunks': 0, 'failed_chunks': 0,
+                      'rows': 0, 'seconds': 0.0, 'rows_per_second': 0.0}
+
+    def __enter__(self) -> 'UnitOfWork':
+        if self.pool.unit_of_work is not None:
+            raise RuntimeError("A unit of work is already open on this thread")
+        self.conn = self.pool.acquire()
+        if not self.pool.is_outermost():
+            self.pool.release(self.conn)
+            raise RuntimeError("A unit of work must be opened outside get_connection()")
+        # Commit whatever the thread's connection had pending
+        self.conn.commit()
+        self.pool.unit_of_work = self
+        self._started = time.perf_counter()
+        self._begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self._rollback_chunk()
+        finally:
+            self.pool.unit_of_work = None
+            self.pool.release(self.conn)
+            elapsed = time.perf_counter() - self._started
+            self.stats['seconds'] = round(elapsed, 3)
+            self.stats['rows_per_second'] = round(self.stats['rows'] / elapsed, 1) if elapsed else 0.0
+        return False
+
+    def _begin(self) -> None:
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self._chunk_changes = self.conn.total_changes
+
+    @contextmanager
+    def item(self):
+        """
+        Run one item's writes; an exception rolls back just those writes
+        and propagates
+
+        Yields:
+            sqlite3.Connection: The unit of work's connection
+        """
+        try:
+            with self.savepoint("uow_item") as kept:
+                yield self.conn
+        except Exception:
+            self.stats['failed_items'] += 1
+            raise
+        if not kept:
+            # The chunk this item started in was rolled back under it
+            self.stats['failed_items'] += 1
+            return
+        self.stats['items'] += 1
+        self._pending_items += 1
+        if self.chunk_size and self._pending_items >= self.chunk_size:
+            self.commit()
+
+    @contextmanager
+    def savepoint(self, name: str):
+        """
+        Run a block in a savepoint, rolled back if the block raises
+        
+        Yields:
+            List that is truthy once the savepoint was released, or stays
+            empty if its chunk was rolled back in the meantime
+        """
+        generation = self._generation
+        kept: List[bool] = []
+        self.conn.execute(f"SAVEPOINT {name}")
+        changes = self.conn.total_changes
+        undone = self._chunk_changes
+        try:
+            yield kept
+        except Exception:
+            if generation == self._generation:
+                if self.conn.in_transaction:
+                    # total_changes keeps counting undone rows; leave them out of the
+                    # chunk (less what nested savepoints already left out)
+                    self._chunk_changes += (self.conn.total_changes - changes) - (self._chunk_changes - undone)
+                    self.conn.execute(f"ROLLBACK TO {name}")
+                    self.conn.execute(f"RELEASE {name}")
+                else:
+                    # SQLite rolled the whole transaction back itself (e.g. disk full)
+                    self._rollback_chunk()
+                    self._begin()
+            raise
+        if generation == self._generation:
+            self.conn.execute(f"RELEASE {name}")
+            kept.append(True)
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run callback once the current chunk is committed (dropped if it is rolled back)"""
+        self._pending_callbacks.append(callback)
+
+    def commit(self) -> None:
+        """Commit the current chunk and start the next"""
+        changes = self.conn.total_changes - self._chunk_changes
+        try:
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.manager.logger.error(f"Chunk commit failed, rolling back {self._pending_items} items: {e}")
+            self._rollback_chunk()
+            self._begin()
+            return
+        self.stats['chunks'] += 1
+        self.stats['rows'] += changes
+        callbacks, self._pending_callbacks = self._pending_callbacks, []
+        self._pending_items = 0
+        for callback in callbacks:
+            callback()
+        self._begin()
+
+    def _rollback_chunk(self) -> None:
+        """Discard the current chunk's writes and callbacks"""
+        try:
+            self.conn.rollback()
+        except sqlite3.Error:
+            self.pool.discard(self.conn)
+            raise
+        if self._pending_items or self._pending_callbacks:
+            self.stats['failed_chunks'] += 1
+            self.stats['failed_items'] += self._pending_items
+            self.stats['items'] -= self._pending_items
+        self._pending_items = 0
+        self._pending_callbacks = []
+        self._chunk_changes = self.conn.total_changes
+        self._generation += 1
+
 
 class DatabaseManager:
     """Manages SQLite database connections and operations"""
     
-    def __init__(self, db_path: str = None):
+    # Database paths whose schema updates ran in this process
+    _indexed_paths = set()
+    _indexed_lock = threading.Lock()
+    
+    def __init__(self, db_path: str = None, pool_mode: str = None):
         """
         Initialize database manager
         
         Args:
             db_path: Path to SQLite database file (defaults to config value)
+            pool_mode: 'thread' or 'shared' connection pooling (defaults to config value)
+        
+        Connections apply the ``database.pragmas`` profile from config.yaml
+        when they are opened.
         """
         # Use config value if no path provided
         self.db_path = db_path or config.get_database_path()
@@ -34,6 +492,16 @@ class DatabaseManager:
         # Ensure data directory exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
+        # Connections are shared by every manager pointing at the same file
+        self.pool = ConnectionPool.get_pool(
+            self.db_path,
+            mode=pool_mode or config.get('database.pool.mode', 'thread'),
+            size=config.get('database.pool.size', 8),
+            timeout=config.get('database.pool.timeout', 30),
+            pragmas=config.get('database.pragmas', {}),
+            maintenance_interval=config.get('database.maintenance.interval_seconds', 300)
+        )
+        
         # Initialize database if needed
         self._initialize_database()
     
@@ -50,28 +518,116 @@ class DatabaseManager:
                 conn.executescript(schema)
             
             self.logger.info("Database initialized successfully")
+        
+        self._apply_schema_updates()
+    
+    def _apply_schema_updates(self) -> None:
+        """Add the COLUMN_UPDATES columns and create the INDEX_UPDATES indexes once per process"""
+        path = os.path.abspath(self.db_path)
+        with DatabaseManager._indexed_lock:
+            if path in DatabaseManager._indexed_paths:
+                return
+            DatabaseManager._indexed_paths.add(path)
+        
+        for table, column, column_type in COLUMN_UPDATES:
+            try:
+                with self.get_connection() as conn:
+                    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                    if columns and column not in columns:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            except sqlite3.Error as e:
+                self.logger.warning(f"Could not add column {table}.{column}: {e}")
+        
+        for name in INDEX_UPDATES:
+            try:
+                with open(os.path.join(SCHEMA_UPDATES_DIR, name), 'r') as f:
+                    script = f.read()
+                with self.get_connection() as conn:
+                    conn.executescript(script)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"Could not apply schema update {name}: {e}")
     
     @contextmanager
     def get_connection(self):
         """
-        Get a database connection with proper cleanup
+        Get a pooled database connection with transaction handling
+        
+        The outermost block commits on success and rolls back on error;
+        nested blocks on the same thread share the outer transaction. Inside
+        a unit of work, nested blocks run in a savepoint that is rolled back
+        if the block raises.
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+        conn = self.pool.acquire()
+        outermost = self.pool.is_outermost()
+        uow = self.pool.unit_of_work
         
         try:
-            yield conn
-            conn.commit()
+            if uow is not None and conn is uow.conn:
+                with uow.savepoint(f"uow_block_{self.pool.depth()}"):
+                    yield conn
+            else:
+                yield conn
+            if outermost:
+                conn.commit()
+                if self.pool.maintenance_due():
+                    self._run_maintenance(conn)
         except Exception as e:
-            conn.rollback()
-            self.logger.error(f"Database error: {e}")
+            if outermost:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    self.pool.discard(conn)
+                    raise
+                self.logger.error(f"Database error: {e}")
             raise
         finally:
-            conn.close()
+            self.pool.release(conn)
+    
+    def _run_maintenance(self, conn: sqlite3.Connection) -> None:
+        """Periodic WAL checkpoint and optimize; failures are non-fatal"""
+        try:
+            self.pool.run_maintenance(conn)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Database maintenance skipped: {e}")
+    
+    def checkpoint(self, mode: str = 'TRUNCATE') -> Dict[str, Any]:
+        """
+        Checkpoint the write-ahead log and run PRAGMA optimize
+        
+        Args:
+            mode: wal_checkpoint mode (PASSIVE, FULL, RESTART or TRUNCATE)
+            
+        Returns:
+            Checkpoint result counters
+        """
+        mode = mode.upper()
+        if mode not in ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'):
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        with self.get_connection() as conn:
+            return self.pool.run_maintenance(conn, checkpoint_mode=mode)
+    
+    def unit_of_work(self, chunk_size: int = 0) -> UnitOfWork:
+        """
+        Group the writes of many items into chunked transactions
+        
+        Args:
+            chunk_size: Items per transaction (0 = a single transaction)
+            
+        Returns:
+            UnitOfWork to use as a context manager
+        """
+        return UnitOfWork(self, chunk_size)
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool hit/miss/wait statistics"""
+        return self.pool.get_stats()
+    
+    def close(self) -> None:
+        """Close all pooled connections for this database"""
+        self.pool.close_all()
     
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         """
@@ -183,11 +739,85 @@ class DatabaseManager:
             query += " AND author_id = ?"
             params.append(author_id)
         
-        query += " ORDER BY publish_date DESC LIMIT ? OFFSET ?"
+        # Same order as get_articles_page, so a cursor built from the last
+        # row of an offset page continues it without skipping or repeating rows
+        query += " ORDER BY IFNULL(publish_date, '') DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
         return self.execute_query(query, tuple(params))
     
+    # Columns of article_full_view, selected from the base tables so the
+    # join order (and the keyset index on articles) is fixed
+    ARTICLE_PAGE_COLUMNS = """
+        a.id, a.title, a.slug, a.excerpt, a.mobile_title, a.mobile_excerpt,
+        a.mobile_hero_image_id, a.featured, a.trending, a.publish_date, a.views,
+        a.likes, a.read_time_minutes, a.word_count, a.image_url, a.hero_image_url, a.thumbnail_url,
+        a.last_modified, a.created_at, a.updated_at,
+        au.id AS author_id, au.name AS author_name, au.slug AS author_slug,
+        au.title AS author_title, c.id AS category_id, c.name AS category_name,
+        c.slug AS category_slug, c.color AS category_color, c.icon AS category_icon,
+        IFNULL(a.publish_date, '') AS sort_date
+    """
+    
+    def get_articles_page(self, category_id: Optional[int] = None, author_id: Optional[int] = None,
+                          limit: Optional[int] = None, cursor: Optional[str] = None,
+                          include_content: bool = False) -> Dict[str, Any]:
+        """
+        Get one page of articles, newest first, using keyset pagination
+        
+        Args:
+            category_id: Only articles in this category
+            author_id: Only articles by this author
+            limit: Page size (defaults to limits.articles_per_page)
+            cursor: ``next_cursor`` from the previous page, None for the first
+            include_content: Also select the article body
+            
+        Returns:
+            Dict with ``items`` (rows shaped like article_full_view),
+            ``next_cursor`` and ``has_more``
+            
+        Raises:
+            ValueError: If the limit or cursor is invalid
+        """
+        if limit is None:
+            limit = config.get('limits.articles_per_page', 20)
+        check_limit(limit)
+        
+        columns = self.ARTICLE_PAGE_COLUMNS + (", a.content" if include_content else "")
+        # CROSS JOIN keeps articles as the outer loop so rows come straight off the index
+        query = f"""
+        SELECT {columns}
+        FROM articles a
+        CROSS JOIN authors au ON a.author_id = au.id
+        CROSS JOIN categories c ON a.category_id = c.id
+        WHERE 1=1
+        """
+        params = []
+        
+        if category_id:
+            query += " AND a.category_id = ?"
+            params.append(category_id)
+        
+        if author_id:
+            query += " AND a.author_id = ?"
+            params.append(author_id)
+        
+        if cursor:
+            sort_date, last_id = decode_cursor(cursor, 2)
+            # The leading <= gives SQLite a range to seek; a row-value
+            # comparison would scan the index instead
+            query += """ AND IFNULL(a.publish_date, '') <= ?
+                         AND (IFNULL(a.publish_date, '') < ? OR a.id < ?)"""
+            params.extend([sort_date, sort_date, last_id])
+        
+        query += " ORDER BY IFNULL(a.publish_date, '') DESC, a.id DESC LIMIT ?"
+        params.append(limit + 1)
+        
+        page = build_page(self.execute_query(query, tuple(params)), limit, ('sort_date', 'id'))
+        for row in page['items']:
+            del row['sort_date']
+        return page
+    
     def create_article(self, title: str, slug: str, author_id: int, category_id: int,
                       publish_date: str, content: str, **kwargs) -> int:
         """Create new article"""
@@ -197,8 +827,8 @@ class DatabaseManager:
                             hero_image_url, thumbnail_url, tags, views, likes, 
                             comments, read_time_minutes, seo_title, seo_description,
                             mobile_title, mobile_excerpt, mobile_hero_image_id, 
-                            last_modified)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            last_modified, word_count, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         params = (
             title, slug, kwargs.get('excerpt'), content, author_id, category_id,
@@ -209,7 +839,8 @@ class DatabaseManager:
             kwargs.get('comments', 0), kwargs.get('read_time_minutes', 5),
             kwargs.get('seo_title'), kwargs.get('seo_description'),
             kwargs.get('mobile_title'), kwargs.get('mobile_excerpt'),
-            kwargs.get('mobile_hero_image_id'), kwargs.get('last_modified')
+            kwargs.get('mobile_hero_image_id'), kwargs.get('last_modified'),
+            kwargs.get('word_count'), kwargs.get('content_hash')
         )
         return self.execute_write(query, params)
     
@@ -233,9 +864,43 @@ class DatabaseManager:
         if limit is None:
             limit = config.get('limits.max_authors_sync', 100)
             
-        query = "SELECT * FROM authors ORDER BY name LIMIT ? OFFSET ?"
+        query = "SELECT * FROM authors ORDER BY name, id LIMIT ? OFFSET ?"
         return self.execute_query(query, (limit, offset))
     
+    def get_authors_page(self, limit: Optional[int] = None,
+                         cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of authors in name order using keyset pagination
+        
+        Args:
+            limit: Page size (defaults to limits.max_authors_sync)
+            cursor: ``next_cursor`` from the previous page, None for the first
+            
+        Returns:
+            Dict with ``items``, ``next_cursor`` and ``has_more``
+            
+        Raises:
+            ValueError: If the limit or cursor is invalid
+        """
+        if limit is None:
+            limit = config.get('limits.max_authors_sync', 100)
+        check_limit(limit)
+        
+        query = "SELECT * FROM authors"
+        params = []
+        if cursor:
+            name, last_id = decode_cursor(cursor, 2)
+            query += " WHERE name >= ? AND (name > ? OR id > ?)"
+            params.extend([name, name, last_id])
+        query += " ORDER BY name, id LIMIT ?"
+        params.append(limit + 1)
+        
+        return build_page(self.execute_query(query, tuple(params)), limit, ('name', 'id'))
+    
+    def get_authors_by_ids(self, author_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get several authors by ID in one query per 500 IDs"""
+        return self._get_rows_by_ids('authors', author_ids)
+    
     def create_author(self, name: str, slug: str, **kwargs) -> int:
         """Create new author"""
         query = """
@@ -277,6 +942,36 @@ class DatabaseManager:
         query = "SELECT * FROM categories ORDER BY name LIMIT ? OFFSET ?"
         return self.execute_query(query, (limit, offset))
     
+    def get_categories_by_ids(self, category_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get several categories by ID in one query per 500 IDs"""
+        return self._get_rows_by_ids('categories', category_ids)
+    
+    def get_article_counts_by_category(self) -> Dict[int, int]:
+        """Number of articles in each category, keyed by category ID"""
+        query = "SELECT category_id, COUNT(*) AS count FROM article_full_view GROUP BY category_id"
+        return {row['category_id']: row['count'] for row in self.execute_query(query)}
+    
+    def _get_rows_by_ids(self, table: str, ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Fetch rows of a table by primary key, batching the IN list
+        
+        Args:
+            table: Table name (internal callers only, never user input)
+            ids: Row IDs; duplicates and None are ignored
+            
+        Returns:
+            Matching rows in no particular order
+        """
+        unique_ids = list(dict.fromkeys(i for i in ids if i is not None))
+        rows = []
+        for start in range(0, len(unique_ids), 500):
+            batch = unique_ids[start:start + 500]
+            placeholders = ', '.join('?' for _ in batch)
+            rows.extend(self.execute_query(
+                f"SELECT * FROM {table} WHERE id IN ({placeholders})", tuple(batch)
+            ))
+        return rows
+    
     def create_category(self, name: str, slug: str, **kwargs) -> int:
         """Create new category"""
         query = """
@@ -399,7 +1094,7 @@ class DatabaseManager:
                          'hero_image_url', 'thumbnail_url', 'tags', 'views', 'likes',
                          'comments', 'read_time_minutes', 'seo_title', 'seo_description',
                          'mobile_title', 'mobile_excerpt', 'mobile_hero_image_id',
-                         'last_modified']
+                         'last_modified', 'word_count', 'content_hash']
         
         fields = []
         values = []
@@ -0,0 +1,92 @@
+"""
+Keyset (cursor) pagination helpers for Influencer News CMS
+Cursors are opaque URL-safe tokens holding the sort key of the last row
+on a page; the next page starts strictly after it, so every page costs
+the same index seek however deep it is
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Sequence
+
+# Largest page a caller may ask for (matches the API's pagination validation)
+MAX_PAGE_SIZE = 100
+
+
+def check_limit(limit: int) -> int:
+    """
+    Validate a page size before it is used in LIMIT limit + 1
+
+    Args:
+        limit: Requested page size
+
+    Returns:
+        The page size
+
+    Raises:
+        ValueError: If it is not between 1 and MAX_PAGE_SIZE
+    """
+    if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"Page limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode a row's sort key as an opaque cursor
+
+    Args:
+        values: Sort key of the last row on the page, e.g. (publish_date, id)
+
+    Returns:
+        URL-safe token
+    """
+    raw = json.dumps(list(values), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        token: Cursor from a previous response
+        size: Number of sort key values expected
+
+    Returns:
+        The sort key values
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        values = json.loads(raw.decode('utf-8'))
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid pagination cursor")
+    if any(not isinstance(value, (str, int, float)) or isinstance(value, bool) for value in values):
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
+def build_page(rows: List[Dict[str, Any]], limit: int, key_columns: Sequence[str]) -> Dict[str, Any]:
+    """
+    Trim a LIMIT limit+1 result to one page and compute the next cursor
+
+    Args:
+        rows: Rows fetched with LIMIT limit + 1
+        limit: Page size
+        key_columns: Row keys holding the sort key, in order
+
+    Returns:
+        Dict with ``items``, ``next_cursor`` (None on the last page) and ``has_more``
+    """
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        next_cursor = encode_cursor([last[column] for column in key_columns])
+    return {'items': items, 'next_cursor': next_cursor, 'has_more': has_more}
@@ -63,6 +63,8 @@ CREATE TABLE articles (
     likes INTEGER DEFAULT 0,
     comments INTEGER DEFAULT 0,
     read_time_minutes INTEGER DEFAULT 0,
+    word_count INTEGER,         -- Words in content, tags stripped
+    content_hash TEXT,          -- Hash of the source body content was rendered from
     seo_title TEXT,
     seo_description TEXT,
     mobile_title TEXT,          -- Mobile-optimized title
@@ -254,11 +256,9 @@ CREATE INDEX idx_site_config_active ON site_config(is_active);
 -- FULL-TEXT SEARCH
 -- ================================
 
--- Full-text search disabled due to corruption issues
--- CREATE VIRTUAL TABLE articles_fts USING fts5(
---     title, excerpt, content, tags,
---     content_rowid=articles
--- );
+-- FTS5 indexes and their sync triggers live in
+-- migrations/002_fts5_search_index.sql and are installed by
+-- SearchIndex.ensure() (src/database/search_index.py)
 
 -- ================================
 -- TRIGGERS FOR DATA INTEGRITY
@@ -397,25 +397,6 @@ BEGIN
     WHERE id = OLD.category_id AND OLD.category_id != NEW.category_id;
 END;
 
--- FTS triggers disabled due to corruption issues
--- CREATE TRIGGER articles_fts_insert AFTER INSERT ON articles
--- BEGIN
---     INSERT INTO articles_fts(rowid, title, excerpt, content, tags)
---     VALUES (NEW.id, NEW.title, NEW.excerpt, NEW.content, NEW.tags);
--- END;
-
--- CREATE TRIGGER articles_fts_delete AFTER DELETE ON articles
--- BEGIN
---     DELETE FROM articles_fts WHERE rowid = OLD.id;
--- END;
-
--- CREATE TRIGGER articles_fts_update AFTER UPDATE ON articles
--- BEGIN
---     DELETE FROM articles_fts WHERE rowid = OLD.id;
---     INSERT INTO articles_fts(rowid, title, excerpt, content, tags)
---     VALUES (NEW.id, NEW.title, NEW.excerpt, NEW.content, NEW.tags);
--- END;
-
 -- ================================
 -- SAMPLE DATA
 -- ================================
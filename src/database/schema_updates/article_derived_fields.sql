@@ -0,0 +1,8 @@
+-- Lookup of pre-rendered article content by source hash
+-- articles.content_hash identifies the content file body (and formatter
+-- version) articles.content was rendered from; the column itself and
+-- articles.word_count are added by DatabaseManager (COLUMN_UPDATES),
+-- since SQLite has no ADD COLUMN IF NOT EXISTS
+
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash
+    ON articles(content_hash);
@@ -0,0 +1,151 @@
+-- FTS5 full-text search index for articles, authors, categories and trending topics
+--
+-- Each index is an external-content FTS5 table over its source table, so the
+-- text is stored once. The original articles_fts was a standalone table with
+-- an invalid content_rowid option and plain DELETE triggers, which is what
+-- corrupted it; external-content tables must be maintained with the special
+-- 'delete' command carrying the OLD values, as the triggers below do.
+
+DROP TRIGGER IF EXISTS articles_fts_insert;
+DROP TRIGGER IF EXISTS articles_fts_delete;
+DROP TRIGGER IF EXISTS articles_fts_update;
+DROP TABLE IF EXISTS articles_fts;
+
+-- ================================
+-- ARTICLES
+-- ================================
+
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    title, excerpt, content, tags,
+    content='articles', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER articles_fts_ai AFTER INSERT ON articles
+BEGIN
+    INSERT INTO articles_fts(rowid, title, excerpt, content, tags)
+    VALUES (NEW.id, NEW.title, NEW.excerpt, NEW.content, NEW.tags);
+END;
+
+CREATE TRIGGER articles_fts_ad AFTER DELETE ON articles
+BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, excerpt, content, tags)
+    VALUES ('delete', OLD.id, OLD.title, OLD.excerpt, OLD.content, OLD.tags);
+END;
+
+CREATE TRIGGER articles_fts_au AFTER UPDATE OF title, excerpt, content, tags ON articles
+BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, excerpt, content, tags)
+    VALUES ('delete', OLD.id, OLD.title, OLD.excerpt, OLD.content, OLD.tags);
+    INSERT INTO articles_fts(rowid, title, excerpt, content, tags)
+    VALUES (NEW.id, NEW.title, NEW.excerpt, NEW.content, NEW.tags);
+END;
+
+-- ================================
+-- AUTHORS
+-- ================================
+
+CREATE VIRTUAL TABLE IF NOT EXISTS authors_fts USING fts5(
+    name, bio, expertise,
+    content='authors', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS authors_fts_ai AFTER INSERT ON authors
+BEGIN
+    INSERT INTO authors_fts(rowid, name, bio, expertise)
+    VALUES (NEW.id, NEW.name, NEW.bio, NEW.expertise);
+END;
+
+CREATE TRIGGER IF NOT EXISTS authors_fts_ad AFTER DELETE ON authors
+BEGIN
+    INSERT INTO authors_fts(authors_fts, rowid, name, bio, expertise)
+    VALUES ('delete', OLD.id, OLD.name, OLD.bio, OLD.expertise);
+END;
+
+CREATE TRIGGER IF NOT EXISTS authors_fts_au AFTER UPDATE OF name, bio, expertise ON authors
+BEGIN
+    INSERT INTO authors_fts(authors_fts, rowid, name, bio, expertise)
+    VALUES ('delete', OLD.id, OLD.name, OLD.bio, OLD.expertise);
+    INSERT INTO authors_fts(rowid, name, bio, expertise)
+    VALUES (NEW.id, NEW.name, NEW.bio, NEW.expertise);
+END;
+
+-- ================================
+-- CATEGORIES
+-- ================================
+
+CREATE VIRTUAL TABLE IF NOT EXISTS categories_fts USING fts5(
+    name, description,
+    content='categories', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS categories_fts_ai AFTER INSERT ON categories
+BEGIN
+    INSERT INTO categories_fts(rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS categories_fts_ad AFTER DELETE ON categories
+BEGIN
+    INSERT INTO categories_fts(categories_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS categories_fts_au AFTER UPDATE OF name, description ON categories
+BEGIN
+    INSERT INTO categories_fts(categories_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    INSERT INTO categories_fts(rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+-- ================================
+-- TRENDING TOPICS
+-- ================================
+
+CREATE VIRTUAL TABLE IF NOT EXISTS trending_fts USING fts5(
+    title, description, content, hashtag,
+    content='trending_topics', content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trending_fts_ai AFTER INSERT ON trending_topics
+BEGIN
+    INSERT INTO trending_fts(rowid, title, description, content, hashtag)
+    VALUES (NEW.id, NEW.title, NEW.description, NEW.content, NEW.hashtag);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trending_fts_ad AFTER DELETE ON trending_topics
+BEGIN
+    INSERT INTO trending_fts(trending_fts, rowid, title, description, content, hashtag)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.content, OLD.hashtag);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trending_fts_au AFTER UPDATE OF title, description, content, hashtag ON trending_topics
+BEGIN
+    INSERT INTO trending_fts(trending_fts, rowid, title, description, content, hashtag)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.content, OLD.hashtag);
+    INSERT INTO trending_fts(rowid, title, description, content, hashtag)
+    VALUES (NEW.id, NEW.title, NEW.description, NEW.content, NEW.hashtag);
+END;
+
+-- ================================
+-- RANKING AND INITIAL POPULATION
+-- ================================
+
+-- Column weights: titles/names dominate, body text counts least
+INSERT INTO articles_fts(articles_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 1.0, 3.0)');
+INSERT INTO authors_fts(authors_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0, 4.0)');
+INSERT INTO categories_fts(categories_fts, rank) VALUES ('rank', 'bm25(10.0, 2.0)');
+INSERT INTO trending_fts(trending_fts, rank) VALUES ('rank', 'bm25(10.0, 3.0, 1.0, 6.0)');
+
+INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');
+INSERT INTO authors_fts(authors_fts) VALUES ('rebuild');
+INSERT INTO categories_fts(categories_fts) VALUES ('rebuild');
+INSERT INTO trending_fts(trending_fts) VALUES ('rebuild');
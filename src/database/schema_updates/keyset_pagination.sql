@@ -0,0 +1,18 @@
+-- Indexes for keyset (cursor) pagination
+-- Articles page newest first on (IFNULL(publish_date, ''), id); the
+-- expression keeps undated articles last and matches the ORDER BY used
+-- by DatabaseManager.get_articles_page, so SQLite can seek instead of
+-- skipping OFFSET rows
+
+CREATE INDEX IF NOT EXISTS idx_articles_keyset
+    ON articles(IFNULL(publish_date, ''), id);
+
+CREATE INDEX IF NOT EXISTS idx_articles_category_keyset
+    ON articles(category_id, IFNULL(publish_date, ''), id);
+
+CREATE INDEX IF NOT EXISTS idx_articles_author_keyset
+    ON articles(author_id, IFNULL(publish_date, ''), id);
+
+-- Authors page alphabetically on (name, id)
+CREATE INDEX IF NOT EXISTS idx_authors_name_keyset
+    ON authors(name, id);
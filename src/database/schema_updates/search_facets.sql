@@ -0,0 +1,6 @@
+-- Covering index for article facet counts (SearchIndex.facets): the
+-- unfiltered count groups by (category_id, author_id) straight off this
+-- index instead of reading every article row
+
+CREATE INDEX IF NOT EXISTS idx_articles_facets
+    ON articles(category_id, author_id);
@@ -0,0 +1,47 @@
+-- Content-addressed store of encoded image variants
+-- One row (and one file) per (source hash, width, format, quality), shared by
+-- every image_variants row whose source image has the same bytes.
+-- ref_count is kept by the triggers below; rows at 0 are removed, with their
+-- files, by VariantStore.collect_garbage()
+--
+-- image_variants.store_id is added by VariantStore.ensure() before this runs
+
+CREATE TABLE IF NOT EXISTS variant_store (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_hash TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    quality INTEGER NOT NULL,
+    local_filename TEXT NOT NULL UNIQUE,   -- Relative to assets/images/responsive
+    file_size INTEGER DEFAULT 0,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(source_hash, width, format, quality)
+);
+
+CREATE INDEX IF NOT EXISTS idx_variant_store_unreferenced
+    ON variant_store(ref_count) WHERE ref_count <= 0;
+
+CREATE INDEX IF NOT EXISTS idx_image_variants_store
+    ON image_variants(store_id);
+
+CREATE TRIGGER IF NOT EXISTS image_variants_store_ai
+AFTER INSERT ON image_variants WHEN NEW.store_id IS NOT NULL
+BEGIN
+    UPDATE variant_store SET ref_count = ref_count + 1 WHERE id = NEW.store_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS image_variants_store_ad
+AFTER DELETE ON image_variants WHEN OLD.store_id IS NOT NULL
+BEGIN
+    UPDATE variant_store SET ref_count = ref_count - 1 WHERE id = OLD.store_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS image_variants_store_au
+AFTER UPDATE OF store_id ON image_variants
+WHEN OLD.store_id IS NOT NEW.store_id
+BEGIN
+    UPDATE variant_store SET ref_count = ref_count - 1 WHERE id = OLD.store_id;
+    UPDATE variant_store SET ref_count = ref_count + 1 WHERE id = NEW.store_id;
+END;
@@ -0,0 +1,249 @@
+"""
+Full-Text Search Index for Influencer News CMS
+Maintains FTS5 indexes over articles, authors, categories and trending topics
+and runs bm25-ranked queries with highlighted snippets
+"""
+
+import html
+import os
+import re
+import logging
+from typing import List, Dict, Any, Optional, Sequence
+
+try:
+    from .db_manager import DatabaseManager
+except ImportError:
+    from src.database.db_manager import DatabaseManager
+
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), 'schema_updates', 'fts5_search_index.sql')
+
+# Private-use markers survive html.escape and are swapped for <mark> afterwards,
+# so stored HTML never reaches the client unescaped
+_MARK_OPEN = '\ue000'
+_MARK_CLOSE = '\ue001'
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchIndex:
+    """FTS5 search index over all content types"""
+
+    # content type -> (fts table, source table, snippet column index)
+    INDEXES = {
+        'articles': ('articles_fts', 'articles', 2),
+        'authors': ('authors_fts', 'authors', 1),
+        'categories': ('categories_fts', 'categories', 1),
+        'trending': ('trending_fts', 'trending_topics', 1),
+    }
+
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        """
+        Initialize search index
+
+        Args:
+            db: Database manager to use (defaults to a new one)
+        """
+        self.db = db or DatabaseManager()
+        self.logger = logging.getLogger(__name__)
+        self._ready = False
+
+    def is_installed(self) -> bool:
+        """Check whether the FTS tables and sync triggers exist"""
+        names = {table for table, _, _ in self.INDEXES.values()}
+        names.add('articles_fts_ai')
+        placeholders = ', '.join('?' for _ in names)
+        rows = self.db.execute_query(
+            f"SELECT name FROM sqlite_master WHERE name IN ({placeholders})",
+            tuple(names)
+        )
+        return len(rows) == len(names)
+
+    def ensure(self) -> bool:
+        """
+        Install the FTS5 tables and triggers if they are missing
+
+        Returns:
+            True if the index is available
+        """
+        if self._ready:
+            return True
+        try:
+            if not self.is_installed():
+                self.logger.info("Installing FTS5 search index")
+                with open(SCHEMA_FILE, 'r') as f:
+                    script = f.read()
+                with self.db.get_connection() as conn:
+                    conn.executescript(script)
+            self._ready = True
+        except Exception as e:
+            self.logger.error(f"Search index unavailable: {e}")
+        return self._ready
+
+    def rebuild(self) -> None:
+        """Rebuild every FTS index from its source table"""
+        self.ensure()
+        with self.db.get_connection() as conn:
+            for fts_table, _, _ in self.INDEXES.values():
+                conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+                conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('optimize')")
+
+    @staticmethod
+    def build_match_query(query: str) -> str:
+        """
+        Turn free text into a safe FTS5 MATCH expression
+
+        Every word becomes a quoted prefix term and all terms must match,
+        so user input can never inject FTS5 operators or column filters.
+
+        Args:
+            query: Raw user query
+
+        Returns:
+            MATCH expression, or empty string when the query has no terms
+        """
+        tokens = _TOKEN_PATTERN.findall(query or '')
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    @staticmethod
+    def render_snippet(text: Optional[str]) -> str:
+        """Escape a snippet/highlight result and convert markers to <mark> tags"""
+        if not text:
+            return ''
+        # Snippets may cut through stored markup; drop tag fragments before escaping
+        text = re.sub(r'<[^<>]*>|<[^<>]*$', '', text)
+        text = html.escape(text)
+        return text.replace(_MARK_OPEN, '<mark>').replace(_MARK_CLOSE, '</mark>')
+
+    def search(self, content_type: str, query: str, select: str, joins: str = '',
+               limit: int = 20, offset: int = 0, snippet_tokens: int = 24,
+               after: Optional[Sequence] = None) -> List[Dict[str, Any]]:
+        """
+        Run a bm25-ranked search against one content type
+
+        Args:
+            content_type: Key of INDEXES ('articles', 'authors', ...)
+            query: Raw user query
+            select: Columns to return from the source table aliased as ``s``
+            joins: Extra JOIN clauses against ``s``
+            limit: Maximum rows
+            offset: Rows to skip
+            snippet_tokens: Maximum tokens in the snippet
+            after: (score, id) of the last row of the previous page; rows
+                are ordered by (score, id), so this replaces offset
+
+        Returns:
+            Rows with the selected columns plus ``score``, ``snippet`` and
+            ``highlighted_title`` (HTML-safe, matches wrapped in <mark>)
+        """
+        match = self.build_match_query(query)
+        if not match or not self.ensure():
+            return []
+
+        fts_table, source_table, snippet_column = self.INDEXES[content_type]
+        keyset = ''
+        keyset_params = ()
+        if after is not None:
+            keyset = (f"AND ({fts_table}.rank > ? OR "
+                      f"({fts_table}.rank = ? AND {fts_table}.rowid > ?))")
+            keyset_params = (after[0], after[0], after[1])
+        sql = f"""
+        SELECT {select},
+               {fts_table}.rank AS score,
+               snippet({fts_table}, {snippet_column}, ?, ?, '…', ?) AS snippet,
+               highlight({fts_table}, 0, ?, ?) AS highlighted_title
+        FROM {fts_table}
+        JOIN {source_table} s ON s.id = {fts_table}.rowid
+        {joins}
+        WHERE {fts_table} MATCH ? {keyset}
+        ORDER BY {fts_table}.rank, {fts_table}.rowid
+        LIMIT ? OFFSET ?
+        """
+        params = (_MARK_OPEN, _MARK_CLOSE, snippet_tokens, _MARK_OPEN, _MARK_CLOSE,
+                  match) + keyset_params + (limit, offset)
+        rows = self.db.execute_query(sql, params)
+
+        for row in rows:
+            row['snippet'] = self.render_snippet(row['snippet'])
+            row['highlighted_title'] = self.render_snippet(row['highlighted_title'])
+        return rows
+
+    def facets(self, query: str = '') -> Dict[str, Any]:
+        """
+        Total hits per content type and category/author facet counts
+        
+        Article hits are grouped by (category, author) in one pass over
+        the FTS matches; the other types are counted in one statement.
+        An empty query counts all articles from the category/author
+        indexes instead.
+        
+        Args:
+            query: Raw user query (empty for the unfiltered article list)
+            
+        Returns:
+            Dict with ``totals`` (articles, authors, categories, trending)
+            and ``facets`` (categories and authors, each a list of id,
+            slug, name and count, largest first)
+        """
+        totals = {'articles': 0, 'authors': 0, 'categories': 0, 'trending': 0}
+        result = {'totals': totals, 'facets': {'categories': [], 'authors': []}}
+        
+        if query and query.strip():
+            match = self.build_match_query(query)
+            if not match or not self.ensure():
+                return result
+            groups = self.db.execute_query(
+                """SELECT s.category_id, s.author_id, COUNT(*) AS hits
+                   FROM articles_fts JOIN articles s ON s.id = articles_fts.rowid
+                   WHERE articles_fts MATCH ?
+                   GROUP BY s.category_id, s.author_id""", (match,))
+            counts = self.db.execute_one(
+                """SELECT (SELECT COUNT(*) FROM authors_fts WHERE authors_fts MATCH ?) AS authors,
+                          (SELECT COUNT(*) FROM categories_fts WHERE categories_fts MATCH ?) AS categories,
+                          (SELECT COUNT(*) FROM trending_fts WHERE trending_fts MATCH ?) AS trending""",
+                (match, match, match))
+            totals.update(counts or {})
+        else:
+            groups = self.db.execute_query(
+                """SELECT category_id, author_id, COUNT(*) AS hits
+                   FROM articles GROUP BY category_id, author_id""")
+        
+        by_category: Dict[Any, int] = {}
+        by_author: Dict[Any, int] = {}
+        for group in groups:
+            totals['articles'] += group['hits']
+            by_category[group['category_id']] = by_category.get(group['category_id'], 0) + group['hits']
+            by_author[group['author_id']] = by_author.get(group['author_id'], 0) + group['hits']
+        
+        result['facets']['categories'] = self._facet_values('categories', by_category)
+        result['facets']['authors'] = self._facet_values('authors', by_author)
+        return result
+    
+    def _facet_values(self, table: str, counts: Dict[Any, int]) -> List[Dict[str, Any]]:
+        """Attach slug and name to facet counts, largest count first"""
+        if not counts:
+            return []
+        lookup = self.db.get_categories_by_ids if table == 'categories' else self.db.get_authors_by_ids
+        rows = {row['id']: row for row in lookup(list(counts))}
+        values = [{'id': key, 'slug': rows[key]['slug'], 'name': rows[key]['name'], 'count': count}
+                  for key, count in counts.items() if key in rows]
+        values.sort(key=lambda value: (-value['count'], value['name']))
+        return values
+    
+    def suggest(self, query: str, limit: int = 5) -> List[str]:
+        """Article titles and author names whose words start with the query terms"""
+        match = self.build_match_query(query)
+        if not match or not self.ensure():
+            return []
+
+        titles = self.db.execute_query(
+            "SELECT s.title AS value FROM articles_fts JOIN articles s ON s.id = articles_fts.rowid "
+            "WHERE articles_fts MATCH ? ORDER BY articles_fts.rank LIMIT ?",
+            (f"title : ({match})", limit)
+        )
+        names = self.db.execute_query(
+            "SELECT s.name AS value FROM authors_fts JOIN authors s ON s.id = authors_fts.rowid "
+            "WHERE authors_fts MATCH ? ORDER BY authors_fts.rank LIMIT ?",
+            (f"name : ({match})", limit)
+        )
+        return [row['value'] for row in titles + names]
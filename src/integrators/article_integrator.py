@@ -6,22 +6,32 @@ Integrates articles with progress callbacks for GUI
 """
 
 import datetime
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Union
 from .base_integrator import BaseIntegrator
-from ..models.article import Article
+from ..models.article import Article, count_words, estimate_read_time
 from ..models.author import Author
 from ..models.category import Category
+from ..utils.trusted_security import trusted_sanitizer
 
 
 class ArticleIntegrator(BaseIntegrator):
     """Enhanced article integrator with GUI support"""
     
+    # Bump when format_article_content() output changes, so stored HTML is rebuilt
+    FORMAT_VERSION = 1
+    
+    # Build graph dependencies of the homepage grid and search page data
+    LISTING_DEPENDENCIES = ['table:articles', 'table:authors', 'table:categories']
+    
     def __init__(self):
         super().__init__('articles', 'articles')
         # Authors will be loaded from database dynamically
         self._authors_cache = None
+        # Article template engine, reused across pages
+        self._template_engine = None
     
     def get_author_info(self, author_name: str, author_slug: str = '') -> Dict[str, Any]:
         """Get author information from database"""
@@ -82,59 +92,72 @@ class ArticleIntegrator(BaseIntegrator):
         
         return author_info
     
+    def article_page_data(self, article: Article) -> Dict[str, Any]:
+        """Page data dictionary create_content_page renders an article from"""
+        # Get author and category from database using relationships
+        author = article.get_author()
+        category = article.get_category()
+        
+        author_name = author.name if author else 'Unknown Author'
+        author_slug = author.slug if author else 'unknown-author'
+        category_name = category.name if category else 'Uncategorized'
+        category_slug = category.slug if category else 'uncategorized'
+        
+        author_info = self.get_author_info(author_name, author_slug)
+        
+        return {
+            'id': article.id,
+            'title': article.title,
+            'slug': article.slug,
+            'author': author_name,
+            'author_info': author_info,
+            'author_slug': author_slug,
+            'category': category_name,
+            'category_slug': category_slug,
+            'date': article.publish_date,
+            'content': article.content,
+            'excerpt': article.excerpt or '',
+            'image': f'assets/images/articles/article_{article.id}_hero.jpg',
+            'views': str(article.views),
+            'comments': str(article.comments),
+            'read_time': f'{article.read_time_minutes} min',
+            'tags': article.tags if isinstance(article.tags, list) else [],
+            'trending': article.trending
+        }
+    
     def sync_all(self):
         """Sync all articles from database"""
         self.update_progress("Starting article sync...")
         
         try:
-            # Get articles from database with pagination (default limit)
-            articles = Article.find_all(limit=50)  # Reasonable default limit
+            # Get articles from database with pagination (default limit),
+            # prefetching authors and categories in bulk
+            articles = Article.find_all_with_relations(limit=50)  # Reasonable default limit
             
             if not articles:
                 self.update_progress("No articles found in database")
                 return
                 
             # Convert to dictionaries for compatibility
-            article_dicts = []
-            for article in articles:
-                # Get author and category from database using relationships
-                author = article.get_author()
-                category = article.get_category()
-                
-                author_name = author.name if author else 'Unknown Author'
-                author_slug = author.slug if author else 'unknown-author'
-                category_name = category.name if category else 'Uncategorized'
-                category_slug = category.slug if category else 'uncategorized'
-                
-                author_info = self.get_author_info(author_name, author_slug)
-                
-                article_dict = {
-                    'id': article.id,
-                    'title': article.title,
-                    'slug': article.slug,
-                    'author': author_name,
-                    'author_info': author_info,
-                    'author_slug': author_slug,
-                    'category': category_name,
-                    'category_slug': category_slug,
-                    'date': article.publish_date,
-                    'content': article.content,
-                    'excerpt': article.excerpt or '',
-                    'image': f'assets/images/articles/article_{article.id}_hero.jpg',
-                    'views': str(article.views),
-                    'comments': str(article.comments),
-                    'read_time': f'{article.read_time_minutes} min',
-                    'tags': article.tags if isinstance(article.tags, list) else [],
-                    'trending': article.trending
-                }
-                article_dicts.append(article_dict)
+            article_dicts = [self.article_page_data(article) for article in articles]
                 
             # Create individual article pages
-            for article_dict in article_dicts:
-                self.create_content_page(article_dict)
+            self.render_pages(self.create_content_page, [
+                (str(self.integrated_dir / f"article_{article.slug}.html"),
+                 [f"row:articles:{article.id}",
+                  f"row:authors:{article.author_id}",
+                  f"row:categories:{article.category_id}",
+                  'file:templates/article.html',
+                  'file:src/utils/template_engine.py'],
+                 (article_dict,))
+                for article, article_dict in zip(articles, article_dicts)
+            ])
                 
             # Update listing pages (homepage, search)
-            self.update_listing_page(article_dicts)
+            self.render_output('index.html#articles-sync', self.LISTING_DEPENDENCIES,
+                               self.update_homepage, article_dicts)
+            self.render_output('search.html#articles-sync', self.LISTING_DEPENDENCIES,
+                               self.update_search_page, article_dicts)
             
             self.update_progress(f"Synced {len(articles)} articles successfully")
             
@@ -145,23 +168,30 @@ class ArticleIntegrator(BaseIntegrator):
     def parse_content_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse an article file"""
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
+            content = f.read()
         
         # Split into sections
-        sections = content.split('\n---\n')
-        if len(sections) < 2:
+        sections = self.split_article_file(content)
+        if not sections:
             raise ValueError(f"Invalid format in {file_path}. Missing '---' separator.")
         
         # Parse metadata
         metadata = self.parse_metadata_section(sections[0])
-        article_content = '\n---\n'.join(sections[1:]).strip()
+        article_content = sections[1]
         
         # Validate required fields
         required_fields = ['title', 'author', 'category', 'image', 'excerpt']
         self.validate_required_fields(metadata, required_fields, file_path)
         
-        # Process content sections
-        processed_content = self.format_article_content(article_content)
+        # Reuse the HTML of an article already rendered from this exact body
+        content_hash = self.hash_article_body(article_content)
+        rendered = Article.find_by_content_hash(content_hash)
+        if rendered:
+            processed_content = rendered.content
+            word_count = rendered.get_word_count()
+        else:
+            processed_content = self.format_article_content(article_content)
+            word_count = count_words(processed_content)
         
         # Get author info using database lookup
         author_info = self.get_author_info(metadata['author'])
@@ -175,16 +205,31 @@ class ArticleIntegrator(BaseIntegrator):
             'image': metadata['image'],
             'excerpt': metadata['excerpt'],
             'content': processed_content,
+            'content_hash': content_hash,
+            'word_count': word_count,
             'date': datetime.datetime.now().isoformat(),
             'views': str(self.generate_realistic_views()),
             'comments': str(self.generate_realistic_comments()),
-            'read_time': self.calculate_read_time(article_content),
+            'read_time': estimate_read_time(word_count),
             'trending': metadata.get('trending', 'false').lower() == 'true'
         }
     
+    @staticmethod
+    def split_article_file(text: str) -> Optional[tuple]:
+        """(metadata section, body) of an article file, or None without a '---' separator"""
+        sections = text.strip().split('\n---\n')
+        if len(sections) < 2:
+            return None
+        return sections[0], '\n---\n'.join(sections[1:]).strip()
+    
+    def hash_article_body(self, content: str) -> str:
+        """Hash of an article body, the formatter version and the sanitizer policy, keying its stored HTML"""
+        payload = f"{self.FORMAT_VERSION}\n{trusted_sanitizer.policy_version}\n{content}".encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
     def format_article_content(self, content: str) -> str:
         """Format article content with HTML"""
-        html_content = ""
+        html_parts = []
         
         # Process content sections
         content_sections = content.split('\n## ')
@@ -192,21 +237,21 @@ class ArticleIntegrator(BaseIntegrator):
         for i, section in enumerate(content_sections):
             if i == 0 and not section.startswith('## '):
                 # First section without heading
-                html_content += self.format_content_section('', section)
+                html_parts.append(self.format_content_section('', section))
             else:
                 lines = section.split('\n', 1)
                 heading = lines[0].strip()
                 body = lines[1].strip() if len(lines) > 1 else ''
-                html_content += self.format_content_section(heading, body)
+                html_parts.append(self.format_content_section(heading, body))
         
-        return html_content
+        return ''.join(html_parts)
     
     def format_content_section(self, heading: str, content: str) -> str:
         """Format a content section with proper HTML"""
-        html_content = ""
+        html_parts = []
         
         if heading:
-            html_content += f'<h2 class="text-2xl font-bold text-gray-900 mt-8 mb-4">{self.sanitize_text(heading)}</h2>\n'
+            html_parts.append(f'<h2 class="text-2xl font-bold text-gray-900 mt-8 mb-4">{self.sanitize_text(heading)}</h2>\n')
         
         # Process paragraphs and special formatting
         paragraphs = content.split('\n\n')
@@ -221,23 +266,23 @@ class ArticleIntegrator(BaseIntegrator):
                 quote_text = para[2:].strip()
                 if ' - ' in quote_text:
                     quote, author = quote_text.rsplit(' - ', 1)
-                    html_content += f'''<blockquote class="border-l-4 border-gray-300 pl-6 italic text-gray-700 my-8 text-lg">
+                    html_parts.append(f'''<blockquote class="border-l-4 border-gray-300 pl-6 italic text-gray-700 my-8 text-lg">
                         {self.sanitize_text(quote)}
                         <footer class="text-sm text-gray-500 mt-2">— {self.sanitize_text(author)}</footer>
-                    </blockquote>\n'''
+                    </blockquote>\n''')
                 else:
-                    html_content += f'<blockquote class="border-l-4 border-gray-300 pl-6 italic text-gray-700 my-8 text-lg">{self.sanitize_text(quote_text)}</blockquote>\n'
+                    html_parts.append(f'<blockquote class="border-l-4 border-gray-300 pl-6 italic text-gray-700 my-8 text-lg">{self.sanitize_text(quote_text)}</blockquote>\n')
             elif para.startswith('- '):
                 # Bullet list
                 items = [line[2:].strip() for line in para.split('\n') if line.strip().startswith('- ')]
-                html_content += '<ul class="list-disc pl-6 text-gray-700 mb-6 space-y-2">\n'
+                html_parts.append('<ul class="list-disc pl-6 text-gray-700 mb-6 space-y-2">\n')
                 for item in items:
-                    html_content += f'    <li>{self.sanitize_text(item)}</li>\n'
-                html_content += '</ul>\n'
+                    html_parts.append(f'    <li>{self.sanitize_text(item)}</li>\n')
+                html_parts.append('</ul>\n')
             elif para.startswith('[INFO]'):
                 # Info box
                 info_text = para[6:].strip()
-                html_content += f'''<div class="bg-indigo-50 border-l-4 border-indigo-400 p-6 my-8">
+                html_parts.append(f'''<div class="bg-indigo-50 border-l-4 border-indigo-400 p-6 my-8">
                     <div class="flex">
                         <div class="flex-shrink-0">
                             <svg class="h-5 w-5 text-indigo-400" fill="currentColor" viewBox="0 0 20 20">
@@ -248,12 +293,12 @@ class ArticleIntegrator(BaseIntegrator):
                             <p class="text-sm text-indigo-700">{self.sanitize_text(info_text)}</p>
                         </div>
                     </div>
-                </div>\n'''
+                </div>\n''')
             else:
                 # Regular paragraph
-                html_content += f'<p class="text-gray-700 mb-6">{self.sanitize_text(para)}</p>\n'
+                html_parts.append(f'<p class="text-gray-700 mb-6">{self.sanitize_text(para)}</p>\n')
         
-        return html_content
+        return ''.join(html_parts)
     
     def generate_realistic_views(self) -> int:
         """Return actual view count from database"""
@@ -265,50 +310,37 @@ class ArticleIntegrator(BaseIntegrator):
     
     def calculate_read_time(self, content: str) -> str:
         """Calculate estimated read time"""
-        word_count = len(content.split())
-        minutes = max(1, round(word_count / 200))  # Average 200 WPM
-        return f"{minutes} min"
+        return f"{estimate_read_time(count_words(content))} min"
     
-    def create_content_page(self, article: Dict[str, Any]):
-        """Create individual article page"""
+    def create_content_page(self, article: Union[Article, Dict[str, Any]]):
+        """Create individual article page (from an Article or its page data)"""
         # Get path manager for this location (using slug-based naming)
+        if isinstance(article, Article):
+            article = self.article_page_data(article)
         article_filename = f"article_{article['slug']}.html"
         path_manager = self.get_path_manager(f"integrated/articles/{article_filename}")
         base_path = path_manager.get_base_path()
         
-        # Use template engine for cleaner rendering
-        from ..utils.template_engine import ArticleTemplate
+        # Use template engine for cleaner rendering; templates are loaded
+        # once per process and reloaded only when the file changes
+        from ..utils.template_engine import ArticleTemplate, template_registry
         import os
         
-        template_engine = ArticleTemplate()
+        if self._template_engine is None:
+            self._template_engine = ArticleTemplate()
+        template_engine = self._template_engine
         
         # Try to use new template engine first
-        template_path = None
-        use_template_engine = False
-        
-        # Look for new template
-        new_template_paths = [
-            os.path.join(os.getcwd(), 'templates', 'article.html'),
-            os.path.join(os.path.dirname(os.getcwd()), 'templates', 'article.html')
-        ]
-        
-        for path in new_template_paths:
-            if os.path.exists(path):
-                template_path = path
-                use_template_engine = True
-                break
+        cwd = os.getcwd()
+        template_path = template_registry.find('article.html', [
+            os.path.join(cwd, 'templates'),
+            os.path.join(os.path.dirname(cwd), 'templates')
+        ])
+        use_template_engine = template_path is not None
         
         # Fall back to old template if new one not found
         if not template_path:
-            old_template_paths = [
-                os.path.join(os.getcwd(), 'article.html'),
-                os.path.join(os.path.dirname(os.getcwd()), 'article.html')
-            ]
-            
-            for path in old_template_paths:
-                if os.path.exists(path):
-                    template_path = path
-                    break
+            template_path = template_registry.find('article.html', [cwd, os.path.dirname(cwd)])
         
         if not template_path:
             raise FileNotFoundError("Article template not found")
@@ -317,8 +349,7 @@ class ArticleIntegrator(BaseIntegrator):
         if use_template_engine:
             template_engine.load_article_template(template_path)
         else:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
+            template = template_registry.get_source(template_path)
         
         # If using template engine, render with context
         if use_template_engine:
@@ -440,80 +471,68 @@ class ArticleIntegrator(BaseIntegrator):
         
         self.update_progress(f"Created article page: {article_filename}")
     
-    def _apply_site_branding(self, html_content: str) -> str:
-        """Apply site configuration to HTML content"""
-        try:
-            site_integrator = self.get_site_integrator()
-            branding = site_integrator.get_config_section('branding')
-            contact = site_integrator.get_config_section('contact')
-            
-            # Create replacements dictionary - use site config dynamically
-            replacements = {
-                # Site name replacements
-                'Influencer News': branding.get('site_name'),
-                # Title tag replacements
-                ' - Influencer News': f" - {branding.get('site_name')}",
-                # Header logo text
-                '>IN<': f">{branding.get('logo_text')}<",
-                # Header tagline
-                'Breaking stories • Real insights': branding.get('site_tagline'),
-                # Theme color replacements - comprehensive
-                '#4f46e5': branding.get('theme_color'),  # indigo-500
-                '#6366f1': branding.get('theme_color'),  # indigo-500 variant
-                '#312e81': branding.get('theme_color'),  # indigo-900
-                '#4338ca': branding.get('theme_color'),  # indigo-700
-                '#3730a3': branding.get('theme_color'),  # indigo-800
-                '#1e1b4b': branding.get('theme_color'),  # indigo-950
-                '#667eea': branding.get('theme_color'),  # custom indigo
-                # Specific Tailwind class replacements
-                'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'text-indigo-500': f"text-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'text-indigo-400': f"text-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'text-indigo-300': f"text-{self._get_theme_class_name(branding.get('theme_color'))}300",
-                'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'border-indigo-500': f"border-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'border-indigo-400': f"border-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'hover:bg-indigo-700': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-500': f"from-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
-                'border-indigo-400': f"border-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                # Footer copyright
-                '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
-                # Contact info in footer
-                'news@influencernews.com': contact.get('contact_email'),
-                '(555) 123-NEWS': contact.get('contact_phone'),
-                '123 Creator Avenue': contact.get('business_address'),
-                'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}"
-            }
-            
-            # Apply all replacements
-            for old_value, new_value in replacements.items():
-                if old_value and new_value:  # Only replace if both values exist and are not None
-                    html_content = html_content.replace(old_value, str(new_value))
-            
-            return html_content
-            
-        except Exception as e:
-            self.update_progress(f"Warning: Could not apply site branding to article: {e}")
-            return html_content
+    def _branding_replacements(self) -> Dict[str, Optional[str]]:
+        """Site-branding replacement table for article pages"""
+        site_integrator = self.get_site_integrator()
+        branding = site_integrator.get_config_section('branding')
+        contact = site_integrator.get_config_section('contact')
+        
+        # Create replacements dictionary - use site config dynamically
+        return {
+            # Site name replacements
+            'Influencer News': branding.get('site_name'),
+            # Title tag replacements
+            ' - Influencer News': f" - {branding.get('site_name')}",
+            # Header logo text
+            '>IN<': f">{branding.get('logo_text')}<",
+            # Header tagline
+            'Breaking stories • Real insights': branding.get('site_tagline'),
+            # Theme color replacements - comprehensive
+            '#4f46e5': branding.get('theme_color'),  # indigo-500
+            '#6366f1': branding.get('theme_color'),  # indigo-500 variant
+            '#312e81': branding.get('theme_color'),  # indigo-900
+            '#4338ca': branding.get('theme_color'),  # indigo-700
+            '#3730a3': branding.get('theme_color'),  # indigo-800
+            '#1e1b4b': branding.get('theme_color'),  # indigo-950
+            '#667eea': branding.get('theme_color'),  # custom indigo
+            # Specific Tailwind class replacements
+            'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'text-indigo-500': f"text-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'text-indigo-400': f"text-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'text-indigo-300': f"text-{self._get_theme_class_name(branding.get('theme_color'))}300",
+            'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'border-indigo-500': f"border-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'border-indigo-400': f"border-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'hover:bg-indigo-700': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-500': f"from-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
+            'border-indigo-400': f"border-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            # Footer copyright
+            '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
+            # Contact info in footer
+            'news@influencernews.com': contact.get('contact_email'),
+            '(555) 123-NEWS': contact.get('contact_phone'),
+            '123 Creator Avenue': contact.get('business_address'),
+            'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}"
+        }
     
     def _get_theme_class_name(self, theme_color: str) -> str:
         """Convert theme color to appropriate Tailwind class name"""
@@ -798,6 +817,7 @@ End your article with a strong conclusion that ties everything together and prov
                 content=content_data.get('content', ''),
                 excerpt=content_data.get('excerpt', ''),
                 read_time_minutes=content_data.get('read_time', 5),
+                content_hash=content_data.get('content_hash'),
                 tags_json=json.dumps(content_data.get('tags', [])),
                 seo_description=content_data.get('excerpt', '')
             )
@@ -834,7 +854,9 @@ End your article with a strong conclusion that ties everything together and prov
             
             if article.content != content_data.get('content', ''):
                 article.content = content_data['content']
+                article.read_time_minutes = content_data.get('read_time', 0)
                 updated_fields.append('content')
+            article.content_hash = content_data.get('content_hash', article.content_hash)
             
             if article.subtitle != content_data.get('excerpt', ''):
                 article.subtitle = content_data['excerpt']
@@ -930,8 +952,10 @@ End your article with a strong conclusion that ties everything together and prov
             article_dicts.append(article_dict)
         
         # Update homepage and search page
-        self.update_homepage(article_dicts)
-        self.update_search_page(article_dicts)
+        self.render_output('index.html#articles-listing', self.LISTING_DEPENDENCIES,
+                           self.update_homepage, article_dicts)
+        self.render_output('search.html#articles-listing', self.LISTING_DEPENDENCIES,
+                           self.update_search_page, article_dicts)
         
         self.update_progress(f"Updated listing pages with {len(article_dicts)} articles")
 
@@ -18,6 +18,9 @@ except ImportError:
 class AuthorIntegrator(BaseIntegrator):
     """Integrator for managing author profiles with database backend"""
     
+    # Build graph dependencies of the authors.html grid
+    LISTING_DEPENDENCIES = ['table:authors', 'table:articles:id,author_id', 'table:images']
+    
     def __init__(self):
         super().__init__('authors', 'authors')
         
@@ -41,8 +44,15 @@ class AuthorIntegrator(BaseIntegrator):
                 return
                 
             # Create individual author pages
-            for author in authors:
-                self.create_content_page(author)
+            self.render_pages(self.create_content_page, [
+                (str(self.integrated_dir / f"author_{author.slug}.html"),
+                 [f"row:authors:{author.id}",
+                  f"rows:articles:author_id={author.id}",
+                  'table:categories:id,name,slug,icon',
+                  'table:images'],
+                 (author,))
+                for author in authors
+            ])
                 
             # Update the authors listing page
             self.update_listing_page(authors)
@@ -792,11 +802,13 @@ class AuthorIntegrator(BaseIntegrator):
     def update_listing_page(self, authors: List[Author]):
         """Update the main authors listing page"""
         # This will be called from update_all_listing_pages
-        self._regenerate_authors_page()
+        self.render_output('authors.html#authors', self.LISTING_DEPENDENCIES,
+                           self._regenerate_authors_page)
     
     def update_all_listing_pages(self):
         """Update all author-related listing pages"""
-        self._regenerate_authors_page()
+        self.render_output('authors.html#authors', self.LISTING_DEPENDENCIES,
+                           self._regenerate_authors_page)
     
     def _regenerate_authors_page(self):
         """Regenerate the main authors.html page"""
@@ -866,73 +878,61 @@ class AuthorIntegrator(BaseIntegrator):
             with open(authors_html_path, 'w', encoding='utf-8') as f:
                 f.write(content)
     
-    def _apply_site_branding(self, html_content: str) -> str:
-        """Apply site configuration to HTML content"""
-        try:
-            site_integrator = self.get_site_integrator()
-            branding = site_integrator.get_config_section('branding')
-            contact = site_integrator.get_config_section('contact')
-            
-            # Create replacements dictionary - use site config dynamically
-            replacements = {
-                # Site name replacements
-                'Influencer News': branding.get('site_name'),
-                # Title tag replacements
-                'Author Profile | Influencer News': f"Author Profile | {branding.get('site_name')}",
-                # Header logo text
-                '>IN<': f">{branding.get('logo_text')}<",
-                # Header tagline
-                'Breaking stories • Real insights': branding.get('site_tagline'),
-                # Theme color replacements
-                '#4f46e5': branding.get('theme_color'),
-                '#667eea': branding.get('theme_color'),
-                # Convert specific indigo classes to use theme color
-                'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
-                'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'focus:ring-indigo-500': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'to-purple-800': f"to-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                # Footer copyright
-                '© 2024 Influencer News': f"© 2025 {branding.get('site_name')}",
-                # Contact info updates
-                'news@influencernews.com': contact.get('contact_email'),
-                '(555) 123-NEWS': contact.get('contact_phone'),
-                '123 Creator Avenue': contact.get('business_address'),
-                'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}",
-                'editorial@influencernews.com': contact.get('contact_email')
-            }
-            
-            # Apply all replacements
-            for old_value, new_value in replacements.items():
-                if old_value and new_value:  # Only replace if both values exist and are not None
-                    html_content = html_content.replace(old_value, str(new_value))
-            
-            return html_content
-            
-        except Exception as e:
-            print(f"Warning: Could not apply site branding to author page: {e}")
-            return html_content
+    def _branding_replacements(self) -> Dict[str, Optional[str]]:
+        """Site-branding replacement table for author pages"""
+        site_integrator = self.get_site_integrator()
+        branding = site_integrator.get_config_section('branding')
+        contact = site_integrator.get_config_section('contact')
+        
+        # Create replacements dictionary - use site config dynamically
+        return {
+            # Site name replacements
+            'Influencer News': branding.get('site_name'),
+            # Title tag replacements
+            'Author Profile | Influencer News': f"Author Profile | {branding.get('site_name')}",
+            # Header logo text
+            '>IN<': f">{branding.get('logo_text')}<",
+            # Header tagline
+            'Breaking stories • Real insights': branding.get('site_tagline'),
+            # Theme color replacements
+            '#4f46e5': branding.get('theme_color'),
+            '#667eea': branding.get('theme_color'),
+            # Convert specific indigo classes to use theme color
+            'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
+            'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'focus:ring-indigo-500': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'to-purple-800': f"to-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            # Footer copyright
+            '© 2024 Influencer News': f"© 2025 {branding.get('site_name')}",
+            # Contact info updates
+            'news@influencernews.com': contact.get('contact_email'),
+            '(555) 123-NEWS': contact.get('contact_phone'),
+            '123 Creator Avenue': contact.get('business_address'),
+            'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}",
+            'editorial@influencernews.com': contact.get('contact_email')
+        }
     
     def _get_theme_class_name(self, theme_color: str) -> str:
         """Convert theme color to appropriate Tailwind class name"""
@@ -10,9 +10,13 @@ import sys
 import json
 import datetime
 import html
+import inspect
+import time
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 try:
     from ..database import DatabaseManager
@@ -24,17 +28,31 @@ try:
     from ..utils.trusted_security import trusted_sanitizer, trusted_validator
     from ..utils.config import config
     from ..utils.security_middleware import security_middleware
+    from ..utils.multi_replace import MultiReplacer
+    from .render_pool import get_render_workers, render_in_pool, parse_in_pool
+    from .sync_manifest import SyncManifest, hash_file
 except ImportError:
     from src.models import Article, Author, Category, TrendingTopic, Image
     from src.utils import ImageManager, PathManager
     from src.utils.trusted_security import trusted_sanitizer, trusted_validator
     from src.utils.config import config
     from src.utils.security_middleware import security_middleware
+    from src.utils.multi_replace import MultiReplacer
+    from src.integrators.render_pool import get_render_workers, render_in_pool, parse_in_pool
+    from src.integrators.sync_manifest import SyncManifest, hash_file
 
 
 class BaseIntegrator(ABC):
     """Base class for all content integrators using SQLite database"""
     
+    # Content type -> (table, model) synced from content files
+    CONTENT_TABLES = {
+        'articles': ('articles', Article),
+        'authors': ('authors', Author),
+        'categories': ('categories', Category),
+        'trending': ('trending_topics', TrendingTopic)
+    }
+    
     def __init__(self, content_type: str, content_dir: str):
         self.content_type = content_type
         self.content_dir = Path(config.get_content_dir(content_dir))
@@ -51,9 +69,33 @@ class BaseIntegrator(ABC):
         # Initialize site integrator for site-wide configuration
         self._site_integrator = None
         
+        # Compiled branding replacer and branded templates, rebuilt when
+        # the site configuration changes
+        self._branding_replacer: Optional[MultiReplacer] = None
+        self._branding_config = None
+        self._branded_templates: Dict[tuple, str] = {}
+        
         # Progress callback for GUI updates
         self.progress_callback: Optional[Callable] = None
         
+        # Build graph for incremental syncs (set by ContentSyncTool)
+        self.build_graph = None
+        
+        # Page render worker count (None = build.render_workers) and the
+        # timing of the last render_pages() call
+        self.render_workers: Optional[int] = None
+        self.render_stats: Dict[str, Any] = {}
+        
+        # Files per file-sync transaction (None = build.sync_chunk_size,
+        # 0 = one transaction) and the write counters of the last sync
+        self.sync_chunk_size: Optional[int] = None
+        self.write_stats: Dict[str, Any] = {}
+        
+        # Content file parse worker count (None = build.parse_workers) and
+        # the pool size used by the last file sync
+        self.parse_workers: Optional[int] = None
+        self.parse_stats: Dict[str, Any] = {}
+        
         # Common category colors
         self.category_colors = {
             'business': 'green',
@@ -244,6 +286,91 @@ class BaseIntegrator(ABC):
     <!-- Mobile Touch Enhancements -->
     <script src="../assets/js/mobile-touch.js" nonce="{nonce}"></script>'''
     
+    def page_dependencies(self, dependencies: List[str]) -> List[str]:
+        """
+        Add the dependencies shared by every generated page
+        
+        Every page also depends on the source files of this integrator and
+        its base classes (inline templates, shared header, footer and card
+        markup) and on site_config (branding).
+        """
+        source_files = []
+        for cls in type(self).__mro__:
+            if issubclass(cls, BaseIntegrator):
+                source_file = os.path.relpath(inspect.getsourcefile(cls))
+                if source_file not in source_files:
+                    source_files.append(source_file)
+        return list(dependencies) + [f"file:{source_file}" for source_file in source_files] + [
+            'table:site_config:config_type,config_key,config_value,is_active'
+        ]
+    
+    def render_output(self, output: str, dependencies: List[str], render: Callable, *args) -> bool:
+        """
+        Render a generated page through the build graph
+        
+        Args:
+            output: Output path, with an optional '#section' suffix
+            dependencies: BuildGraph dependency keys for the page
+            render: Callable that writes the page
+            
+        Returns:
+            True if the page was rendered, False if it was skipped
+        """
+        if self.build_graph is None:
+            render(*args)
+            return True
+        return self.build_graph.render(output, self.page_dependencies(dependencies), render, *args)
+    
+    def render_pages(self, render: Callable, pages: List[tuple]) -> Dict[str, Any]:
+        """
+        Render many independent pages, in parallel worker processes when
+        there are enough of them
+        
+        Args:
+            render: Bound page method, e.g. self.create_category_page
+            pages: (output, dependencies, args) for each page
+            
+        Returns:
+            Render stats: pages, seconds, workers and pages_per_second
+        """
+        start = time.perf_counter()
+        
+        pending = []
+        for output, dependencies, args in pages:
+            if self.build_graph is not None:
+                dependencies = self.page_dependencies(dependencies)
+                if not self.build_graph.needs_render(output, dependencies):
+                    continue
+                pending.append((output, dependencies, args, self.build_graph.output_mtime(output)))
+            else:
+                pending.append((output, dependencies, args, None))
+        
+        workers = min(get_render_workers(self.render_workers), len(pending))
+        if workers > 1 and len(pending) >= config.get('build.parallel_threshold', 8):
+            render_in_pool(type(self), render.__name__, [page[2] for page in pending], workers)
+        else:
+            workers = 1
+            for _, _, args, _ in pending:
+                render(*args)
+        
+        if self.build_graph is not None:
+            for output, dependencies, _, before in pending:
+                self.build_graph.finish(output, dependencies, before)
+        
+        seconds = time.perf_counter() - start
+        self.render_stats = {
+            'pages': len(pending),
+            'seconds': seconds,
+            'workers': workers,
+            'pages_per_second': len(pending) / seconds if seconds > 0 else 0.0
+        }
+        if pending:
+            self.update_progress(
+                f"Rendered {len(pending)} {self.content_type} pages in {seconds:.2f}s "
+                f"({self.render_stats['pages_per_second']:.1f} pages/s, {workers} workers)"
+            )
+        return self.render_stats
+    
     def get_path_manager(self, current_location: str) -> PathManager:
         """Get path manager for current page location"""
         return PathManager.from_page_location(current_location)
@@ -266,6 +393,44 @@ class BaseIntegrator(ABC):
             return site_integrator.get_config_by_type(config_type)
         return site_integrator.get_site_config()
     
+    def _branding_replacements(self) -> Dict[str, Optional[str]]:
+        """Site-branding replacement table (old text -> new text); subclasses extend"""
+        return {}
+    
+    def get_branding_replacer(self) -> MultiReplacer:
+        """Branding replacer, compiled once per site configuration"""
+        site_config = self.get_site_integrator().get_site_config()
+        if self._branding_replacer is None or self._branding_config is not site_config:
+            self._branding_replacer = MultiReplacer(self._branding_replacements())
+            self._branding_config = site_config
+            self._branded_templates = {}
+        return self._branding_replacer
+    
+    def _apply_site_branding(self, html_content: str) -> str:
+        """Apply site configuration to HTML content in a single pass"""
+        try:
+            return self.get_branding_replacer().apply(html_content)
+        except Exception as e:
+            print(f"Warning: Could not apply site branding to {self.content_type} page: {e}")
+            return html_content
+    
+    def get_branded_template(self, build: Callable[..., str], *args) -> str:
+        """
+        Template text with site branding already applied
+        
+        The template is built and branded once per site configuration and
+        arguments, so pages only fill in their own placeholders.
+        
+        Args:
+            build: Method returning the unbranded template
+            *args: Arguments for build (e.g. base_path)
+        """
+        self.get_branding_replacer()
+        key = (build.__name__,) + args
+        if key not in self._branded_templates:
+            self._branded_templates[key] = self._apply_site_branding(build(*args))
+        return self._branded_templates[key]
+    
     def generate_site_header(self, current_page: str = '', page_title: str = None, path_prefix: str = '') -> str:
         """Generate standardized site header"""
         site_integrator = self.get_site_integrator()
@@ -284,14 +449,17 @@ class BaseIntegrator(ABC):
     def generate_navigation_html(self, current_location: str, active_page: str = '') -> str:
         """Generate navigation HTML with proper paths"""
         path_manager = self.get_path_manager(current_location)
-        nav_links = path_manager.generate_navigation_links()
         
-        nav_items = []
-        for page, link in nav_links.items():
-            active_class = 'active' if page == active_page else ''
-            nav_items.append(f'<a href="{link}" class="nav-link {active_class}">{page.title()}</a>')
+        def build() -> str:
+            nav_items = []
+            for page, link in path_manager.generate_navigation_links().items():
+                active_class = 'active' if page == active_page else ''
+                nav_items.append(f'<a href="{link}" class="nav-link {active_class}">{page.title()}</a>')
+            return ' | '.join(nav_items)
         
-        return ' | '.join(nav_items)
+        # Links only depend on the page depth, so pages at the same depth share it
+        return self.get_site_integrator().get_fragment(
+            ('navigation', path_manager.get_base_path(), active_page), build)
     
     def convert_image_urls(self, content: Dict[str, Any], content_type: str, 
                           content_id: int, slug: Optional[str] = None) -> Dict[str, Any]:
@@ -397,96 +565,153 @@ class BaseIntegrator(ABC):
         return processed_count
     
     def sync_with_files(self) -> Dict[str, int]:
-        """Sync database content with content files (bidirectional)"""
+        """
+        Sync database content with content files (bidirectional)
+        
+        Files whose size and mtime match the sync manifest, and whose row
+        is unchanged since, are skipped without being read; files whose
+        bytes hash to the recorded value are skipped without being parsed.
+        Rows that no file claims (by slug or recorded id) are removed.
+        
+        Files to ingest are parsed by parse_files(), in worker processes
+        for large drops, while this process does the database writes in a
+        unit of work committed every build.sync_chunk_size files; a failing
+        file only rolls back its own writes, and manifest entries are saved
+        only for committed chunks.
+        """
         self.update_progress("Starting bidirectional content sync...", 0)
         
-        # Get all .txt files in content directory
-        txt_files = list(self.content_dir.glob("*.txt"))
-        file_names = {f.stem for f in txt_files}  # Remove .txt extension
+        manifest = SyncManifest(self.content_type)
+        
+        # Get all .txt files in content directory (scandir: no Path per file)
+        with os.scandir(self.content_dir) as entries:
+            txt_files = {entry.name: entry for entry in entries
+                         if entry.name.endswith('.txt') and entry.is_file()}
+        file_names = sorted(txt_files)
+        manifest.prune(file_names)
         
-        # Get existing content from database based on content type
-        existing_content = self.get_existing_content()
-        existing_slugs = {item.slug for item in existing_content}
-        existing_by_slug = {item.slug: item for item in existing_content}
+        # id -> (slug, updated_at) for every row of this content type
+        existing_rows = self.get_existing_rows()
+        ids_by_slug = {slug: row_id for row_id, (slug, _) in existing_rows.items()}
         
         stats = {'added': 0, 'removed': 0, 'updated': 0, 'skipped': 0}
         
-        # Process files (add new, update existing)
-        for idx, file_path in enumerate(txt_files):
-            progress = (idx / len(txt_files)) * 50  # First half of progress
-            
+        # Slugs of files parsed this run, which keep their rows even when
+        # processing them failed
+        parsed_slugs = set()
+        
+        # Decide from the manifest which files need parsing
+        pending = []
+        for name in file_names:
             try:
-                self.update_progress(f"Processing file: {file_path.name}", progress)
-                
-                # Parse content file
-                content_data = self.parse_content_file(file_path)
-                content_data['filename'] = file_path.name
+                stat = txt_files[name].stat()
+                entry = manifest.get(name)
+                tracked = (entry is not None and
+                           existing_rows.get(entry['id']) == (entry['slug'], entry['row_version']))
+                if tracked and manifest.stat_matches(entry, stat):
+                    stats['skipped'] += 1
+                    continue
                 
-                # Generate slug from filename or content
-                file_slug = file_path.stem
-                content_slug = self.generate_slug_from_content(content_data)
+                file_path = self.content_dir / name
+                digest = hash_file(file_path)
+                if tracked and entry['hash'] == digest:
+                    # Touched but identical; refresh the recorded stat
+                    manifest.record(name, stat, digest, entry['slug'], entry['id'], entry['row_version'])
+                    stats['skipped'] += 1
+                    continue
                 
-                # Check if content exists (by slug or filename)
-                existing_item = existing_by_slug.get(content_slug) or existing_by_slug.get(file_slug)
+                pending.append((file_path, stat, digest, entry if tracked else None))
+            except OSError as e:
+                self.update_progress(f"Error processing {name}: {str(e)}")
+        
+        chunk_size = self.sync_chunk_size
+        if chunk_size is None:
+            chunk_size = config.get('build.sync_chunk_size', 500)
+        
+        # Workers parse ahead while this process writes, in file order
+        with self.parse_files([file_path for file_path, _, _, _ in pending]) as parsed, \
+                self.db.unit_of_work(chunk_size) as uow:
+            for idx, ((file_path, stat, digest, entry), (content_data, error)) in enumerate(zip(pending, parsed)):
+                progress = (idx / len(pending)) * 50  # First half of progress
+                name = file_path.name
                 
-                if existing_item:
-                    # Content exists - check if it needs updating
-                    if self.content_has_changed(existing_item, content_data, file_path):
-                        # Content has changed - update it
-                        updated = self.update_existing_content(existing_item, content_data)
-                        if updated:
-                            stats['updated'] += 1
-                            self.update_progress(f"Updated: {content_data.get('name', content_data.get('title', file_slug))}", progress)
+                try:
+                    if error is not None:
+                        raise ValueError(error)
+                    
+                    with uow.item():
+                        self.update_progress(f"Processing file: {name}", progress)
+                        content_data['filename'] = name
+                        
+                        # Generate slug from filename or content
+                        file_slug = file_path.stem
+                        content_slug = self.generate_slug_from_content(content_data)
+                        parsed_slugs.add(content_slug)
+                        title = content_data.get('name', content_data.get('title', file_slug))
+                        
+                        # Check if content exists (by slug or filename)
+                        existing_id = ids_by_slug.get(content_slug) or ids_by_slug.get(file_slug)
+                        existing_item = self.find_content_by_id(existing_id) if existing_id else None
+                        update_failed = False
+                        
+                        if existing_item:
+                            # A tracked file whose bytes changed has changed; otherwise compare fields
+                            changed = ((entry is not None and entry['id'] == existing_id) or
+                                       self.content_has_changed(existing_item, content_data, file_path))
+                            if changed:
+                                # Content has changed - update it
+                                updated = self.update_existing_content(existing_item, content_data)
+                                if updated:
+                                    stats['updated'] += 1
+                                    self.update_progress(f"Updated: {title}", progress)
+                                else:
+                                    # Left out of the manifest so the next sync retries it
+                                    update_failed = True
+                                    stats['skipped'] += 1
+                                    self.update_progress(f"Update failed: {title}", progress)
+                            else:
+                                stats['skipped'] += 1
+                                self.update_progress(f"No changes: {title}", progress)
                         else:
-                            stats['skipped'] += 1
-                            self.update_progress(f"Update failed: {content_data.get('name', content_data.get('title', file_slug))}", progress)
-                    else:
-                        stats['skipped'] += 1
-                        self.update_progress(f"No changes: {content_data.get('name', content_data.get('title', file_slug))}", progress)
-                else:
-                    # New content - add it
-                    processed = self.process_content_by_type(content_data)
-                    if processed:
-                        stats['added'] += 1
-                        self.update_progress(f"Added: {content_data.get('name', content_data.get('title', file_slug))}", progress)
+                            # New content - add it
+                            processed = self.process_content_by_type(content_data)
+                            if processed:
+                                stats['added'] += 1
+                                self.update_progress(f"Added: {title}", progress)
+                        
+                        row = self.find_content_row(existing_id, content_slug, file_slug)
+                        manifest.forget(name)
+                        if row and not update_failed:
+                            uow.on_commit(partial(manifest.record, name, stat, digest,
+                                                  row['slug'], row['id'], row['updated_at']))
                 
-            except Exception as e:
-                self.update_progress(f"Error processing {file_path.name}: {str(e)}", progress)
-                continue
-        
-        # Remove content that no longer has files
-        for idx, item in enumerate(existing_content):
-            progress = 50 + (idx / len(existing_content)) * 50  # Second half of progress
+                except Exception as e:
+                    self.update_progress(f"Error processing {name}: {str(e)}", progress)
+                    continue
             
-            # Check if this item has a corresponding file
-            item_has_file = (item.slug in file_names or 
-                           any(f.stem == item.slug for f in txt_files) or
-                           self.content_has_source_file(item, txt_files))
+            # Remove content that no longer has files: rows whose slug is not a
+            # file name, parsed or recorded for a file, and whose id no file produced
+            claimed_slugs = {name[:-len('.txt')] for name in file_names} | parsed_slugs
+            claimed_slugs.update(entry['slug'] for entry in manifest.entries.values())
+            claimed_ids = {entry['id'] for entry in manifest.entries.values()}
+            orphan_ids = [row_id for row_id, (slug, _) in existing_rows.items()
+                          if slug not in claimed_slugs and row_id not in claimed_ids]
             
-            if not item_has_file:
-                try:
-                    self.update_progress(f"Removing orphaned: {getattr(item, 'name', getattr(item, 'title', item.slug))}", progress)
-                    
-                    # Remove generated HTML files first
-                    self.remove_generated_files(item)
-                    
-                    # Then remove from database
-                    success = item.delete()
-                    if success:
-                        stats['removed'] += 1
-                        self.update_progress(f"Removed: {getattr(item, 'name', getattr(item, 'title', item.slug))}", progress)
-                except Exception as e:
-                    if "FOREIGN KEY constraint failed" in str(e):
-                        # Show what's preventing deletion
-                        references = self.find_foreign_key_references(item)
-                        ref_info = ", ".join([f"{ref['count']} {ref['table']}" for ref in references])
-                        self.update_progress(f"Cannot remove {getattr(item, 'name', getattr(item, 'title', item.slug))} - referenced by: {ref_info}", progress)
-                    else:
-                        self.update_progress(f"Error removing {item.slug}: {str(e)}", progress)
+            if orphan_ids:
+                self.remove_orphans(uow, orphan_ids, stats)
+        
+        self.write_stats = dict(uow.stats)
+        
+        try:
+            manifest.save()
+        except OSError as e:
+            self.update_progress(f"Could not save sync manifest: {e}")
         
         # Clean up any orphaned HTML files that don't have database entries
         self.update_progress("Cleaning up orphaned files...", 90)
-        orphaned_count = self.clean_orphaned_html_files()
+        if stats['removed']:
+            existing_rows = self.get_existing_rows()
+        orphaned_count = self.clean_orphaned_html_files([slug for slug, _ in existing_rows.values()])
         if orphaned_count > 0:
             stats['removed'] += orphaned_count
             self.update_progress(f"Removed {orphaned_count} orphaned HTML files", 90)
@@ -499,6 +724,107 @@ class BaseIntegrator(ABC):
         self.update_progress(f"Sync complete: +{stats['added']} -{stats['removed']} ={stats['skipped']}", 100)
         return stats
     
+    def remove_orphans(self, uow, orphan_ids: List[int], stats: Dict[str, int]) -> None:
+        """
+        Delete rows that no content file claims, and their generated pages
+        
+        All rows go in one executemany DELETE; if any is still referenced
+        that statement is rolled back and rows are deleted one at a time,
+        so the references blocking each can be reported.
+        
+        Args:
+            uow: Unit of work of the running file sync
+            orphan_ids: Row ids to remove
+            stats: Sync counters ('removed' is incremented)
+        """
+        items = [item for item in map(self.find_content_by_id, orphan_ids) if item is not None]
+        table, _ = self.CONTENT_TABLES[self.content_type]
+        
+        try:
+            with uow.item() as conn:
+                conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(item.id,) for item in items])
+            removed = items
+        except Exception:
+            removed = []
+            for idx, item in enumerate(items):
+                progress = 50 + (idx / len(items)) * 40  # Second half of progress
+                label = getattr(item, 'name', getattr(item, 'title', item.slug))
+                try:
+                    with uow.item():
+                        # delete() reports its own errors; look up what blocks it
+                        if item.delete():
+                            removed.append(item)
+                        else:
+                            references = self.find_foreign_key_references(item)
+                            ref_info = ", ".join([f"{ref['count']} {ref['table']}" for ref in references])
+                            self.update_progress(f"Cannot remove {label} - referenced by: {ref_info}", progress)
+                except Exception as e:
+                    self.update_progress(f"Error removing {item.slug}: {str(e)}", progress)
+        
+        for item in removed:
+            stats['removed'] += 1
+            self.update_progress(f"Removed: {getattr(item, 'name', getattr(item, 'title', item.slug))}", 90)
+            # Pages go once the deletion is committed
+            uow.on_commit(partial(self.remove_generated_files, item))
+
+    @contextmanager
+    def parse_files(self, paths: List[Path]):
+        """
+        Parse content files, across worker processes when there are enough
+        
+        Args:
+            paths: Content files to parse
+            
+        Yields:
+            Iterator of (parsed data, None) or (None, error message), in path order
+        """
+        workers = min(get_render_workers(self.parse_workers, 'build.parse_workers'), len(paths))
+        self.parse_stats = {'files': len(paths), 'workers': 1}
+        if workers > 1 and len(paths) >= config.get('build.parse_parallel_threshold', 200):
+            self.parse_stats['workers'] = workers
+            with parse_in_pool(type(self), paths, workers) as parsed:
+                yield parsed
+        else:
+            yield map(self._parse_or_error, paths)
+    
+    def _parse_or_error(self, file_path: Path) -> tuple:
+        """parse_content_file() as a (data, error message) pair"""
+        try:
+            return self.parse_content_file(file_path), None
+        except Exception as e:
+            return None, str(e)
+    
+    def get_existing_rows(self) -> Dict[int, tuple]:
+        """id -> (slug, updated_at) for every row of this content type"""
+        if self.content_type not in self.CONTENT_TABLES:
+            return {}
+        table, _ = self.CONTENT_TABLES[self.content_type]
+        with self.db.get_connection() as conn:
+            return {row[0]: (row[1], row[2])
+                    for row in conn.execute(f"SELECT id, slug, updated_at FROM {table}")}
+    
+    def find_content_by_id(self, row_id: int):
+        """Load one content item by id"""
+        if self.content_type not in self.CONTENT_TABLES:
+            return None
+        _, model = self.CONTENT_TABLES[self.content_type]
+        return model.find_by_id(row_id)
+    
+    def find_content_row(self, row_id: Optional[int], *slugs: str) -> Optional[Dict[str, Any]]:
+        """id, slug and updated_at of a row, by id or else by the first matching slug"""
+        if self.content_type not in self.CONTENT_TABLES:
+            return None
+        table, _ = self.CONTENT_TABLES[self.content_type]
+        if row_id:
+            row = self.db.execute_one(f"SELECT id, slug, updated_at FROM {table} WHERE id = ?", (row_id,))
+            if row:
+                return row
+        for slug in slugs:
+            row = self.db.execute_one(f"SELECT id, slug, updated_at FROM {table} WHERE slug = ?", (slug,))
+            if row:
+                return row
+        return None
+    
     def find_foreign_key_references(self, item):
         """Find what database records reference this item, preventing deletion"""
         references = []
@@ -579,25 +905,6 @@ class BaseIntegrator(ABC):
         # Fallback to filename
         return content_data.get('filename', '').replace('.txt', '')
     
-    def content_has_source_file(self, item, txt_files) -> bool:
-        """Check if content item has a corresponding source file"""
-        # Check by slug
-        for file_path in txt_files:
-            if file_path.stem == item.slug:
-                return True
-                
-        # Check by parsing each file to see if it matches this content
-        for file_path in txt_files:
-            try:
-                content_data = self.parse_content_file(file_path)
-                content_slug = self.generate_slug_from_content(content_data)
-                if content_slug == item.slug:
-                    return True
-            except:
-                continue
-                
-        return False
-    
     def process_content_by_type(self, content_data: Dict[str, Any]) -> bool:
         """Process content based on content type"""
         if self.content_type == 'articles':
@@ -755,7 +1062,7 @@ class BaseIntegrator(ABC):
         try:
             if self.content_type == 'articles':
                 # Remove article page
-                article_file = Path(config.get_integrated_dir("articles")) / f"article_{item.id}.html"
+                article_file = Path(config.get_integrated_dir("articles")) / f"article_{item.slug}.html"
                 if article_file.exists():
                     article_file.unlink()
                     self.update_progress(f"Removed {article_file}")
@@ -784,23 +1091,24 @@ class BaseIntegrator(ABC):
         except Exception as e:
             self.update_progress(f"Error removing generated files for {item.slug}: {str(e)}")
     
-    def clean_orphaned_html_files(self) -> int:
+    def clean_orphaned_html_files(self, existing_slugs: Optional[List[str]] = None) -> int:
         """Remove HTML files that don't have corresponding database entries"""
         try:
-            # Get existing content from database
-            existing_content = self.get_existing_content()
+            # Slugs of every existing row (not just the first page of models)
+            if existing_slugs is None:
+                existing_slugs = [slug for slug, _ in self.get_existing_rows().values()]
             
             # Create set of valid file names
             valid_files = set()
-            for item in existing_content:
+            for slug in existing_slugs:
                 if self.content_type == 'articles':
-                    valid_files.add(f"article_{item.id}.html")
+                    valid_files.add(f"article_{slug}.html")
                 elif self.content_type == 'authors':
-                    valid_files.add(f"author_{item.slug}.html")
+                    valid_files.add(f"author_{slug}.html")
                 elif self.content_type == 'categories':
-                    valid_files.add(f"category_{item.slug}.html")
+                    valid_files.add(f"category_{slug}.html")
                 elif self.content_type == 'trending':
-                    valid_files.add(f"trend_{item.slug}.html")
+                    valid_files.add(f"trend_{slug}.html")
             
             # Check integrated directory for orphaned files
             integrated_path = Path("integrated") / self.content_type
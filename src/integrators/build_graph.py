@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Build Graph
+===========
+Records which database rows, templates and source files each generated
+page depends on, so an incremental sync only re-renders affected pages
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+try:
+    from ..database import DatabaseManager
+    from ..utils.config import config
+except ImportError:
+    from src.database import DatabaseManager
+    from src.utils.config import config
+
+
+# Tables that dependency keys may reference
+TRACKED_TABLES = {'articles', 'authors', 'categories', 'trending_topics',
+                  'images', 'site_config'}
+
+
+def _digest(value: Any) -> str:
+    """Short stable hash of a Python value"""
+    return hashlib.blake2b(repr(value).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class BuildGraph:
+    """
+    Output -> dependency fingerprints, persisted between syncs
+
+    Dependency keys:
+      row:<table>:<id>                 one row
+      rows:<table>:<column>=<value>    all rows matching a column value
+      table:<table>                    every row of a table
+      table:<table>:<col1,col2>        a column projection of a table
+      file:<path>                      a template or source file
+    """
+
+    def __init__(self, graph_file: str = None, incremental: bool = False,
+                 db: Optional[DatabaseManager] = None):
+        self.graph_file = Path(graph_file or config.get('build.graph_file', 'data/build_graph.json'))
+        self.incremental = incremental
+        self.db = db or DatabaseManager()
+        self.outputs: Dict[str, Dict[str, str]] = {}
+        self.stats = {'rendered': 0, 'skipped': 0}
+        self._fingerprints: Dict[str, str] = {}
+        self._row_hashes: Dict[str, Dict[Any, str]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load the graph recorded by the previous sync"""
+        if not self.graph_file.exists():
+            return
+        try:
+            with open(self.graph_file, 'r', encoding='utf-8') as f:
+                self.outputs = json.load(f).get('outputs', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable build graph {self.graph_file}: {e}")
+            self.outputs = {}
+
+    def save(self) -> None:
+        """Persist the graph, dropping outputs that no longer exist"""
+        self.outputs = {key: deps for key, deps in self.outputs.items()
+                        if Path(self._output_path(key)).exists()}
+        self.graph_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.graph_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'outputs': self.outputs}, f, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.graph_file)
+
+    def invalidate(self) -> None:
+        """Forget fingerprints computed so far (call after DB writes)"""
+        self._fingerprints.clear()
+        self._row_hashes.clear()
+
+    @staticmethod
+    def _output_path(output: str) -> str:
+        """Strip a '#section' suffix used for pages updated in several steps"""
+        return output.split('#', 1)[0]
+
+    # Fingerprints
+
+    def fingerprint(self, key: str) -> str:
+        """Current fingerprint for a dependency key"""
+        if key not in self._fingerprints:
+            self._fingerprints[key] = self._compute(key)
+        return self._fingerprints[key]
+
+    def _compute(self, key: str) -> str:
+        kind, _, rest = key.partition(':')
+
+        if kind == 'file':
+            try:
+                stat = os.stat(rest)
+                return f"{stat.st_mtime_ns}:{stat.st_size}"
+            except OSError:
+                return 'missing'
+
+        table, _, selector = rest.partition(':')
+        if table not in TRACKED_TABLES:
+            raise ValueError(f"Untracked table in dependency key: {key}")
+
+        if kind == 'row':
+            return self._table_row_hashes(table).get(int(selector), 'missing')
+
+        if kind == 'rows':
+            column, _, value = selector.partition('=')
+            if not column.isidentifier():
+                raise ValueError(f"Invalid column in dependency key: {key}")
+            rows = self.db.execute_query(
+                f"SELECT * FROM {table} WHERE {column} = ? ORDER BY id", (value,)
+            )
+            return _digest([tuple(row.values()) for row in rows])
+
+        if kind == 'table':
+            if not selector:
+                hashes = self._table_row_hashes(table)
+                return _digest(sorted(hashes.items()))
+            columns = [c.strip() for c in selector.split(',')]
+            if not all(c.isidentifier() for c in columns):
+                raise ValueError(f"Invalid columns in dependency key: {key}")
+            rows = self.db.execute_query(
+                f"SELECT {', '.join(columns)} FROM {table} ORDER BY id"
+            )
+            return _digest([tuple(row.values()) for row in rows])
+
+        raise ValueError(f"Unknown dependency key: {key}")
+
+    def _table_row_hashes(self, table: str) -> Dict[Any, str]:
+        """Hash every row of a table once per run, keeping only id -> hash"""
+        if table not in self._row_hashes:
+            hashes = {}
+            with self.db.get_connection() as conn:
+                for row in conn.execute(f"SELECT * FROM {table}"):
+                    hashes[row['id']] = _digest(tuple(row))
+            self._row_hashes[table] = hashes
+        return self._row_hashes[table]
+
+    # Rendering decisions
+
+    def is_up_to_date(self, output: str, dependencies: List[str]) -> bool:
+        """True when incremental mode can skip rendering this output"""
+        if not self.incremental:
+            return False
+        recorded = self.outputs.get(output)
+        if recorded is None or set(recorded) != set(dependencies):
+            return False
+        if not Path(self._output_path(output)).exists():
+            return False
+        return all(recorded[key] == self.fingerprint(key) for key in dependencies)
+
+    def record(self, output: str, dependencies: List[str]) -> None:
+        """Remember the fingerprints an output was rendered from"""
+        self.outputs[output] = {key: self.fingerprint(key) for key in dependencies}
+
+    def needs_render(self, output: str, dependencies: List[str]) -> bool:
+        """Check an output before rendering it, counting it as skipped if not"""
+        if self.is_up_to_date(output, dependencies):
+            self.stats['skipped'] += 1
+            return False
+        return True
+
+    def output_mtime(self, output: str) -> Optional[int]:
+        """Modification time of an output file, or None if it does not exist"""
+        path = Path(self._output_path(output))
+        return path.stat().st_mtime_ns if path.exists() else None
+
+    def finish(self, output: str, dependencies: List[str], before: Optional[int]) -> None:
+        """
+        Record an output after rendering it
+
+        Several create_* methods report errors instead of raising; only
+        outputs that were actually written (mtime changed) are recorded.
+        """
+        self.stats['rendered'] += 1
+        after = self.output_mtime(output)
+        if after is not None and after != before:
+            self.record(output, dependencies)
+        else:
+            self.outputs.pop(output, None)
+
+    def render(self, output: str, dependencies: List[str], render: Callable, *args, **kwargs) -> bool:
+        """
+        Render an output unless its dependencies are unchanged
+
+        Args:
+            output: Output file path, optionally with a '#section' suffix
+            dependencies: Dependency keys the output is built from
+            render: Callable that writes the output
+
+        Returns:
+            True if the output was rendered
+        """
+        if not self.needs_render(output, dependencies):
+            return False
+
+        before = self.output_mtime(output)
+        render(*args, **kwargs)
+        self.finish(output, dependencies, before)
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Pages rendered and skipped during this run"""
+        return dict(self.stats)
+
+    def reset_stats(self) -> None:
+        """Start counting rendered and skipped pages from zero"""
+        self.stats = {'rendered': 0, 'skipped': 0}
@@ -6,7 +6,7 @@ Handles category content integration with database
 """
 
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 try:
     from .base_integrator import BaseIntegrator
     from ..models.category import Category
@@ -20,6 +20,13 @@ except ImportError:
 class CategoryIntegrator(BaseIntegrator):
     """Category content integrator"""
     
+    # Build graph dependencies of the search suggestions embedded in every page
+    SEARCH_DATA_DEPENDENCIES = ['table:categories:id,name', 'table:authors:id,name',
+                                'table:articles:id,title,publish_date']
+    
+    # Most recent articles listed on each category page
+    ARTICLES_PER_PAGE = 20
+    
     def __init__(self):
         super().__init__('categories', 'categories')
         
@@ -35,12 +42,29 @@ class CategoryIntegrator(BaseIntegrator):
                 self.update_progress("No categories found in database")
                 return
                 
+            # Fetch page data up front: the search data is shared by every
+            # page and each page lists its category's most recent articles
+            # (listing columns only, authors prefetched for all pages at once)
+            search_data = self.generate_dynamic_search_data()
+            articles_by_category = {
+                category.id: Article.find_page(category_id=category.id,
+                                               limit=self.ARTICLES_PER_PAGE)['items']
+                for category in categories
+            }
+            Article.prefetch_relations([article for articles in articles_by_category.values()
+                                        for article in articles])
+                
             # Create individual category pages
-            for category in categories:
-                self.create_category_page(category)
+            self.render_pages(self.create_category_page, [
+                (str(self.integrated_dir / f"category_{category.slug}.html"),
+                 [f"row:categories:{category.id}",
+                  f"rows:articles:category_id={category.id}"] + self.SEARCH_DATA_DEPENDENCIES,
+                 (category, articles_by_category[category.id], search_data))
+                for category in categories
+            ])
                 
             # Create categories listing page
-            self.create_categories_listing(categories)
+            self.render_categories_listing(categories)
             
             self.update_progress(f"Synced {len(categories)} categories successfully")
             
@@ -48,29 +72,28 @@ class CategoryIntegrator(BaseIntegrator):
             self.update_progress(f"Error syncing categories: {e}")
             raise
             
-    def create_category_page(self, category):
-        """Create individual category page"""
+    def create_category_page(self, category, articles=None, search_data=None):
+        """Create individual category page (articles and search data are fetched if not given)"""
         try:
             # Get path manager for this location
             path_manager = self.get_path_manager(f"integrated/categories/category_{category.slug}.html")
             base_path = path_manager.get_base_path()
             
-            # Read template
-            template_content = self.get_category_template(base_path)
+            # Read template (branded once per site config)
+            content = self.get_branded_template(self.get_category_template, base_path)
             
             # Get articles in this category
-            articles = Article.find_all(category_id=category.id)
+            if articles is None:
+                articles = Article.find_all(category_id=category.id, limit=self.ARTICLES_PER_PAGE)
             
             # Generate article cards
             articles_html = self.generate_article_cards(articles, category.slug, base_path)
             
             # Generate dynamic search data
-            search_data = self.generate_dynamic_search_data()
+            if search_data is None:
+                search_data = self.generate_dynamic_search_data()
             search_data_js = str(search_data).replace("'", '"')  # Convert to JS array format
             
-            # Apply site branding first
-            content = self._apply_site_branding(template_content)
-            
             # Replace placeholders
             replacements = {
                 '{{CATEGORY_NAME}}': category.name,
@@ -101,8 +124,8 @@ class CategoryIntegrator(BaseIntegrator):
             path_manager = self.get_path_manager("integrated/categories.html")
             base_path = path_manager.get_base_path()
             
-            # Read template
-            template_content = self.get_categories_listing_template(base_path)
+            # Read template (branded once per site config)
+            content = self.get_branded_template(self.get_categories_listing_template, base_path)
             
             # Generate category cards
             categories_html = self.generate_category_cards(categories, base_path)
@@ -111,9 +134,6 @@ class CategoryIntegrator(BaseIntegrator):
             search_data = self.generate_dynamic_search_data()
             search_data_js = str(search_data).replace("'", '"')  # Convert to JS array format
             
-            # Apply site branding first
-            content = self._apply_site_branding(template_content)
-            
             # Replace placeholders
             content = content.replace('{{CATEGORIES_CONTENT}}', categories_html)
             content = content.replace('{{CATEGORY_COUNT}}', str(len(categories)))
@@ -133,14 +153,23 @@ class CategoryIntegrator(BaseIntegrator):
             traceback.print_exc()
             raise
             
+    def render_categories_listing(self, categories):
+        """Create the categories listing page unless it is up to date"""
+        self.render_output(
+            'integrated/categories.html',
+            ['table:categories', 'table:articles:id,category_id'] + self.SEARCH_DATA_DEPENDENCIES,
+            self.create_categories_listing, categories
+        )
+            
     def generate_category_cards(self, categories, base_path=""):
         """Generate HTML for category cards"""
         cards_html = ""
         
+        # Article counts for every category in one query
+        article_counts = Article.count_by_category()
+        
         for category in categories:
-            # Get article count for this category
-            articles = Article.find_all(category_id=category.id)
-            article_count = len(articles)
+            article_count = article_counts.get(category.id, 0)
             
             # Get category color or default
             color = getattr(category, 'color', '#4F46E5')
@@ -668,80 +697,68 @@ class CategoryIntegrator(BaseIntegrator):
         """Update listing page - use create_categories_listing instead"""
         pass
         
-    def _apply_site_branding(self, html_content: str) -> str:
-        """Apply site configuration to HTML content"""
-        try:
-            site_integrator = self.get_site_integrator()
-            branding = site_integrator.get_config_section('branding')
-            contact = site_integrator.get_config_section('contact')
-            
-            # Create replacements dictionary - use site config dynamically
-            replacements = {
-                # Site name replacements
-                'Influencer News': branding.get('site_name'),
-                # Title tag replacements
-                ' - Influencer News': f" - {branding.get('site_name')}",
-                '| Influencer News': f"| {branding.get('site_name')}",
-                # Header logo text
-                '>IN<': f">{branding.get('logo_text')}<",
-                # Header tagline
-                'Breaking stories • Real insights': branding.get('site_tagline'),
-                # Theme color replacements - comprehensive
-                '#4f46e5': branding.get('theme_color'),  # indigo-500
-                '#6366f1': branding.get('theme_color'),  # indigo-500 variant
-                '#312e81': branding.get('theme_color'),  # indigo-900
-                '#4338ca': branding.get('theme_color'),  # indigo-700
-                '#3730a3': branding.get('theme_color'),  # indigo-800
-                '#1e1b4b': branding.get('theme_color'),  # indigo-950
-                '#667eea': branding.get('theme_color'),  # custom indigo
-                # Convert specific indigo classes to use theme color
-                'bg-emerald-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
-                'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'text-emerald-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'text-emerald-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'border-emerald-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-emerald-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-emerald-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'focus:ring-emerald-500': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'from-indigo-900': f"from-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'to-purple-800': f"to-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'via-purple-800': f"via-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                # Footer copyright
-                '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
-                # Contact info updates
-                'news@influencernews.com': contact.get('contact_email'),
-                '(555) 123-NEWS': contact.get('contact_phone'),
-                '123 Creator Avenue': contact.get('business_address'),
-                'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}"
-            }
-            
-            # Apply all replacements
-            for old_value, new_value in replacements.items():
-                if old_value and new_value:  # Only replace if both values exist and are not None
-                    html_content = html_content.replace(old_value, str(new_value))
-            
-            return html_content
-            
-        except Exception as e:
-            print(f"Warning: Could not apply site branding to category page: {e}")
-            return html_content
+    def _branding_replacements(self) -> Dict[str, Optional[str]]:
+        """Site-branding replacement table for category pages"""
+        site_integrator = self.get_site_integrator()
+        branding = site_integrator.get_config_section('branding')
+        contact = site_integrator.get_config_section('contact')
+        
+        # Create replacements dictionary - use site config dynamically
+        return {
+            # Site name replacements
+            'Influencer News': branding.get('site_name'),
+            # Title tag replacements
+            ' - Influencer News': f" - {branding.get('site_name')}",
+            '| Influencer News': f"| {branding.get('site_name')}",
+            # Header logo text
+            '>IN<': f">{branding.get('logo_text')}<",
+            # Header tagline
+            'Breaking stories • Real insights': branding.get('site_tagline'),
+            # Theme color replacements - comprehensive
+            '#4f46e5': branding.get('theme_color'),  # indigo-500
+            '#6366f1': branding.get('theme_color'),  # indigo-500 variant
+            '#312e81': branding.get('theme_color'),  # indigo-900
+            '#4338ca': branding.get('theme_color'),  # indigo-700
+            '#3730a3': branding.get('theme_color'),  # indigo-800
+            '#1e1b4b': branding.get('theme_color'),  # indigo-950
+            '#667eea': branding.get('theme_color'),  # custom indigo
+            # Convert specific indigo classes to use theme color
+            'bg-emerald-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
+            'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'text-emerald-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'text-emerald-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'border-emerald-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-emerald-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-emerald-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'focus:ring-emerald-500': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'from-indigo-900': f"from-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'to-purple-800': f"to-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'via-purple-800': f"via-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            # Footer copyright
+            '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
+            # Contact info updates
+            'news@influencernews.com': contact.get('contact_email'),
+            '(555) 123-NEWS': contact.get('contact_phone'),
+            '123 Creator Avenue': contact.get('business_address'),
+            'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}"
+        }
     
     def _get_theme_class_name(self, theme_color: str) -> str:
         """Convert theme color to appropriate Tailwind class name"""
@@ -1161,6 +1178,6 @@ class CategoryIntegrator(BaseIntegrator):
         categories = Category.find_all()
         
         # Update the main categories listing page
-        self.create_categories_listing(categories)
+        self.render_categories_listing(categories)
         
         self.update_progress(f"Updated listing pages with {len(categories)} categories")
@@ -14,13 +14,20 @@ from typing import Dict, List, Any
 
 try:
     from ..database import DatabaseManager
+    from ..utils.multi_replace import MultiReplacer
 except ImportError:
     from src.database import DatabaseManager
+    from src.utils.multi_replace import MultiReplacer
 
 
 class HomepageIntegrator:
     """Integrator for the main homepage"""
     
+    # Build graph dependencies of index.html and the homepage data file
+    HOMEPAGE_DEPENDENCIES = ['table:articles', 'table:authors:id,name,slug', 'table:categories',
+                             'table:site_config:config_type,config_key,config_value,is_active',
+                             'file:src/integrators/homepage_integrator.py']
+    
     def __init__(self):
         # Don't use the standard content/integrated structure for homepage
         self.db = DatabaseManager()
@@ -42,6 +49,9 @@ class HomepageIntegrator:
             
         # Initialize site integrator for site-wide configuration
         self._site_integrator = None
+        
+        # Build graph for incremental syncs (set by ContentSyncTool)
+        self.build_graph = None
     
     def get_site_integrator(self):
         """Get site integrator instance (lazy loading)"""
@@ -58,22 +68,31 @@ class HomepageIntegrator:
         """Generate the homepage with current database content"""
         
         try:
-            # Get latest articles for homepage
-            articles = self._get_homepage_articles()
-            
-            # Generate JavaScript data file
-            self._generate_homepage_js(articles)
-            
-            # Always update HTML to ensure proper CSP nonces
-            self._generate_homepage_html(articles)
-            
-            print(f"✅ Homepage updated with {len(articles)} articles")
+            if self.build_graph is not None and not force_update:
+                if not self.build_graph.render('index.html#homepage', self.HOMEPAGE_DEPENDENCIES,
+                                               self._write_homepage):
+                    print("⏭️ Homepage unchanged, skipped")
+            else:
+                self._write_homepage()
             return True
             
         except Exception as e:
             print(f"❌ Homepage generation failed: {e}")
             return False
     
+    def _write_homepage(self) -> None:
+        """Regenerate the homepage data file and HTML"""
+        # Get latest articles for homepage
+        articles = self._get_homepage_articles()
+        
+        # Generate JavaScript data file
+        self._generate_homepage_js(articles)
+        
+        # Always update HTML to ensure proper CSP nonces
+        self._generate_homepage_html(articles)
+        
+        print(f"✅ Homepage updated with {len(articles)} articles")
+    
     def _get_homepage_articles(self, limit: int = None) -> List[Dict[str, Any]]:
         """Get latest published articles for homepage"""
         
@@ -413,11 +432,8 @@ if (typeof window !== 'undefined') {{
             'Get the latest influencer news': contact.get('newsletter_signup_text', 'Get the real news'),
         }
         
-        # Apply all replacements
-        for old_text, new_text in replacements.items():
-            html_content = html_content.replace(old_text, new_text)
-        
-        return html_content
+        # Apply all replacements in one pass
+        return MultiReplacer(replacements).apply(html_content)
     
     def _get_theme_class_name(self, theme_color: str) -> str:
         """Convert theme color to appropriate Tailwind class name"""
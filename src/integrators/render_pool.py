@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Render Pool
+===========
+Fans independent page renders and content file parsing out to worker
+processes. Each worker builds its own integrator (and database
+connections) once, then renders pages from pickled model objects sent by
+the parent, or parses content files into plain dicts for the parent to
+write.
+"""
+
+import os
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from ..utils.config import config
+    from ..utils.trusted_security import trusted_sanitizer
+except ImportError:
+    from src.utils.config import config
+    from src.utils.trusted_security import trusted_sanitizer
+
+
+# Integrator instance owned by the current worker process
+_worker_integrator = None
+
+
+def _init_worker(integrator_class: type) -> None:
+    """Create the worker's integrator once per process"""
+    global _worker_integrator
+    _worker_integrator = integrator_class()
+
+
+def _render_page(task: tuple) -> None:
+    """Render one page in a worker"""
+    method_name, args = task
+    try:
+        getattr(_worker_integrator, method_name)(*args)
+    finally:
+        # Workers exit without running atexit, so store sanitized results now
+        trusted_sanitizer.cache.flush()
+
+
+def _parse_file(path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse one content file in a worker, returning (data, error message)"""
+    try:
+        return _worker_integrator.parse_content_file(Path(path)), None
+    except Exception as e:
+        return None, str(e)
+    finally:
+        trusted_sanitizer.cache.flush()
+
+
+def get_render_workers(requested: Optional[int] = None, setting: str = 'build.render_workers') -> int:
+    """
+    Resolve the number of worker processes
+
+    Args:
+        requested: Explicit worker count (defaults to the setting)
+        setting: Config key holding the default, e.g. build.parse_workers
+
+    Returns:
+        Worker count; 0 or less means one per CPU core
+    """
+    workers = requested if requested is not None else config.get(setting, 0)
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def render_in_pool(integrator_class: type, method_name: str,
+                   pages: Sequence[Sequence[Any]], workers: int) -> None:
+    """
+    Render pages in a process pool
+
+    Pages are dispatched in order and every page writes its own file, so
+    the output is identical to a serial run. Worker exceptions are
+    re-raised in the parent.
+
+    Args:
+        integrator_class: Integrator type to instantiate in each worker
+        method_name: Page method to call, e.g. 'create_category_page'
+        pages: Argument tuple for each page
+        workers: Number of worker processes
+    """
+    tasks: List[tuple] = [(method_name, tuple(args)) for args in pages]
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(integrator_class,)) as pool:
+        for _ in pool.map(_render_page, tasks, chunksize=chunksize):
+            pass
+
+
+@contextmanager
+def parse_in_pool(integrator_class: type, paths: Sequence[Path],
+                  workers: int) -> Iterator[Iterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]]:
+    """
+    Parse content files in a process pool
+
+    Every file is submitted on entry, so workers are forked before the
+    caller opens a transaction and keep parsing while it consumes results.
+    Files not yet parsed are cancelled if the caller stops early.
+
+    Args:
+        integrator_class: Integrator type whose parse_content_file is used
+        paths: Content files to parse
+        workers: Number of worker processes
+
+    Yields:
+        Iterator of (parsed data, None) or (None, error message), in path order
+    """
+    chunksize = max(1, len(paths) // (workers * 8))
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(integrator_class,))
+    try:
+        yield pool.map(_parse_file, [str(path) for path in paths], chunksize=chunksize)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
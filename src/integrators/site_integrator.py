@@ -8,7 +8,7 @@ Manages site-wide configuration and content from content/site/ files
 import os
 import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Tuple
 
 try:
     from .base_integrator import BaseIntegrator
@@ -23,9 +23,11 @@ class SiteIntegrator(BaseIntegrator):
     
     def __init__(self):
         super().__init__('site', 'site')
-        self._cached_config = None
-        self._cache_time = None
-        self._cache_duration = 300  # 5 minutes
+        self._cache_duration = 300  # 5 minutes, for writes made by other processes
+        
+        # Header/footer/navigation HTML built from the current config snapshot
+        self._fragments: Dict[tuple, Any] = {}
+        self._fragments_config = None
     
     def parse_content_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse site configuration content file"""
@@ -181,12 +183,9 @@ class SiteIntegrator(BaseIntegrator):
                     if isinstance(value, list):
                         all_config_data[config_type][key] = '\n'.join(value)
             
+            # Invalidates the config snapshot
             SiteConfig.bulk_update(all_config_data)
             
-            # Invalidate cache
-            self._cached_config = None
-            self._cache_time = None
-            
             self.update_progress(f"Successfully processed {processed_count} site config files!", 100)
         
         return processed_count
@@ -211,21 +210,29 @@ class SiteIntegrator(BaseIntegrator):
         pass
     
     def get_site_config(self, force_refresh: bool = False) -> Dict[str, Dict[str, str]]:
-        """Get all site configuration with caching"""
-        now = datetime.datetime.now()
-        
-        # Check cache validity
-        if (not force_refresh and 
-            self._cached_config and 
-            self._cache_time and 
-            (now - self._cache_time).seconds < self._cache_duration):
-            return self._cached_config
+        """Get all site configuration from the shared snapshot"""
+        if force_refresh:
+            SiteConfig.invalidate_snapshot()
+        return SiteConfig.get_snapshot(max_age=self._cache_duration)
+    
+    def get_fragment(self, key: tuple, build: Callable[[], Any]) -> Any:
+        """
+        Get HTML (or parsed config) derived from the site config
         
-        # Refresh cache
-        self._cached_config = SiteConfig.get_all_config()
-        self._cache_time = now
+        Fragments are built once per config snapshot and dropped when the
+        configuration changes.
         
-        return self._cached_config
+        Args:
+            key: Fragment name plus the arguments it depends on
+            build: Builds the fragment on a cache miss
+        """
+        site_config = self.get_site_config()
+        if self._fragments_config is not site_config:
+            self._fragments = {}
+            self._fragments_config = site_config
+        if key not in self._fragments:
+            self._fragments[key] = build()
+        return self._fragments[key]
     
     def get_config_by_type(self, config_type: str) -> Dict[str, str]:
         """Get configuration for specific type"""
@@ -286,17 +293,12 @@ class SiteIntegrator(BaseIntegrator):
     <meta name="twitter:title" content="{self.sanitize_text(title)}">
     <meta name="twitter:description" content="{self.sanitize_text(description)}">'''
     
-    def generate_header_html(self, current_page: str = '', path_prefix: str = '') -> str:
-        """Generate header HTML with navigation"""
-        branding = self.get_branding_config()
+    def get_navigation_items(self) -> List[Tuple[str, str]]:
+        """Main navigation as (name, url) pairs, parsed once per config snapshot"""
+        return self.get_fragment(('navigation_items',), self._parse_navigation_items)
+    
+    def _parse_navigation_items(self) -> List[Tuple[str, str]]:
         navigation = self.get_navigation_config()
-        
-        site_name = branding.get('site_name', 'Influencer News')
-        site_tagline = branding.get('site_tagline', 'Breaking stories • Real insights')
-        logo_text = branding.get('logo_text', 'IN')
-        
-        # Build navigation items
-        nav_items = []
         main_nav = navigation.get('main_navigation_items', '')
         
         # Handle both string (from database) and list formats
@@ -305,18 +307,34 @@ class SiteIntegrator(BaseIntegrator):
         else:
             nav_lines = main_nav if isinstance(main_nav, list) else []
         
+        items = []
         for item in nav_lines:
             if ':' in item:
                 name, url = item.split(':', 1)
-                name = name.strip()
-                url = url.strip()
-                
-                # Add path prefix if needed
-                if path_prefix and not url.startswith('http'):
-                    url = f"{path_prefix}{url}"
-                
-                active_class = 'text-indigo-200' if current_page.lower() == name.lower() else ''
-                nav_items.append(f'<li><a href="{url}" class="nav-link hover:text-indigo-200 transition font-medium {active_class}">{name}</a></li>')
+                items.append((name.strip(), url.strip()))
+        return items
+    
+    def generate_header_html(self, current_page: str = '', path_prefix: str = '') -> str:
+        """Generate header HTML with navigation"""
+        return self.get_fragment(('header', current_page, path_prefix),
+                                 lambda: self._build_header_html(current_page, path_prefix))
+    
+    def _build_header_html(self, current_page: str, path_prefix: str) -> str:
+        branding = self.get_branding_config()
+        
+        site_name = branding.get('site_name', 'Influencer News')
+        site_tagline = branding.get('site_tagline', 'Breaking stories • Real insights')
+        logo_text = branding.get('logo_text', 'IN')
+        
+        # Build navigation items
+        nav_items = []
+        for name, url in self.get_navigation_items():
+            # Add path prefix if needed
+            if path_prefix and not url.startswith('http'):
+                url = f"{path_prefix}{url}"
+            
+            active_class = 'text-indigo-200' if current_page.lower() == name.lower() else ''
+            nav_items.append(f'<li><a href="{url}" class="nav-link hover:text-indigo-200 transition font-medium {active_class}">{name}</a></li>')
         
         nav_html = '\n                    '.join(nav_items)
         
@@ -341,6 +359,10 @@ class SiteIntegrator(BaseIntegrator):
     
     def generate_footer_html(self, path_prefix: str = '') -> str:
         """Generate footer HTML"""
+        return self.get_fragment(('footer', path_prefix),
+                                 lambda: self._build_footer_html(path_prefix))
+    
+    def _build_footer_html(self, path_prefix: str) -> str:
         branding = self.get_branding_config()
         contact = self.get_contact_config()
         content = self.get_content_config()
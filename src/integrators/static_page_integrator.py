@@ -6,7 +6,7 @@ Handles site branding for static HTML pages (search.html, authors.html, etc.)
 """
 
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 try:
     from .base_integrator import BaseIntegrator
 except ImportError:
@@ -68,102 +68,91 @@ class StaticPageIntegrator(BaseIntegrator):
             self.update_progress(f"Error updating {page_name}: {e}")
             return False
     
+    def _branding_replacements(self) -> Dict[str, Optional[str]]:
+        """Site-branding replacement table for static pages"""
+        site_integrator = self.get_site_integrator()
+        branding = site_integrator.get_config_section('branding')
+        contact = site_integrator.get_config_section('contact')
+        
+        # Create replacements dictionary - use site config dynamically
+        return {
+            # Site name replacements
+            'Influencer News': branding.get('site_name'),
+            # Title tag replacements
+            ' - Influencer News': f" - {branding.get('site_name')}",
+            '| Influencer News': f"| {branding.get('site_name')}",
+            # Header logo text
+            '>IN<': f">{branding.get('logo_text')}<",
+            # Header tagline
+            'Breaking stories • Real insights': branding.get('site_tagline'),
+            'Breaking • Insights • Culture': branding.get('site_tagline'),
+            # Theme color hex codes - comprehensive replacement
+            '#4f46e5': branding.get('theme_color'),  # indigo-500
+            '#6366f1': branding.get('theme_color'),  # indigo-500 variant
+            '#312e81': branding.get('theme_color'),  # indigo-900
+            '#4338ca': branding.get('theme_color'),  # indigo-700
+            '#3730a3': branding.get('theme_color'),  # indigo-800
+            '#1e1b4b': branding.get('theme_color'),  # indigo-950
+            '#667eea': branding.get('theme_color'),  # custom indigo
+            # Specific Tailwind class replacements - more precise
+            'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'bg-indigo-300': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}300",
+            'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
+            'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'text-indigo-500': f"text-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'text-indigo-400': f"text-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'text-indigo-300': f"text-{self._get_theme_class_name(branding.get('theme_color'))}300",
+            'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'border-indigo-500': f"border-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'border-indigo-400': f"border-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'hover:bg-indigo-700': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-800': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            # Footer copyright
+            '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
+            # Contact info updates
+            'news@influencernews.com': contact.get('contact_email'),
+            '(555) 123-NEWS': contact.get('contact_phone'),
+            '123 Creator Avenue': contact.get('business_address'),
+            'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}",
+            # Description updates
+            "The world's leading source for influencer industry news and exclusive insights.": branding.get('site_description'),
+            'Get the latest influencer news': contact.get('newsletter_signup_text'),
+        }
+    
     def _apply_site_branding(self, html_content: str) -> str:
-        """Apply site configuration to HTML content"""
+        """Apply site branding, then fill in a fresh nonce and CSRF token"""
+        html_content = super()._apply_site_branding(html_content)
+        
+        # Add nonce and CSRF token replacement for security
         try:
-            site_integrator = self.get_site_integrator()
-            branding = site_integrator.get_config_section('branding')
-            contact = site_integrator.get_config_section('contact')
-            
-            # Create replacements dictionary - use site config dynamically
-            replacements = {
-                # Site name replacements
-                'Influencer News': branding.get('site_name'),
-                # Title tag replacements
-                ' - Influencer News': f" - {branding.get('site_name')}",
-                '| Influencer News': f"| {branding.get('site_name')}",
-                # Header logo text
-                '>IN<': f">{branding.get('logo_text')}<",
-                # Header tagline
-                'Breaking stories • Real insights': branding.get('site_tagline'),
-                'Breaking • Insights • Culture': branding.get('site_tagline'),
-                # Theme color hex codes - comprehensive replacement
-                '#4f46e5': branding.get('theme_color'),  # indigo-500
-                '#6366f1': branding.get('theme_color'),  # indigo-500 variant
-                '#312e81': branding.get('theme_color'),  # indigo-900
-                '#4338ca': branding.get('theme_color'),  # indigo-700
-                '#3730a3': branding.get('theme_color'),  # indigo-800
-                '#1e1b4b': branding.get('theme_color'),  # indigo-950
-                '#667eea': branding.get('theme_color'),  # custom indigo
-                # Specific Tailwind class replacements - more precise
-                'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'bg-indigo-300': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}300",
-                'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
-                'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'text-indigo-500': f"text-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'text-indigo-400': f"text-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'text-indigo-300': f"text-{self._get_theme_class_name(branding.get('theme_color'))}300",
-                'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'border-indigo-500': f"border-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'border-indigo-400': f"border-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'hover:bg-indigo-700': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-800': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                # Footer copyright
-                '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
-                # Contact info updates
-                'news@influencernews.com': contact.get('contact_email'),
-                '(555) 123-NEWS': contact.get('contact_phone'),
-                '123 Creator Avenue': contact.get('business_address'),
-                'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}",
-                # Description updates
-                "The world's leading source for influencer industry news and exclusive insights.": branding.get('site_description'),
-                'Get the latest influencer news': contact.get('newsletter_signup_text'),
-            }
-            
-            # Apply all replacements
-            for old_value, new_value in replacements.items():
-                if old_value and new_value:  # Only replace if both values exist and are not None
-                    html_content = html_content.replace(old_value, str(new_value))
-            
-            # Add nonce and CSRF token replacement for security
-            try:
-                from ..utils.security_middleware import security_middleware
-                nonce = security_middleware.generate_nonce()
-                csrf_token = security_middleware.generate_csrf_token()
-                html_content = html_content.replace('{{nonce}}', nonce)
-                html_content = html_content.replace('{{csrf_token}}', csrf_token)
-            except ImportError:
-                from src.utils.security_middleware import security_middleware
-                nonce = security_middleware.generate_nonce()
-                csrf_token = security_middleware.generate_csrf_token()
-                html_content = html_content.replace('{{nonce}}', nonce)
-                html_content = html_content.replace('{{csrf_token}}', csrf_token)
-            
-            return html_content
-            
-        except Exception as e:
-            print(f"Warning: Could not apply site branding to static page: {e}")
-            return html_content
+            from ..utils.security_middleware import security_middleware
+        except ImportError:
+            from src.utils.security_middleware import security_middleware
+        nonce = security_middleware.generate_nonce()
+        csrf_token = security_middleware.generate_csrf_token()
+        html_content = html_content.replace('{{nonce}}', nonce)
+        html_content = html_content.replace('{{csrf_token}}', csrf_token)
+        return html_content
     
     def _get_theme_class_name(self, theme_color: str) -> str:
         """Convert theme color to appropriate Tailwind class name"""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Sync Manifest
+=============
+Records, per content file, what the last file sync saw (size, mtime,
+content hash) and which database row it produced, so the next sync can
+skip unchanged files without reading or parsing them
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    from ..utils.config import config
+except ImportError:
+    from src.utils.config import config
+
+
+MANIFEST_VERSION = 1
+
+
+def hash_file(path: Path) -> str:
+    """Content hash of a source file"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+class SyncManifest:
+    """
+    Content file name -> last synced state, persisted between syncs
+
+    Entry fields:
+      size, mtime_ns    stat of the file when it was last synced
+      hash              blake2b of the file's bytes
+      slug, id          the database row the file produced
+      row_version       that row's updated_at after the sync
+    """
+
+    def __init__(self, content_type: str, manifest_dir: str = None):
+        self.content_type = content_type
+        self.manifest_file = Path(manifest_dir or config.get('build.sync_manifest_dir', 'data/sync_manifest')) \
+            / f"{content_type}.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the manifest recorded by the previous sync"""
+        if not self.manifest_file.exists():
+            return
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable sync manifest {self.manifest_file}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Persist the manifest atomically, if anything changed since it was loaded"""
+        if not self.dirty:
+            return
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        # dumps() uses the C encoder; dump() would stream through the Python one
+        payload = json.dumps({'version': MANIFEST_VERSION, 'files': self.entries},
+                             separators=(',', ':'), sort_keys=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.manifest_file)
+        self.dirty = False
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Entry for a content file name"""
+        return self.entries.get(name)
+
+    @staticmethod
+    def stat_matches(entry: Dict[str, Any], stat: os.stat_result) -> bool:
+        """True when a file's size and mtime are those recorded in its entry"""
+        return entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns
+
+    def record(self, name: str, stat: os.stat_result, digest: str, slug: str,
+               row_id: int, row_version: Any) -> None:
+        """Remember the state a content file was synced from"""
+        self.entries[name] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': digest,
+            'slug': slug,
+            'id': row_id,
+            'row_version': row_version
+        }
+        self.dirty = True
+
+    def forget(self, name: str) -> None:
+        """Drop a file's entry so the next sync parses it again"""
+        if self.entries.pop(name, None) is not None:
+            self.dirty = True
+
+    def prune(self, names: Iterable[str]) -> None:
+        """Drop entries for files that no longer exist"""
+        current = set(names)
+        kept = {name: entry for name, entry in self.entries.items() if name in current}
+        if len(kept) != len(self.entries):
+            self.entries = kept
+            self.dirty = True
@@ -6,7 +6,7 @@ Handles trending topics integration with database
 """
 
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 try:
     from .base_integrator import BaseIntegrator
     from ..models.trending import TrendingTopic
@@ -34,11 +34,16 @@ class TrendingIntegrator(BaseIntegrator):
                 return
                 
             # Create individual trending topic pages
-            for topic in topics:
-                self.create_trending_page(topic)
+            self.render_pages(self.create_trending_page, [
+                (str(self.integrated_dir / f"trend_{topic.slug}.html"),
+                 [f"row:trending_topics:{topic.id}"],
+                 (topic,))
+                for topic in topics
+            ])
                 
             # Create trending listing page
-            self.create_trending_listing(topics)
+            self.render_output('integrated/trending.html', ['table:trending_topics'],
+                               self.create_trending_listing, topics)
             
             self.update_progress(f"Synced {len(topics)} trending topics successfully")
             
@@ -53,16 +58,13 @@ class TrendingIntegrator(BaseIntegrator):
             path_manager = self.get_path_manager(f"integrated/trending/trend_{topic.slug}.html")
             base_path = path_manager.get_base_path()
             
-            # Read template
-            template_content = self.get_trending_template(base_path)
+            # Read template (branded once per site config)
+            content = self.get_branded_template(self.get_trending_template, base_path)
             
             # Get dynamic data from topic
             heat_score = getattr(topic, 'heat_score', getattr(topic, 'trend_score', 0))
             description = getattr(topic, 'description', getattr(topic, 'analysis', f'Explore the latest on {topic.title}')[:200] + '...' if getattr(topic, 'analysis', '') else f'Explore the latest on {topic.title}')
             
-            # Apply site branding first
-            content = self._apply_site_branding(template_content)
-            
             # Replace placeholders
             replacements = {
                 '{{TOPIC_TITLE}}': topic.title,
@@ -91,15 +93,12 @@ class TrendingIntegrator(BaseIntegrator):
             path_manager = self.get_path_manager("integrated/trending.html")
             base_path = path_manager.get_base_path()
             
-            # Read template
-            template_content = self.get_trending_listing_template(base_path)
+            # Read template (branded once per site config)
+            content = self.get_branded_template(self.get_trending_listing_template, base_path)
             
             # Generate trending cards
             topics_html = self.generate_trending_cards(topics, base_path)
             
-            # Apply site branding first
-            content = self._apply_site_branding(template_content)
-            
             # Replace placeholders
             content = content.replace('{{TRENDING_CONTENT}}', topics_html)
             content = content.replace('{{TOPIC_COUNT}}', str(len(topics)))
@@ -777,80 +776,68 @@ class TrendingIntegrator(BaseIntegrator):
         """Update listing page - use create_trending_listing instead"""
         pass
         
-    def _apply_site_branding(self, html_content: str) -> str:
-        """Apply site configuration to HTML content"""
-        try:
-            site_integrator = self.get_site_integrator()
-            branding = site_integrator.get_config_section('branding')
-            contact = site_integrator.get_config_section('contact')
-            
-            # Create replacements dictionary - use site config dynamically
-            replacements = {
-                # Site name replacements
-                'Influencer News': branding.get('site_name'),
-                # Title tag replacements
-                ' - Influencer News': f" - {branding.get('site_name')}",
-                '| Influencer News': f"| {branding.get('site_name')}",
-                # Header logo text
-                '>IN<': f">{branding.get('logo_text')}<",
-                # Header tagline
-                'Breaking stories • Real insights': branding.get('site_tagline'),
-                # Theme color replacements - comprehensive
-                '#4f46e5': branding.get('theme_color'),  # indigo-500
-                '#6366f1': branding.get('theme_color'),  # indigo-500 variant
-                '#312e81': branding.get('theme_color'),  # indigo-900
-                '#4338ca': branding.get('theme_color'),  # indigo-700
-                '#3730a3': branding.get('theme_color'),  # indigo-800
-                '#1e1b4b': branding.get('theme_color'),  # indigo-950
-                '#667eea': branding.get('theme_color'),  # custom indigo
-                # Convert specific indigo classes to use theme color
-                'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
-                'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
-                'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
-                'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
-                'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'focus:ring-indigo-500': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}500",
-                'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
-                'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'from-indigo-900': f"from-{self._get_theme_class_name(branding.get('theme_color'))}900",
-                'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
-                'to-purple-800': f"to-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                'via-purple-800': f"via-{self._get_theme_class_name(branding.get('theme_color'))}800",
-                # Footer copyright
-                '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
-                # Contact info updates
-                'news@influencernews.com': contact.get('contact_email'),
-                '(555) 123-NEWS': contact.get('contact_phone'),
-                '123 Creator Avenue': contact.get('business_address'),
-                'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}"
-            }
-            
-            # Apply all replacements
-            for old_value, new_value in replacements.items():
-                if old_value and new_value:  # Only replace if both values exist and are not None
-                    html_content = html_content.replace(old_value, str(new_value))
-            
-            return html_content
-            
-        except Exception as e:
-            print(f"Warning: Could not apply site branding to trending page: {e}")
-            return html_content
+    def _branding_replacements(self) -> Dict[str, Optional[str]]:
+        """Site-branding replacement table for trending pages"""
+        site_integrator = self.get_site_integrator()
+        branding = site_integrator.get_config_section('branding')
+        contact = site_integrator.get_config_section('contact')
+        
+        # Create replacements dictionary - use site config dynamically
+        return {
+            # Site name replacements
+            'Influencer News': branding.get('site_name'),
+            # Title tag replacements
+            ' - Influencer News': f" - {branding.get('site_name')}",
+            '| Influencer News': f"| {branding.get('site_name')}",
+            # Header logo text
+            '>IN<': f">{branding.get('logo_text')}<",
+            # Header tagline
+            'Breaking stories • Real insights': branding.get('site_tagline'),
+            # Theme color replacements - comprehensive
+            '#4f46e5': branding.get('theme_color'),  # indigo-500
+            '#6366f1': branding.get('theme_color'),  # indigo-500 variant
+            '#312e81': branding.get('theme_color'),  # indigo-900
+            '#4338ca': branding.get('theme_color'),  # indigo-700
+            '#3730a3': branding.get('theme_color'),  # indigo-800
+            '#1e1b4b': branding.get('theme_color'),  # indigo-950
+            '#667eea': branding.get('theme_color'),  # custom indigo
+            # Convert specific indigo classes to use theme color
+            'bg-indigo-900': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'bg-indigo-800': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'bg-indigo-700': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'bg-indigo-600': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'bg-indigo-500': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'bg-indigo-400': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'bg-indigo-200': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'bg-indigo-100': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'bg-indigo-50': f"bg-{self._get_theme_class_name(branding.get('theme_color'))}50",
+            'text-indigo-900': f"text-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'text-indigo-800': f"text-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'text-indigo-700': f"text-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'text-indigo-600': f"text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'text-indigo-200': f"text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'text-indigo-100': f"text-{self._get_theme_class_name(branding.get('theme_color'))}100",
+            'border-indigo-700': f"border-{self._get_theme_class_name(branding.get('theme_color'))}700",
+            'border-indigo-600': f"border-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:bg-indigo-600': f"hover:bg-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-600': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'hover:text-indigo-200': f"hover:text-{self._get_theme_class_name(branding.get('theme_color'))}200",
+            'focus:ring-indigo-400': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'focus:ring-indigo-500': f"focus:ring-{self._get_theme_class_name(branding.get('theme_color'))}500",
+            'from-indigo-400': f"from-{self._get_theme_class_name(branding.get('theme_color'))}400",
+            'from-indigo-600': f"from-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'from-indigo-900': f"from-{self._get_theme_class_name(branding.get('theme_color'))}900",
+            'to-purple-600': f"to-{self._get_theme_class_name(branding.get('theme_color'))}600",
+            'to-purple-800': f"to-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            'via-purple-800': f"via-{self._get_theme_class_name(branding.get('theme_color'))}800",
+            # Footer copyright
+            '© 2025 Influencer News': f"© 2025 {branding.get('site_name')}",
+            # Contact info updates
+            'news@influencernews.com': contact.get('contact_email'),
+            '(555) 123-NEWS': contact.get('contact_phone'),
+            '123 Creator Avenue': contact.get('business_address'),
+            'Los Angeles, CA 90210': f"{contact.get('city', 'New York')}, {contact.get('state', 'NY')} {contact.get('zip_code', '10001')}"
+        }
     
     def _get_theme_class_name(self, theme_color: str) -> str:
         """Convert theme color to appropriate Tailwind class name"""
@@ -1281,6 +1268,7 @@ class TrendingIntegrator(BaseIntegrator):
         trending_topics = TrendingTopic.find_all()
         
         # Update the main trending listing page
-        self.create_trending_listing(trending_topics)
+        self.render_output('integrated/trending.html', ['table:trending_topics'],
+                           self.create_trending_listing, trending_topics)
         
         self.update_progress(f"Updated listing pages with {len(trending_topics)} trending topics")
@@ -1,5 +1,6 @@
 """Article model for Influencer News CMS"""
 
+import re
 import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -11,6 +12,29 @@ from ..utils.logger import get_logger, ValidationException
 
 logger = get_logger(__name__)
 
+# Markup removed before counting words
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WORDS_PER_MINUTE = 200
+
+
+def count_words(content: Optional[str]) -> int:
+    """Words in article content, HTML tags stripped"""
+    return len(TAG_PATTERN.sub('', content).split()) if content else 0
+
+
+def estimate_read_time(word_count: int) -> int:
+    """Reading time in minutes for a word count (at least one)"""
+    return max(1, round(word_count / WORDS_PER_MINUTE))
+
+
+def parse_read_time(value: Any) -> int:
+    """Minutes from a stored read time, including legacy text such as '3 min'"""
+    if isinstance(value, int):
+        return value
+    match = re.search(r'\d+', str(value or ''))
+    return int(match.group()) if match else 0
+
+
 class Article(BaseModel):
     """Article model representing news articles"""
     
@@ -43,9 +67,13 @@ class Article(BaseModel):
         self.excerpt = self.excerpt or kwargs.get('subtitle')
         self.publish_date = self.publish_date or kwargs.get('publication_date')
         self.views = self.views or kwargs.get('view_count', 0)
-        self.read_time_minutes = self.read_time_minutes or kwargs.get('read_time', 0)
+        self.read_time_minutes = parse_read_time(self.read_time_minutes or kwargs.get('read_time', 0))
         self.seo_description = self.seo_description or kwargs.get('meta_description')
         
+        # Derived at ingest: words in content, and the source body it was rendered from
+        self.word_count: Optional[int] = kwargs.get('word_count')
+        self.content_hash: Optional[str] = kwargs.get('content_hash')
+        
         # Mobile-specific fields
         self.mobile_title: Optional[str] = kwargs.get('mobile_title')
         self.mobile_excerpt: Optional[str] = kwargs.get('mobile_excerpt')
@@ -82,6 +110,16 @@ class Article(BaseModel):
         data = db.get_article(slug=slug)
         return cls.from_dict(data) if data else None
     
+    @classmethod
+    def find_by_content_hash(cls, content_hash: str) -> Optional['Article']:
+        """Find an article whose content was rendered from the source body with this hash"""
+        db = cls.get_db()
+        data = db.execute_one("""
+            SELECT id, content, word_count, read_time_minutes, content_hash
+            FROM articles WHERE content_hash = ? LIMIT 1
+        """, (content_hash,))
+        return cls.from_dict(data) if data else None
+    
     @classmethod
     def find_all(cls, category_id: Optional[int] = None, author_id: Optional[int] = None,
                  limit: int = 20, offset: int = 0) -> List['Article']:
@@ -91,6 +129,44 @@ class Article(BaseModel):
                                  limit=limit, offset=offset)
         return [cls.from_dict(data) for data in results]
     
+    @classmethod
+    def find_all_with_relations(cls, category_id: Optional[int] = None, author_id: Optional[int] = None,
+                                limit: int = 20, offset: int = 0) -> List['Article']:
+        """
+        Find articles with their authors and categories prefetched
+        
+        Runs three queries however many articles are returned, so
+        get_author() and get_category() don't query per article.
+        """
+        articles = cls.find_all(category_id=category_id, author_id=author_id,
+                                limit=limit, offset=offset)
+        cls.prefetch_relations(articles)
+        return articles
+    
+    @classmethod
+    def prefetch_relations(cls, articles: List['Article']) -> None:
+        """Load the authors and categories of articles in two queries"""
+        authors = Author.find_by_ids([article.author_id for article in articles])
+        categories = Category.find_by_ids([article.category_id for article in articles])
+        for article in articles:
+            article._author = authors.get(article.author_id)
+            article._category = categories.get(article.category_id)
+    
+    @classmethod
+    def find_page(cls, category_id: Optional[int] = None, author_id: Optional[int] = None,
+                  limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Find one page of articles, newest first, without their bodies (keyset pagination)"""
+        db = cls.get_db()
+        page = db.get_articles_page(category_id=category_id, author_id=author_id,
+                                    limit=limit, cursor=cursor)
+        page['items'] = [cls.from_dict(data) for data in page['items']]
+        return page
+    
+    @classmethod
+    def count_by_category(cls) -> Dict[int, int]:
+        """Article count per category ID"""
+        return cls.get_db().get_article_counts_by_category()
+    
     @classmethod
     def search(cls, search_term: str, limit: int = 20) -> List['Article']:
         """Search articles by term"""
@@ -147,6 +223,11 @@ class Article(BaseModel):
         if validation_result.get('warnings'):
             logger.info(f"Article validation warnings: {'; '.join(validation_result['warnings'])}")
         
+        # Stored so renderers and APIs read the counts instead of re-deriving them
+        self.word_count = count_words(self.content)
+        if not self.read_time_minutes:
+            self.read_time_minutes = estimate_read_time(self.word_count)
+        
         db = self.get_db()
         
         try:
@@ -159,7 +240,9 @@ class Article(BaseModel):
                     hero_image_url = ?, thumbnail_url = ?, tags = ?, views = ?, likes = ?,
                     comments = ?, read_time_minutes = ?, seo_title = ?, seo_description = ?,
                     mobile_title = ?, mobile_excerpt = ?, mobile_hero_image_id = ?,
-                    updated_at = CURRENT_TIMESTAMP
+                    word_count = ?, updated_at = CURRENT_TIMESTAMP,
+                    -- Kept only while the content it identifies is unchanged
+                    content_hash = CASE WHEN ? IS NOT NULL THEN ? WHEN content IS ? THEN content_hash END
                 WHERE id = ?
                 """
                 tags_json = json.dumps(self.tags) if self.tags else None
@@ -169,7 +252,8 @@ class Article(BaseModel):
                          self.thumbnail_url, tags_json, self.views, self.likes,
                          self.comments, self.read_time_minutes, self.seo_title,
                          self.seo_description, self.mobile_title, self.mobile_excerpt,
-                         self.mobile_hero_image_id, self.id)
+                         self.mobile_hero_image_id, self.word_count,
+                         self.content_hash, self.content_hash, self.content, self.id)
                 db.execute_write(query, params)
             else:
                 # Create new article
@@ -179,8 +263,8 @@ class Article(BaseModel):
                                     hero_image_url, thumbnail_url, tags, views, likes,
                                     comments, read_time_minutes, seo_title, seo_description,
                                     mobile_title, mobile_excerpt, mobile_hero_image_id,
-                                    created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                                    word_count, content_hash, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
                         CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
                 """
                 tags_json = json.dumps(self.tags) if self.tags else None
@@ -190,7 +274,7 @@ class Article(BaseModel):
                          self.thumbnail_url, tags_json, self.views, self.likes,
                          self.comments, self.read_time_minutes, self.seo_title,
                          self.seo_description, self.mobile_title, self.mobile_excerpt,
-                         self.mobile_hero_image_id)
+                         self.mobile_hero_image_id, self.word_count, self.content_hash)
                 self.id = db.execute_write(query, params)
         
             logger.info(f"Article saved successfully: {self.title} (ID: {self.id})")
@@ -217,12 +301,16 @@ class Article(BaseModel):
     
     def get_author(self) -> Optional[Author]:
         """Get the author of this article"""
+        if '_author' in self.__dict__:
+            return self._author
         if self.author_id:
             return Author.find_by_id(self.author_id)
         return None
     
     def get_category(self) -> Optional[Category]:
         """Get the category of this article"""
+        if '_category' in self.__dict__:
+            return self._category
         if self.category_id:
             return Category.find_by_id(self.category_id)
         return None
@@ -362,22 +450,18 @@ class Article(BaseModel):
     
     
     def get_word_count(self) -> int:
-        """Get estimated word count of content"""
-        if self.content:
-            import re
-            # Remove HTML tags and count words
-            clean_content = re.sub(r'<[^>]+>', '', self.content)
-            words = clean_content.split()
-            return len(words)
-        return 0
+        """Get word count of content, as stored when the article was saved"""
+        if self.word_count is None:
+            self.word_count = count_words(self.content)
+        return self.word_count
     
     def estimate_reading_time(self) -> int:
         """Estimate reading time based on word count (200 words per minute)"""
-        word_count = self.get_word_count()
-        return max(1, round(word_count / 200))
+        return estimate_read_time(self.get_word_count())
     
     def update_reading_time(self) -> None:
         """Update reading time based on content"""
+        self.word_count = count_words(self.content)
         self.read_time_minutes = self.estimate_reading_time()
         self.save()
     
@@ -50,6 +50,19 @@ class Author(BaseModel):
         data = db.get_author(slug=slug)
         return cls.from_dict(data) if data else None
     
+    @classmethod
+    def find_by_name(cls, name: str) -> Optional['Author']:
+        """Find author by name (case-insensitive)"""
+        db = cls.get_db()
+        data = db.execute_one("SELECT * FROM authors WHERE name = ? COLLATE NOCASE LIMIT 1", (name,))
+        return cls.from_dict(data) if data else None
+    
+    @classmethod
+    def find_by_ids(cls, author_ids: List[int]) -> Dict[int, 'Author']:
+        """Find several authors at once, keyed by ID"""
+        db = cls.get_db()
+        return {data['id']: cls.from_dict(data) for data in db.get_authors_by_ids(author_ids)}
+    
     @classmethod
     def find_all(cls, limit: int = 100, offset: int = 0) -> List['Author']:
         """Find all authors with optional pagination"""
@@ -57,6 +70,14 @@ class Author(BaseModel):
         results = db.get_authors(limit=limit, offset=offset)
         return [cls.from_dict(data) for data in results]
     
+    @classmethod
+    def find_page(cls, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Find one page of authors in name order (keyset pagination)"""
+        db = cls.get_db()
+        page = db.get_authors_page(limit=limit, cursor=cursor)
+        page['items'] = [cls.from_dict(data) for data in page['items']]
+        return page
+    
     def save(self) -> int:
         """Save author to database"""
         db = self.get_db()
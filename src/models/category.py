@@ -39,6 +39,19 @@ class Category(BaseModel):
         data = db.get_category(slug=slug)
         return cls.from_dict(data) if data else None
     
+    @classmethod
+    def find_by_name(cls, name: str) -> Optional['Category']:
+        """Find category by name (case-insensitive)"""
+        db = cls.get_db()
+        data = db.execute_one("SELECT * FROM categories WHERE name = ? COLLATE NOCASE LIMIT 1", (name,))
+        return cls.from_dict(data) if data else None
+    
+    @classmethod
+    def find_by_ids(cls, category_ids: List[int]) -> Dict[int, 'Category']:
+        """Find several categories at once, keyed by ID"""
+        db = cls.get_db()
+        return {data['id']: cls.from_dict(data) for data in db.get_categories_by_ids(category_ids)}
+    
     @classmethod
     def find_all(cls, limit: int = 100, offset: int = 0) -> List['Category']:
         """Find all categories with optional pagination"""
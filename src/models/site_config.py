@@ -6,6 +6,7 @@ Model for managing site-wide configuration data
 """
 
 import datetime
+import time
 from typing import Dict, List, Optional, Any, Union
 from .base import BaseModel
 
@@ -15,6 +16,14 @@ class SiteConfig(BaseModel):
     table_name = 'site_config'
     required_fields = ['config_type', 'config_key', 'config_value']
     
+    # Process-wide snapshot of get_all_config(), reloaded when the version
+    # counter moves past the version it was loaded at. Writes through this
+    # model bump the counter.
+    _version = 0
+    _snapshot: Optional[Dict[str, Dict[str, str]]] = None
+    _snapshot_version = -1
+    _snapshot_time = 0.0
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.config_type = kwargs.get('config_type', '')
@@ -56,6 +65,8 @@ class SiteConfig(BaseModel):
                     self.id = result  # execute_write returns lastrowid for INSERT
                 success = bool(result)
             
+            if success:
+                SiteConfig.invalidate_snapshot()
             return success
             
         except Exception as e:
@@ -177,12 +188,58 @@ class SiteConfig(BaseModel):
                         success_count += 1
             
             print(f"Site config bulk update: {success_count}/{total_count} successful")
+            SiteConfig.invalidate_snapshot()
             return success_count == total_count
             
         except Exception as e:
             print(f"Error in bulk update: {e}")
             return False
     
+    @classmethod
+    def get_version(cls) -> int:
+        """Current configuration version (bumped on every write)"""
+        return SiteConfig._version
+    
+    @classmethod
+    def invalidate_snapshot(cls) -> None:
+        """Bump the version so the next snapshot read reloads from the database"""
+        SiteConfig._version += 1
+    
+    @classmethod
+    def get_snapshot(cls, max_age: Optional[float] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Get all site configuration from the in-process snapshot
+        
+        The same dict object is returned until the configuration content
+        changes, so callers can key derived caches on it. Treat it as
+        read-only.
+        
+        Args:
+            max_age: Reload a snapshot older than this many seconds, to pick
+                up writes made by other processes
+            
+        Returns:
+            Configuration organized by type
+        """
+        stale = (SiteConfig._snapshot is None or
+                 SiteConfig._snapshot_version != SiteConfig._version or
+                 (max_age is not None and time.monotonic() - SiteConfig._snapshot_time >= max_age))
+        if not stale:
+            return SiteConfig._snapshot
+        
+        version = SiteConfig._version
+        config = cls.get_all_config()
+        if not config:
+            # Don't hold on to an empty result (e.g. a failed query)
+            return config
+        
+        # Keep the old dict when nothing actually changed
+        if config != SiteConfig._snapshot:
+            SiteConfig._snapshot = config
+        SiteConfig._snapshot_version = version
+        SiteConfig._snapshot_time = time.monotonic()
+        return SiteConfig._snapshot
+    
     def __str__(self):
         return f"SiteConfig({self.config_type}.{self.config_key}={self.config_value})"
         
@@ -5,18 +5,129 @@ Handles responsive image generation, format conversion, and optimization
 
 import os
 import json
-from typing import Dict, List, Tuple, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 from pathlib import Path
 import hashlib
 from PIL import Image, ImageOps
 from PIL.ImageFile import ImageFile
 import io
 
+from .config import config
 from .logger import get_logger
+from .variant_store import VariantStore, hash_file
 from ..database.db_manager import DatabaseManager
 
 logger = get_logger(__name__)
 
+
+def _save_variant(img: Image.Image, variant_path: Path, format_name: str,
+                  settings: Dict[str, Any]) -> int:
+    """Encode one variant; returns the quality used"""
+    quality = settings['quality'].get(format_name, 85)
+    save_kwargs = {'format': format_name, 'quality': quality, 'optimize': True}
+    
+    # Additional settings for specific formats
+    if format_name == 'WEBP':
+        save_kwargs['method'] = settings['webp_method']
+    elif format_name == 'AVIF':
+        save_kwargs['speed'] = 6  # Balance between speed and compression
+    
+    # Write beside the target and rename, so a store file is never partial
+    tmp_path = variant_path.with_name(variant_path.name + '.tmp')
+    img.save(tmp_path, **save_kwargs)
+    os.replace(tmp_path, variant_path)
+    return quality
+
+
+def render_image_variants(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create the responsive variants of one source image (runs in pool workers)
+    
+    Widths are produced largest first, each resized from the previous
+    (nearest larger) variant instead of the full-size original, and each
+    size is resized once for all formats. Variants are written to the
+    content-addressed store, so one whose file already exists is skipped.
+    
+    Args:
+        task: source_hash, path, output_dir, settings and force
+            
+    Returns:
+        Dict with source_hash, variants, written, skipped and error
+        (None on success)
+    """
+    settings = task['settings']
+    output_dir = Path(task['output_dir'])
+    source_hash = task['source_hash']
+    outcome = {'source_hash': source_hash, 'variants': [],
+               'written': 0, 'skipped': 0, 'error': None}
+    
+    try:
+        with Image.open(task['path']) as img:
+            original_width, original_height = img.size
+            aspect_ratio = original_width / original_height
+            
+            # (device type, width, height), largest first; skip widths larger than the original
+            plan = sorted(((device_type, width, int(width / aspect_ratio))
+                           for device_type, widths in settings['breakpoints'].items()
+                           for width in widths if width <= original_width),
+                          key=lambda size: -size[1])
+            
+            pending = {}
+            for device_type, width, height in plan:
+                for format_name in settings['formats']:
+                    quality = settings['quality'].get(format_name, 85)
+                    filename = VariantStore.relative_path(source_hash, width, height, format_name, quality)
+                    variant_path = output_dir / filename
+                    if not task.get('force') and variant_path.exists():
+                        outcome['variants'].append(ImageProcessor.describe_variant(
+                            device_type, width, height, format_name, filename,
+                            variant_path.stat().st_size, quality))
+                        outcome['skipped'] += 1
+                    else:
+                        pending.setdefault(width, []).append(format_name)
+            
+            if not pending:
+                return outcome
+            
+            # Let the JPEG decoder downscale (by 1/2, 1/4, 1/8) to just above the largest size needed
+            largest = next(size for size in plan if size[1] in pending)
+            if img.format == 'JPEG':
+                img.draft('RGB', (largest[1], largest[2]))
+            
+            # Convert to RGB if necessary
+            current = img.convert('RGB') if img.mode in ('RGBA', 'LA', 'P') else img
+            smallest_pending = min(pending)
+            
+            for device_type, width, height in plan:
+                if width > largest[1]:
+                    continue
+                if width < smallest_pending:
+                    break
+                current = current.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+                
+                for format_name in pending.get(width, []):
+                    quality = settings['quality'].get(format_name, 85)
+                    filename = VariantStore.relative_path(source_hash, width, height, format_name, quality)
+                    variant_path = output_dir / filename
+                    variant_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        quality = _save_variant(current, variant_path, format_name, settings)
+                    except Exception as e:
+                        logger.warning(f"Failed to create {format_name} variant {width}x{height}: {e}")
+                        continue
+                    outcome['variants'].append(ImageProcessor.describe_variant(
+                        device_type, width, height, format_name, filename,
+                        variant_path.stat().st_size, quality))
+                    outcome['written'] += 1
+        
+    except Exception as e:
+        outcome['error'] = str(e)
+    
+    return outcome
+
+
 class ImageProcessor:
     """Handles responsive image generation and optimization"""
     
@@ -39,125 +150,107 @@ class ImageProcessor:
     
     def __init__(self, base_images_dir: str = "assets/images", db_manager: Optional[DatabaseManager] = None):
         self.base_images_dir = Path(base_images_dir)
+        self.responsive_dir = self.base_images_dir / "responsive"
         self.db = db_manager or DatabaseManager()
         
         # Ensure directories exist
         self.base_images_dir.mkdir(parents=True, exist_ok=True)
-        (self.base_images_dir / "responsive").mkdir(exist_ok=True)
+        self.responsive_dir.mkdir(exist_ok=True)
         
+        self.settings = {
+            'breakpoints': self.BREAKPOINTS,
+            'formats': self.FORMATS,
+            'quality': self.QUALITY_SETTINGS,
+            # WEBP method 6 is several times slower than 4 for ~1-2% smaller files
+            'webp_method': config.get('images.webp_method', 4)
+        }
+        self.store = VariantStore(self.responsive_dir, self.db)
+    
+    @staticmethod
+    def describe_variant(device_type: str, width: int, height: int, format_name: str,
+                         filename: str, file_size: int, quality: int) -> Dict[str, Any]:
+        """Variant record as stored in image_variants"""
+        return {
+            'variant_type': device_type,
+            'width': width,
+            'height': height,
+            'format': format_name.lower(),
+            'filename': filename,
+            'file_size': file_size,
+            'quality': quality
+        }
+    
+    def _variant_task(self, source_hash: str, image_path: Path, force: bool = False) -> Dict[str, Any]:
+        """Work item for render_image_variants()"""
+        return {
+            'source_hash': source_hash,
+            'path': str(image_path),
+            'output_dir': str(self.responsive_dir),
+            'settings': self.settings,
+            'force': force
+        }
+    
+    @staticmethod
+    def _group_variants(variants: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
+        """Variants grouped by device type, smallest first"""
+        grouped: Dict[str, List[Dict]] = {}
+        for variant in sorted(variants, key=lambda v: (v['width'], v['format'])):
+            grouped.setdefault(variant['variant_type'], []).append(variant)
+        return grouped
+    
+    @staticmethod
+    def resolve_workers(workers: Optional[int] = None) -> int:
+        """Worker processes to use (images.variant_workers; 0 = one per CPU core)"""
+        if workers is None:
+            workers = config.get('images.variant_workers', 0)
+        try:
+            workers = int(workers)
+        except (TypeError, ValueError):
+            workers = 0
+        return workers if workers > 0 else (os.cpu_count() or 1)
+    
+    def process_images(self, tasks: List[Dict[str, Any]], workers: int) -> Iterator[Dict[str, Any]]:
+        """
+        Run variant tasks, across a process pool when there is more than one
+        
+        Yields:
+            render_image_variants() results, in task order
+        """
+        workers = min(workers, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                yield render_image_variants(task)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(render_image_variants, tasks)
+    
     def generate_responsive_variants(self, original_image_path: str, image_id: int) -> Dict[str, List[Dict]]:
         """Generate responsive variants for an image"""
         try:
-            # Load original image
-            with Image.open(original_image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                
-                original_width, original_height = img.size
-                aspect_ratio = original_width / original_height
-                
-                variants = {}
-                
-                # Generate variants for each device type
-                for device_type, widths in self.BREAKPOINTS.items():
-                    variants[device_type] = []
-                    
-                    for width in widths:
-                        # Skip if width is larger than original
-                        if width > original_width:
-                            continue
-                            
-                        height = int(width / aspect_ratio)
-                        
-                        # Generate variants in different formats
-                        for format_name in self.FORMATS:
-                            try:
-                                variant_info = self._create_variant(
-                                    img, image_id, device_type, width, height, format_name
-                                )
-                                if variant_info:
-                                    variants[device_type].append(variant_info)
-                                    
-                            except Exception as e:
-                                logger.warning(f"Failed to create {format_name} variant {width}x{height}: {e}")
-                                continue
-                
-                # Store variants in database
-                self._store_variants_in_db(image_id, variants)
-                
-                logger.info(f"Generated {sum(len(v) for v in variants.values())} variants for image {image_id}")
-                return variants
-                
-        except Exception as e:
+            source_hash = hash_file(Path(original_image_path))
+        except OSError as e:
             logger.error(f"Failed to generate responsive variants for {original_image_path}: {e}")
             return {}
+        
+        outcome = render_image_variants(self._variant_task(source_hash, Path(original_image_path)))
+        if outcome['error']:
+            logger.error(f"Failed to generate responsive variants for {original_image_path}: {outcome['error']}")
+            return {}
+        
+        variants = self._group_variants(outcome['variants'])
+        
+        # Store variants in database
+        self._store_variants_in_db(image_id, source_hash, variants)
+        
+        logger.info(f"Generated {outcome['written']} variants for image {image_id} "
+                    f"({outcome['skipped']} up to date)")
+        return variants
     
-    def _create_variant(self, img: Image.Image, image_id: int, device_type: str, 
-                       width: int, height: int, format_name: str) -> Optional[Dict]:
-        """Create a single image variant"""
-        try:
-            # Resize image
-            resized_img = img.resize((width, height), Image.Resampling.LANCZOS)
-            
-            # Generate filename
-            format_ext = 'jpg' if format_name == 'JPEG' else format_name.lower()
-            filename = f"img_{image_id}_{device_type}_{width}x{height}.{format_ext}"
-            variant_path = self.base_images_dir / "responsive" / filename
-            
-            # Save with appropriate quality
-            quality = self.QUALITY_SETTINGS.get(format_name, 85)
-            save_kwargs = {'format': format_name, 'quality': quality, 'optimize': True}
-            
-            # Additional settings for specific formats
-            if format_name == 'WEBP':
-                save_kwargs['method'] = 6  # Better compression
-            elif format_name == 'AVIF':
-                save_kwargs['speed'] = 6  # Balance between speed and compression
-            
-            resized_img.save(variant_path, **save_kwargs)
-            
-            # Get file size
-            file_size = variant_path.stat().st_size
-            
-            return {
-                'variant_type': device_type,
-                'width': width,
-                'height': height,
-                'format': format_name.lower(),
-                'filename': filename,
-                'file_size': file_size,
-                'quality': quality
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to create variant {width}x{height} in {format_name}: {e}")
-            return None
-    
-    def _store_variants_in_db(self, image_id: int, variants: Dict[str, List[Dict]]) -> None:
-        """Store image variants in database"""
+    def _store_variants_in_db(self, image_id: int, source_hash: str, variants: Dict[str, List[Dict]]) -> None:
+        """Link an image's variants to their store entries"""
         try:
-            # Clear existing variants for this image
-            self.db.execute_write("DELETE FROM image_variants WHERE image_id = ?", (image_id,))
-            
-            # Insert new variants
-            for device_variants in variants.values():
-                for variant in device_variants:
-                    self.db.execute_write("""
-                        INSERT INTO image_variants 
-                        (image_id, variant_type, width, height, format, filename, file_size, quality)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        image_id,
-                        variant['variant_type'],
-                        variant['width'],
-                        variant['height'],
-                        variant['format'],
-                        variant['filename'],
-                        variant['file_size'],
-                        variant['quality']
-                    ))
-            
+            self.store.link(image_id, source_hash,
+                            [variant for device_variants in variants.values() for variant in device_variants])
             logger.info(f"Stored variants for image {image_id} in database")
             
         except Exception as e:
@@ -197,15 +290,15 @@ class ImageProcessor:
                 desktop_webp = [v for v in webp_variants if v['variant_type'] == 'desktop']
                 
                 if mobile_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in mobile_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in mobile_webp])
                     html.append(f'  <source media="(max-width: 640px)" srcset="{srcset}" type="image/webp" sizes="100vw">')
                 
                 if tablet_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in tablet_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in tablet_webp])
                     html.append(f'  <source media="(max-width: 1024px)" srcset="{srcset}" type="image/webp" sizes="50vw">')
                 
                 if desktop_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in desktop_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in desktop_webp])
                     html.append(f'  <source srcset="{srcset}" type="image/webp" sizes="33vw">')
             
             # JPEG fallback sources
@@ -215,16 +308,16 @@ class ImageProcessor:
                 desktop_jpeg = [v for v in jpeg_variants if v['variant_type'] == 'desktop']
                 
                 if mobile_jpeg:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in mobile_jpeg])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in mobile_jpeg])
                     html.append(f'  <source media="(max-width: 640px)" srcset="{srcset}" sizes="100vw">')
                 
                 if tablet_jpeg:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in tablet_jpeg])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in tablet_jpeg])
                     html.append(f'  <source media="(max-width: 1024px)" srcset="{srcset}" sizes="50vw">')
             
             # Fallback img element
             fallback_variant = jpeg_variants[0] if jpeg_variants else variants[0]
-            fallback_src = f"assets/images/responsive/{fallback_variant['filename']}"
+            fallback_src = f"assets/images/responsive/{fallback_variant['local_filename']}"
             html.append(f'  <img src="{fallback_src}" alt="{alt_text}" class="{css_classes}" loading="lazy">')
             
             html.append('</picture>')
@@ -236,9 +329,27 @@ class ImageProcessor:
             # Fallback to simple img tag
             return f'<img src="assets/images/placeholder.jpg" alt="{alt_text}" class="{css_classes}" loading="lazy">'
     
-    def optimize_existing_images(self) -> Dict[str, int]:
-        """Optimize all existing images in the database"""
-        results = {'processed': 0, 'failed': 0, 'skipped': 0}
+    def optimize_existing_images(self, workers: Optional[int] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        Optimize all existing images in the database
+        
+        Images are grouped by the hash of their bytes and each distinct
+        source is encoded once, across a process pool; every image with
+        that source is then linked to the same store entries. Variants
+        already in the store are skipped, so re-runs only encode new
+        sources.
+        
+        Args:
+            workers: Worker processes (defaults to images.variant_workers)
+            force: Re-encode every variant
+            
+        Returns:
+            Counts of processed/skipped/failed images, distinct sources,
+            images deduplicated onto another's source, variants written and skipped, elapsed seconds and
+            images/variants per second
+        """
+        results = {'processed': 0, 'failed': 0, 'skipped': 0, 'sources': 0, 'deduplicated': 0,
+                   'variants_written': 0, 'variants_skipped': 0}
         
         try:
             # Get all images from database
@@ -248,6 +359,10 @@ class ImageProcessor:
                 WHERE is_placeholder = 0
             """)
             
+            start = time.perf_counter()
+            
+            # Source hash -> images sharing those bytes
+            sources: Dict[str, List[Dict[str, Any]]] = {}
             for image in images:
                 image_path = self.base_images_dir / image['local_filename']
                 
@@ -256,30 +371,42 @@ class ImageProcessor:
                     results['skipped'] += 1
                     continue
                 
-                try:
-                    # Check if variants already exist
-                    existing_variants = self.db.execute_query(
-                        "SELECT COUNT(*) as count FROM image_variants WHERE image_id = ?",
-                        (image['id'],)
-                    )
-                    
-                    if existing_variants and existing_variants[0]['count'] > 0:
-                        logger.info(f"Variants already exist for image {image['id']}, skipping")
+                sources.setdefault(hash_file(image_path), []).append(image)
+            
+            tasks = [self._variant_task(source_hash, self.base_images_dir / group[0]['local_filename'], force)
+                     for source_hash, group in sources.items()]
+            results['sources'] = len(tasks)
+            results['deduplicated'] = sum(len(group) for group in sources.values()) - len(tasks)
+            
+            linked = self.store.linked_files()
+            workers = self.resolve_workers(workers)
+            
+            for outcome in self.process_images(tasks, workers):
+                group = sources[outcome['source_hash']]
+                if outcome['error'] or not outcome['variants']:
+                    for image in group:
+                        logger.error(f"Failed to process image {image['id']}: {outcome['error'] or 'no variants'}")
+                    results['failed'] += len(group)
+                    continue
+                
+                results['variants_written'] += outcome['written']
+                results['variants_skipped'] += outcome['skipped']
+                filenames = {variant['filename'] for variant in outcome['variants']}
+                variants = self._group_variants(outcome['variants'])
+                
+                for image in group:
+                    if linked.get(image['id']) == filenames:
                         results['skipped'] += 1
                         continue
-                    
-                    # Generate responsive variants
-                    variants = self.generate_responsive_variants(str(image_path), image['id'])
-                    
-                    if variants:
-                        results['processed'] += 1
-                        logger.info(f"Processed image {image['id']}: {image['local_filename']}")
-                    else:
-                        results['failed'] += 1
-                        
-                except Exception as e:
-                    logger.error(f"Failed to process image {image['id']}: {e}")
-                    results['failed'] += 1
+                    self._store_variants_in_db(image['id'], outcome['source_hash'], variants)
+                    results['processed'] += 1
+            
+            elapsed = time.perf_counter() - start
+            image_count = sum(len(group) for group in sources.values())
+            results['workers'] = min(workers, len(tasks)) or 1
+            results['elapsed_seconds'] = round(elapsed, 2)
+            results['images_per_second'] = round(image_count / elapsed, 2) if elapsed else 0.0
+            results['variants_per_second'] = round(results['variants_written'] / elapsed, 2) if elapsed else 0.0
             
             logger.info(f"Image optimization complete: {results}")
             return results
@@ -288,6 +415,10 @@ class ImageProcessor:
             logger.error(f"Failed to optimize existing images: {e}")
             return results
     
+    def collect_garbage(self, dry_run: bool = False) -> Dict[str, int]:
+        """Delete stored variants no image references any more (see VariantStore.collect_garbage)"""
+        return self.store.collect_garbage(dry_run=dry_run)
+    
     def create_placeholder_variants(self) -> None:
         """Create responsive variants for placeholder images"""
         try:
@@ -384,6 +515,10 @@ def main():
     parser.add_argument('--optimize-all', action='store_true', help='Optimize all existing images')
     parser.add_argument('--create-placeholders', action='store_true', help='Create placeholder images')
     parser.add_argument('--image-id', type=int, help='Process specific image by ID')
+    parser.add_argument('--workers', type=int, help='Worker processes for --optimize-all (0 = one per CPU core)')
+    parser.add_argument('--force', action='store_true', help='Re-encode variants that are up to date')
+    parser.add_argument('--gc', action='store_true', help='Delete stored variants no image references')
+    parser.add_argument('--dry-run', action='store_true', help='With --gc, only report what would be deleted')
     
     args = parser.parse_args()
     
@@ -391,8 +526,20 @@ def main():
     
     if args.optimize_all:
         print("Optimizing all existing images...")
-        results = processor.optimize_existing_images()
+        results = processor.optimize_existing_images(workers=args.workers, force=args.force)
         print(f"Results: {results}")
+        if 'elapsed_seconds' in results:
+            print(f"Throughput: {results['images_per_second']} images/s, "
+                  f"{results['variants_per_second']} variants/s on {results['workers']} workers "
+                  f"({results['elapsed_seconds']}s)")
+    
+    if args.gc:
+        print("Collecting unreferenced image variants...")
+        stats = processor.collect_garbage(dry_run=args.dry_run)
+        verb = "Would remove" if args.dry_run else "Removed"
+        print(f"{verb} {stats['entries_removed']} entries, {stats['files_removed']} files "
+              f"({stats['bytes_freed'] / 1024 / 1024:.1f} MB)")
+        print(f"Store: {processor.store.get_stats()}")
     
     if args.create_placeholders:
         print("Creating placeholder images...")
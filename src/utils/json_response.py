@@ -0,0 +1,111 @@
+"""
+JSON Response Encoding
+======================
+Compact JSON serialization and Accept-Encoding negotiation shared by the
+API servers. Brotli is used when the optional ``brotli`` package is
+installed, gzip otherwise.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from .config import config
+except ImportError:
+    from src.utils.config import config
+
+
+# Bodies smaller than this are sent uncompressed; headers would eat the gain
+MIN_COMPRESS_BYTES = 512
+
+COMPACT_SEPARATORS = (',', ':')
+
+
+def encode_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize a response body
+
+    Args:
+        data: JSON-serializable value
+        pretty: Indent for humans (the ?pretty=1 debug switch)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=COMPACT_SEPARATORS, ensure_ascii=False).encode('utf-8')
+
+
+def is_pretty(query_params: Dict[str, list]) -> bool:
+    """Whether parse_qs() output asks for indented JSON"""
+    return query_params.get('pretty', ['0'])[0].lower() in ('1', 'true', 'yes')
+
+
+def available_encodings() -> list:
+    """Content codings this server can produce, most preferred first"""
+    if not config.get('performance.compress_responses', True):
+        return []
+    encodings = []
+    if brotli is not None:
+        encodings.append('br')
+    if config.get('performance.enable_gzip', True):
+        encodings.append('gzip')
+    return encodings
+
+
+def _accepted(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Parse Accept-Encoding into coding -> q-value"""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: Optional[str], body_size: int) -> Optional[str]:
+    """
+    Pick a content coding for a response
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header
+        body_size: Uncompressed body size in bytes
+
+    Returns:
+        'br', 'gzip', or None for identity
+    """
+    if body_size < MIN_COMPRESS_BYTES:
+        return None
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get('*', 0.0)
+    for encoding in available_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    """Compress a body with a coding returned by negotiate_encoding()"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    if encoding == 'gzip':
+        # mtime=0 keeps the output (and so the ETag) deterministic
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
@@ -0,0 +1,43 @@
+"""
+Single-pass multi-string replacement for Influencer News CMS
+Replaces many literal strings in one scan of the text
+"""
+
+import re
+from typing import Dict, Optional
+
+
+class MultiReplacer:
+    """
+    Replace every key of a table with its value in a single pass
+
+    Keys are combined into one compiled alternation, longest first, so a
+    key that contains another (e.g. ' - Influencer News' and
+    'Influencer News') wins where both match, as it would with ordered
+    str.replace calls. Replaced text is never scanned again.
+    """
+
+    def __init__(self, replacements: Dict[str, Optional[str]]):
+        """
+        Build the replacer
+
+        Args:
+            replacements: old -> new; entries with an empty key or a None
+                or empty value are ignored
+        """
+        self.replacements = {old: str(new) for old, new in replacements.items() if old and new}
+        if self.replacements:
+            keys = sorted(self.replacements, key=len, reverse=True)
+            self._pattern = re.compile('|'.join(re.escape(key) for key in keys))
+        else:
+            self._pattern = None
+
+    def apply(self, text: str) -> str:
+        """Return text with all replacements applied"""
+        if self._pattern is None:
+            return text
+        lookup = self.replacements.__getitem__
+        return self._pattern.sub(lambda match: lookup(match.group(0)), text)
+
+    def __len__(self) -> int:
+        return len(self.replacements)
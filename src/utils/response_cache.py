@@ -0,0 +1,162 @@
+"""
+Response Cache
+==============
+In-memory LRU cache of serialized API responses with strong ETags.
+Entries are dropped as soon as any connection commits to the database.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+try:
+    from .json_response import compress
+except ImportError:
+    from src.utils.json_response import compress
+
+
+class CachedResponse:
+    """A serialized response body, its ETag and its compressed variants"""
+
+    __slots__ = ('body', 'etag', '_encoded')
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self._encoded: Dict[str, Tuple[bytes, str]] = {}
+
+    def encoded(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """
+        Body and ETag for a content coding
+
+        Each coding is compressed once, on first use, and kept with the
+        entry. Every coding gets its own strong ETag.
+        """
+        if not encoding:
+            return self.body, self.etag
+        variant = self._encoded.get(encoding)
+        if variant is None:
+            variant = (compress(self.body, encoding), f'{self.etag[:-1]}-{encoding}"')
+            self._encoded[encoding] = variant
+        return variant
+
+
+class ResponseCache:
+    """
+    LRU cache of response bodies keyed by path and normalized query
+
+    Freshness is tied to SQLite's ``PRAGMA data_version``, read on a
+    dedicated connection: it changes whenever another connection (or
+    process) commits, at which point the whole cache is dropped.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 256):
+        """
+        Initialize the cache
+
+        Args:
+            db_path: Database whose commits invalidate the cache
+            max_entries: Least recently used entries are evicted past this
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._version_conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._version = self._read_data_version()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    @staticmethod
+    def make_key(path: str, query: str = '') -> str:
+        """Cache key with query parameters sorted, so ?a=1&b=2 and ?b=2&a=1 match"""
+        params = sorted(parse_qsl(query, keep_blank_values=True))
+        return f"{path}?{urlencode(params)}" if params else path
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        """Strong ETag for a response body"""
+        return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Whether an If-None-Match header matches an ETag"""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        # If-None-Match uses weak comparison
+        return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
+
+    def _read_data_version(self) -> int:
+        return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def data_version(self) -> int:
+        """
+        Current database version, dropping every entry if it moved
+
+        Read it before building a response and pass it to put(), so a
+        response built while a write committed is not cached.
+        """
+        with self._lock:
+            version = self._read_data_version()
+            if version != self._version:
+                self._version = version
+                if self._entries:
+                    self._entries.clear()
+                    self._stats['invalidations'] += 1
+            return version
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Cached response for a key, or None"""
+        self.data_version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry
+
+    def put(self, key: str, body: bytes, version: int) -> CachedResponse:
+        """
+        Cache a response body
+
+        Args:
+            key: Key from make_key()
+            body: Serialized response
+            version: data_version() read before the response was built
+
+        Returns:
+            The entry (with its ETag), cached or not
+        """
+        entry = CachedResponse(body, self.make_etag(body))
+        with self._lock:
+            if version != self._version:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return entry
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close the version-check connection"""
+        with self._lock:
+            self._version_conn.close()
@@ -9,6 +9,7 @@ from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
 from .logger import get_logger
+from .variant_store import VariantStore, hash_file
 from ..database.db_manager import DatabaseManager
 
 logger = get_logger(__name__)
@@ -26,6 +27,9 @@ class ResponsiveImageManager:
     # Supported formats
     FORMATS = ['jpeg', 'webp', 'avif']
     
+    # Encoding quality per format (part of the variant store filename)
+    QUALITY = {'jpeg': 85, 'webp': 80, 'avif': 75}
+    
     def __init__(self, base_images_dir: str = "assets/images", db_manager: Optional[DatabaseManager] = None):
         self.base_images_dir = Path(base_images_dir)
         self.db = db_manager or DatabaseManager()
@@ -35,8 +39,26 @@ class ResponsiveImageManager:
         (self.base_images_dir / "responsive").mkdir(exist_ok=True)
         
     def register_image_variants(self, image_id: int, original_width: int, original_height: int) -> Dict[str, List[Dict]]:
-        """Register planned image variants in database (for when images are processed)"""
+        """
+        Register planned image variants in database (for when images are processed)
+        
+        Planned rows carry the variant store filename the image processor
+        will write, so they need the source file's hash; images without a
+        source file, or whose variants are already processed, are skipped.
+        """
         try:
+            image = self.db.execute_one("SELECT local_filename FROM images WHERE id = ?", (image_id,))
+            try:
+                source_hash = hash_file(self.base_images_dir / image['local_filename'])
+            except (OSError, TypeError):
+                logger.info(f"No source file for image {image_id}; variants are registered when it is processed")
+                return {}
+            
+            if self.db.execute_one(
+                    "SELECT 1 FROM image_variants WHERE image_id = ? AND is_optimized = 1", (image_id,)):
+                logger.info(f"Image {image_id} already has processed variants")
+                return {}
+            
             aspect_ratio = original_width / original_height
             variants = {}
             
@@ -53,14 +75,15 @@ class ResponsiveImageManager:
                     
                     # Register variants in different formats
                     for format_name in self.FORMATS:
+                        quality = self.QUALITY[format_name]
                         variant_info = {
                             'variant_type': device_type,
                             'width': width,
                             'height': height,
                             'format': format_name,
-                            'filename': f"img_{image_id}_{device_type}_{width}x{height}.{format_name}",
+                            'filename': VariantStore.relative_path(source_hash, width, height, format_name, quality),
                             'file_size': 0,  # Will be updated when actual file is created
-                            'quality': 85 if format_name == 'jpeg' else 80
+                            'quality': quality
                         }
                         variants[device_type].append(variant_info)
             
@@ -75,17 +98,18 @@ class ResponsiveImageManager:
             return {}
     
     def _store_variants_in_db(self, image_id: int, variants: Dict[str, List[Dict]]) -> None:
-        """Store image variants in database"""
+        """Store planned image variants in database"""
         try:
-            # Clear existing variants for this image
-            self.db.execute_write("DELETE FROM image_variants WHERE image_id = ?", (image_id,))
+            # Clear earlier planned variants for this image
+            self.db.execute_write(
+                "DELETE FROM image_variants WHERE image_id = ? AND is_optimized = 0", (image_id,))
             
             # Insert new variants
             for device_variants in variants.values():
                 for variant in device_variants:
                     self.db.execute_write("""
                         INSERT INTO image_variants 
-                        (image_id, variant_type, width, height, format, filename, file_size, quality)
+                        (image_id, variant_type, width, height, format, local_filename, file_size, quality)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         image_id,
@@ -137,15 +161,15 @@ class ResponsiveImageManager:
                 desktop_webp = [v for v in webp_variants if v['variant_type'] == 'desktop']
                 
                 if mobile_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in mobile_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in mobile_webp])
                     html_parts.append(f'    <source media="(max-width: 640px)" srcset="{srcset}" type="image/webp" sizes="100vw">')
                 
                 if tablet_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in tablet_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in tablet_webp])
                     html_parts.append(f'    <source media="(max-width: 1024px)" srcset="{srcset}" type="image/webp" sizes="50vw">')
                 
                 if desktop_webp:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in desktop_webp])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in desktop_webp])
                     html_parts.append(f'    <source srcset="{srcset}" type="image/webp" sizes="33vw">')
             
             # JPEG fallback sources
@@ -155,16 +179,16 @@ class ResponsiveImageManager:
                 desktop_jpeg = [v for v in jpeg_variants if v['variant_type'] == 'desktop']
                 
                 if mobile_jpeg:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in mobile_jpeg])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in mobile_jpeg])
                     html_parts.append(f'    <source media="(max-width: 640px)" srcset="{srcset}" sizes="100vw">')
                 
                 if tablet_jpeg:
-                    srcset = ', '.join([f"assets/images/responsive/{v['filename']} {v['width']}w" for v in tablet_jpeg])
+                    srcset = ', '.join([f"assets/images/responsive/{v['local_filename']} {v['width']}w" for v in tablet_jpeg])
                     html_parts.append(f'    <source media="(max-width: 1024px)" srcset="{srcset}" sizes="50vw">')
             
             # Fallback img element
             fallback_variant = jpeg_variants[0] if jpeg_variants else variants[0]
-            fallback_src = f"assets/images/responsive/{fallback_variant['filename']}"
+            fallback_src = f"assets/images/responsive/{fallback_variant['local_filename']}"
             html_parts.append(f'    <img src="{fallback_src}" alt="{alt_text}" class="{css_classes}" loading="{loading}">')
             
             html_parts.append('</picture>')
@@ -0,0 +1,175 @@
+"""
+Sanitize Cache
+==============
+Cache of HTML sanitizer output keyed by (content hash, sanitization mode)
+under a policy version. A bounded in-memory LRU serves repeated strings
+within a process; an optional SQLite store keeps results between builds
+and is shared by worker processes. Entries from another policy version
+(different allowed tags, attributes, protocols or bleach release) are
+never served, and the store is emptied when the policy changes.
+"""
+
+import os
+import atexit
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .logger import get_logger
+except ImportError:
+    from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Results written to the store per transaction
+FLUSH_EVERY = 64
+
+
+class SanitizeCache:
+    """LRU of sanitized strings with an optional persistent store"""
+
+    def __init__(self, policy: str, max_entries: int = 10000, path: Optional[str] = None,
+                 max_stored: int = 0):
+        """
+        Initialize the cache
+
+        Args:
+            policy: Version of the sanitization policy the results belong to
+            max_entries: Least recently used entries are evicted past this
+            path: SQLite file persisting results between runs (None = memory only)
+            max_stored: Oldest stored results are pruned past this (0 = unbounded)
+        """
+        self.policy = policy
+        self.max_entries = max(1, int(max_entries))
+        self.path = Path(path) if path else None
+        self.max_stored = max(0, int(max_stored or 0))
+        self._entries: 'OrderedDict[bytes, str]' = OrderedDict()
+        self._pending: List[Tuple[bytes, str]] = []
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._stats = {'hits': 0, 'store_hits': 0, 'misses': 0, 'evictions': 0}
+        if self.path:
+            atexit.register(self.flush)
+
+    @staticmethod
+    def make_key(content: str, allow_tags: bool) -> bytes:
+        """Cache key: the sanitization mode and a hash of the content"""
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return (b'h' if allow_tags else b't') + digest
+
+    def _store(self) -> Optional[sqlite3.Connection]:
+        """Connection to the persistent store, opened once per process"""
+        if not self.path:
+            return None
+        # A connection must not be used across fork(); worker processes open their own
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS sanitized (key BLOB PRIMARY KEY, result TEXT NOT NULL)")
+                conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value TEXT)")
+                row = conn.execute("SELECT value FROM cache_meta WHERE name = 'policy'").fetchone()
+                if not row or row[0] != self.policy:
+                    conn.execute("DELETE FROM sanitized")
+                    conn.execute("INSERT OR REPLACE INTO cache_meta (name, value) VALUES ('policy', ?)",
+                                 (self.policy,))
+        except sqlite3.Error as e:
+            logger.warning(f"Sanitize cache store {self.path} unavailable, caching in memory only: {e}")
+            self.path = None
+            return None
+        self._conn, self._conn_pid = conn, os.getpid()
+        self._pending = []
+        return conn
+
+    def _remember(self, key: bytes, result: str) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Sanitized result for a key, or None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return result
+
+            conn = self._store()
+            if conn is not None:
+                try:
+                    row = conn.execute("SELECT result FROM sanitized WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"Sanitize cache lookup failed: {e}")
+                    row = None
+                if row is not None:
+                    self._remember(key, row[0])
+                    self._stats['store_hits'] += 1
+                    return row[0]
+
+            self._stats['misses'] += 1
+            return None
+
+    def put(self, key: bytes, result: str) -> None:
+        """Cache a sanitized result"""
+        with self._lock:
+            self._remember(key, result)
+            if self._store() is not None:
+                self._pending.append((key, result))
+                if len(self._pending) >= FLUSH_EVERY:
+                    self._flush()
+
+    def flush(self) -> None:
+        """Write results not yet in the persistent store"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending or self._conn is None or self._conn_pid != os.getpid():
+            return
+        try:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO sanitized (key, result) VALUES (?, ?)",
+                                       self._pending)
+                if self.max_stored:
+                    self._conn.execute("DELETE FROM sanitized WHERE rowid <= "
+                                       "(SELECT MAX(rowid) FROM sanitized) - ?", (self.max_stored,))
+        except sqlite3.Error as e:
+            logger.warning(f"Sanitize cache write failed: {e}")
+        self._pending = []
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and in the store"""
+        with self._lock:
+            self._entries.clear()
+            self._pending = []
+            conn = self._store()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM sanitized")
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters"""
+        with self._lock:
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for this process"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['store_hits'] + stats['misses']
+        stats['lookups'] = lookups
+        stats['hit_rate'] = round((stats['hits'] + stats['store_hits']) / lookups, 4) if lookups else 0.0
+        return stats
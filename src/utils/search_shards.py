@@ -0,0 +1,101 @@
+"""
+Sharded Search Index
+====================
+Static inverted index for offline PWA search. Term postings are split
+into prefix shards and document metadata into fixed-size buckets, so a
+client only downloads the shards for the words it is looking up and the
+buckets holding its top hits.
+
+Layout written by the mobile API generator under api/mobile/search/:
+    index.json          prefix length, bucket size, shard and bucket lists
+    <prefix>.json       {"prefix": "cr", "terms": {"creator": [[doc, score], ...]}}
+    docs/<n>.json       {"bucket": n, "docs": [...]} for docs n*size .. (n+1)*size-1
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Same word pattern as the FTS5 query builder in database/search_index.py
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+INDEX_VERSION = 1
+
+
+def tokenize(text: str, min_length: int = 2) -> List[str]:
+    """Lowercased words of a text, dropping ones shorter than min_length"""
+    return [token for token in _TOKEN_PATTERN.findall((text or '').lower())
+            if len(token) >= min_length]
+
+
+def shard_name(prefix: str) -> str:
+    """File name (without .json) for a prefix; non-alphanumeric prefixes are hex-encoded"""
+    if prefix.isascii() and prefix.isalnum():
+        return prefix
+    return 'x' + prefix.encode('utf-8').hex()
+
+
+class ShardedSearchIndex:
+    """Builds prefix-sharded postings and bucketed doc metadata"""
+
+    def __init__(self, prefix_length: int = 2, bucket_size: int = 500):
+        """
+        Initialize an empty index
+
+        Args:
+            prefix_length: Characters of a term that pick its shard; also
+                the shortest term indexed
+            bucket_size: Documents per metadata bucket
+        """
+        self.prefix_length = max(1, int(prefix_length))
+        self.bucket_size = max(1, int(bucket_size))
+        self.docs: List[Dict[str, Any]] = []
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+
+    def add(self, doc: Dict[str, Any], fields: Iterable[Tuple[str, int]]) -> int:
+        """
+        Index a document
+
+        Args:
+            doc: Metadata returned to the client for a hit
+            fields: (text, weight) pairs; a term's score is the summed
+                weight of its occurrences
+
+        Returns:
+            The document number used in postings
+        """
+        number = len(self.docs)
+        self.docs.append(doc)
+        for text, weight in fields:
+            for term in tokenize(text, self.prefix_length):
+                postings = self._postings[term]
+                postings[number] = postings.get(number, 0) + weight
+        return number
+
+    def shards(self) -> Dict[str, Dict[str, Any]]:
+        """Shard payloads keyed by file name, postings sorted by score"""
+        shards: Dict[str, Dict[str, Any]] = {}
+        for term in sorted(self._postings):
+            prefix = term[:self.prefix_length]
+            shard = shards.setdefault(shard_name(prefix), {'prefix': prefix, 'terms': {}})
+            postings = sorted(self._postings[term].items(), key=lambda item: (-item[1], item[0]))
+            shard['terms'][term] = [[number, score] for number, score in postings]
+        return shards
+
+    def buckets(self) -> List[Dict[str, Any]]:
+        """Doc metadata payloads, one per bucket"""
+        return [{'bucket': n, 'docs': self.docs[start:start + self.bucket_size]}
+                for n, start in enumerate(range(0, len(self.docs), self.bucket_size))]
+
+    def index_payload(self, shards: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """The index.json the client loads first, given the output of shards()"""
+        return {
+            'version': INDEX_VERSION,
+            'prefix_length': self.prefix_length,
+            'bucket_size': self.bucket_size,
+            'doc_count': len(self.docs),
+            'term_count': len(self._postings),
+            'shards': {shard['prefix']: name for name, shard in sorted(shards.items())},
+            'buckets': (len(self.docs) + self.bucket_size - 1) // self.bucket_size
+        }
+
@@ -6,9 +6,297 @@ Provides safe template rendering with variable substitution
 
 import re
 import html
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 import os
 
+
+_PATH = r'[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*'
+
+# One pattern for every tag; anything else between tags is literal text
+_TAG_PATTERN = re.compile(
+    r'\{\{(?:#(?P<block>if|each)\s+(?P<block_path>\w+(?:\.\w+)*)'
+    r'|/(?P<close>if|each)'
+    r'|(?P<raw>!?)(?P<path>' + _PATH + r'))\}\}'
+)
+
+# Node kinds in a compiled template
+_VAR, _IF, _EACH = 1, 2, 3
+
+# Compiled templates keyed by source text (file templates live in the registry)
+_SOURCE_CACHE: Dict[str, 'CompiledTemplate'] = {}
+_SOURCE_CACHE_SIZE = 64
+
+
+class TemplateSyntaxError(ValueError):
+    """Raised when a template has unbalanced block tags"""
+
+
+def _step(current: Any, part: str) -> Any:
+    """Resolve one part of a dotted path against a dict or an object"""
+    if isinstance(current, dict) and part in current:
+        return current[part]
+    if current is not None and hasattr(current, part):
+        return getattr(current, part)
+    return None
+
+
+def _lookup(current: Any, parts: Tuple[str, ...]) -> Any:
+    """Follow a dotted path through dicts and attributes"""
+    for part in parts:
+        current = _step(current, part)
+    return current
+
+
+_NEEDS_ESCAPE = re.compile(r'[&<>"\']').search
+
+
+def _text(value: Any) -> str:
+    """Raw variable output"""
+    return str(value or '')
+
+
+def _escaped(value: Any) -> str:
+    """Escaped variable output; most values need no escaping at all"""
+    text = value if value.__class__ is str else str(value or '')
+    return html.escape(text) if _NEEDS_ESCAPE(text) else text
+
+
+def _is_iterable(value: Any) -> bool:
+    """Whether an #each value has items to loop over"""
+    return bool(value) and hasattr(value, '__iter__')
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into a tree of nodes and compiled to a Python
+    render function
+
+    Nodes are literal strings or tuples:
+      (_VAR, path, escape)
+      (_IF, path, children)
+      (_EACH, path, children)
+    Paths starting with ``this`` resolve against the innermost loop item.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.nodes = self._parse(source)
+        self._render_fn = self._compile(self.nodes)
+
+    @staticmethod
+    def _parse(source: str) -> List[Any]:
+        root: List[Any] = []
+        stack: List[Tuple[str, List[Any]]] = [('', root)]
+        position = 0
+
+        for match in _TAG_PATTERN.finditer(source):
+            if match.start() > position:
+                stack[-1][1].append(source[position:match.start()])
+            position = match.end()
+
+            if match.group('block'):
+                children: List[Any] = []
+                kind = _IF if match.group('block') == 'if' else _EACH
+                stack[-1][1].append((kind, tuple(match.group('block_path').split('.')), children))
+                stack.append((match.group('block'), children))
+            elif match.group('close'):
+                if stack[-1][0] != match.group('close'):
+                    line = source.count('\n', 0, match.start()) + 1
+                    raise TemplateSyntaxError(f"Unexpected {{{{/{match.group('close')}}}}} on line {line}")
+                stack.pop()
+            else:
+                stack[-1][1].append((_VAR, tuple(match.group('path').split('.')), not match.group('raw')))
+
+        if len(stack) > 1:
+            raise TemplateSyntaxError(f"Unclosed {{{{#{stack[-1][0]}}}}} block")
+        if position < len(source):
+            root.append(source[position:])
+        return root
+
+    @classmethod
+    def _compile(cls, nodes: List[Any]):
+        """Generate and compile a render(context) function for the node tree"""
+        body: List[str] = []
+        hoisted: Dict[Any, str] = {}
+        cls._generate(nodes, body, 1, None, hoisted)
+
+        # Values used outside loops are resolved (and escaped) once per
+        # render at the top of the function, sharing path prefixes, with
+        # the common plain-dict case inlined
+        lines = ['def render(context):']
+        for (kind, path), name in hoisted.items():
+            if kind == 'value':
+                parent = hoisted[('value', path[:-1])] if len(path) > 1 else 'context'
+                lines.append(f"    {name} = {cls._inline_lookup(parent, path[-1:])}")
+            else:
+                value = hoisted[('value', path)]
+                lines.append(f"    {name} = {value} if {value}.__class__ is str else _text({value})")
+                if kind == 'escaped':
+                    lines.append(f"    if _needs_escape({name}): {name} = _escape({name})")
+        lines += ['    out = []', '    extend = out.extend'] + body
+        lines.append("    return ''.join(out)")
+
+        namespace = {'_step': _step, '_lookup': _lookup, '_text': _text, '_escaped': _escaped,
+                     '_escape': html.escape, '_needs_escape': _NEEDS_ESCAPE,
+                     '_is_iterable': _is_iterable}
+        # Literals are emitted with repr() and paths are validated by
+        # _TAG_PATTERN, so template text can never become code
+        exec(compile('\n'.join(lines), '<template>', 'exec'), namespace)
+        return namespace['render']
+
+    @classmethod
+    def _hoist(cls, hoisted: Dict[Any, str], kind: str, path: Tuple[str, ...]) -> str:
+        """Name of the local holding a value (or its text) resolved at render start"""
+        key = (kind, path)
+        if key not in hoisted:
+            if kind != 'value':
+                cls._hoist(hoisted, 'value', path)
+            elif len(path) > 1:
+                cls._hoist(hoisted, 'value', path[:-1])
+            hoisted[key] = f"v{len(hoisted)}"
+        return hoisted[key]
+
+    @staticmethod
+    def _inline_lookup(source: str, parts: Tuple[str, ...]) -> str:
+        """Expression resolving parts against a local, inlining the plain-dict case"""
+        if not parts:
+            return source
+        if len(parts) > 1:
+            return f"_lookup({source}, {parts!r})"
+        part = parts[0]
+        return f"({source}[{part!r}] if {source}.__class__ is dict and {part!r} in {source} else _step({source}, {part!r}))"
+
+    @classmethod
+    def _generate(cls, nodes: List[Any], lines: List[str], depth: int,
+                  loop_var: Optional[str], hoisted: Dict[Any, str]) -> None:
+        indent = '    ' * depth
+        # Consecutive outputs are written with one extend() call
+        pending: List[str] = []
+
+        def flush():
+            if pending:
+                lines.append(f"{indent}extend(({', '.join(pending)},))")
+                pending.clear()
+
+        for node in nodes:
+            if node.__class__ is str:
+                pending.append(repr(node))
+                continue
+
+            kind, path, arg = node
+            in_loop = loop_var and path[0] == 'this'
+            if in_loop:
+                value = cls._inline_lookup(loop_var, path[1:])
+            else:
+                value = cls._hoist(hoisted, 'value', path)
+
+            if kind == _VAR:
+                if in_loop:
+                    pending.append(f"{'_escaped' if arg else '_text'}({value})")
+                else:
+                    pending.append(cls._hoist(hoisted, 'escaped' if arg else 'text', path))
+                continue
+
+            flush()
+            if kind == _IF:
+                lines.append(f"{indent}if {value}:")
+                lines.append(f"{indent}    pass")
+                cls._generate(arg, lines, depth + 1, loop_var, hoisted)
+            else:
+                items, item = f"items{depth}", f"item{depth}"
+                lines.append(f"{indent}{items} = {value}")
+                lines.append(f"{indent}if _is_iterable({items}):")
+                lines.append(f"{indent}    for {item} in {items}:")
+                lines.append(f"{indent}        pass")
+                cls._generate(arg, lines, depth + 2, item, hoisted)
+        flush()
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render with context variables"""
+        return self._render_fn(context)
+
+
+class TemplateRegistry:
+    """
+    Process-wide cache of template files
+    
+    Each file is read once and compiled on first use; it is reloaded only
+    when its mtime or size changes, so edits are picked up by long-running
+    processes (e.g. ``sync_content.py --watch``) without a restart.
+    """
+    
+    def __init__(self):
+        # path -> {'mtime', 'size', 'source', 'compiled'}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # (name, search dirs) -> resolved path
+        self._resolved: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        self.reloads = 0
+    
+    def find(self, name: str, search_dirs: List[str]) -> Optional[str]:
+        """
+        Locate a template in the first search directory that has it
+        
+        Args:
+            name: Template file name, e.g. 'article.html'
+            search_dirs: Directories to probe in order
+            
+        Returns:
+            Absolute path, or None if no directory has the template
+        """
+        key = (name, tuple(search_dirs))
+        path = self._resolved.get(key)
+        if path and os.path.exists(path):
+            return path
+        
+        self._resolved.pop(key, None)
+        for directory in search_dirs:
+            candidate = os.path.abspath(os.path.join(directory, name))
+            if os.path.exists(candidate):
+                self._resolved[key] = candidate
+                return candidate
+        return None
+    
+    def _entry(self, template_path: str) -> Dict[str, Any]:
+        """Cached entry for a file, reloading it if it changed on disk"""
+        template_path = os.path.abspath(template_path)
+        stat = os.stat(template_path)
+        entry = self._files.get(template_path)
+        if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry
+        
+        with open(template_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        if entry:
+            self.reloads += 1
+        entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'source': source, 'compiled': None}
+        self._files[template_path] = entry
+        return entry
+    
+    def get_source(self, template_path: str) -> str:
+        """Raw text of a template file"""
+        return self._entry(template_path)['source']
+    
+    def get(self, template_path: str) -> CompiledTemplate:
+        """Compiled template for a file"""
+        entry = self._entry(template_path)
+        if entry['compiled'] is None:
+            entry['compiled'] = CompiledTemplate(entry['source'])
+        return entry['compiled']
+    
+    def loaded_files(self) -> List[str]:
+        """Paths of every template loaded so far"""
+        return list(self._files)
+    
+    def clear(self) -> None:
+        """Drop all cached templates and resolved paths"""
+        self._files.clear()
+        self._resolved.clear()
+
+
+# Shared by every TemplateEngine in the process
+template_registry = TemplateRegistry()
+
+
 class TemplateEngine:
     """Simple template engine with variable substitution"""
     
@@ -16,22 +304,28 @@ class TemplateEngine:
         self.template_dir = template_dir or os.path.join(
             os.path.dirname(__file__), '..', '..', 'templates'
         )
-        self.cache = {}
     
     def load_template(self, template_name: str) -> str:
-        """Load template from file with caching"""
-        if template_name in self.cache:
-            return self.cache[template_name]
-        
+        """Load template from file (cached process-wide, reloaded when it changes)"""
         template_path = os.path.join(self.template_dir, template_name)
         if not os.path.exists(template_path):
             raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = f.read()
-        
-        self.cache[template_name] = template
-        return template
+        return template_registry.get_source(template_path)
+    
+    @staticmethod
+    def compile(template: str) -> CompiledTemplate:
+        """Compile template text, reusing earlier compilations of the same text"""
+        compiled = _SOURCE_CACHE.get(template)
+        if compiled is None:
+            if len(_SOURCE_CACHE) >= _SOURCE_CACHE_SIZE:
+                _SOURCE_CACHE.clear()
+            compiled = _SOURCE_CACHE[template] = CompiledTemplate(template)
+        return compiled
+    
+    @staticmethod
+    def compile_file(template_path: str) -> CompiledTemplate:
+        """Compile a template file, recompiling only when its mtime or size changes"""
+        return template_registry.get(template_path)
     
     def render(self, template: str, context: Dict[str, Any]) -> str:
         """
@@ -41,96 +335,20 @@ class TemplateEngine:
         - {{!variable}} - Raw variable substitution (no escaping)
         - {{#if variable}}...{{/if}} - Conditional blocks
         - {{#each array}}...{{/each}} - Loop blocks with {{this}} for current item
+        Blocks may be nested; the template is compiled once and cached.
         """
-        
-        # Process conditionals
-        template = self._process_conditionals(template, context)
-        
-        # Process loops
-        template = self._process_loops(template, context)
-        
-        # Process variables
-        template = self._process_variables(template, context)
-        
-        return template
+        return self.compile(template).render(context)
     
     def render_file(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render template from file"""
-        template = self.load_template(template_name)
-        return self.render(template, context)
-    
-    def _process_conditionals(self, template: str, context: Dict[str, Any]) -> str:
-        """Process {{#if}} conditionals"""
-        pattern = r'\{\{#if\s+(\w+(?:\.\w+)*)\}\}(.*?)\{\{/if\}\}'
-        
-        def replace_conditional(match):
-            var_name = match.group(1)
-            content = match.group(2)
-            
-            value = self._get_nested_value(context, var_name)
-            if value:
-                return content
-            return ''
-        
-        return re.sub(pattern, replace_conditional, template, flags=re.DOTALL)
-    
-    def _process_loops(self, template: str, context: Dict[str, Any]) -> str:
-        """Process {{#each}} loops"""
-        pattern = r'\{\{#each\s+(\w+(?:\.\w+)*)\}\}(.*?)\{\{/each\}\}'
-        
-        def replace_loop(match):
-            var_name = match.group(1)
-            content = match.group(2)
-            
-            items = self._get_nested_value(context, var_name)
-            if not items or not hasattr(items, '__iter__'):
-                return ''
-            
-            result = []
-            for item in items:
-                # Create new context with 'this' pointing to current item
-                loop_context = context.copy()
-                loop_context['this'] = item
-                
-                # Process the loop content with the loop context
-                loop_content = self._process_variables(content, loop_context)
-                result.append(loop_content)
-            
-            return ''.join(result)
-        
-        return re.sub(pattern, replace_loop, template, flags=re.DOTALL)
-    
-    def _process_variables(self, template: str, context: Dict[str, Any]) -> str:
-        """Process {{variable}} substitutions"""
-        
-        # Raw variables (no escaping) - process first to avoid conflicts
-        pattern_raw = r'\{\{!([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\}\}'
-        template = re.sub(pattern_raw, 
-                         lambda m: str(self._get_nested_value(context, m.group(1)) or ''), 
-                         template)
-        
-        # Escaped variables - process after raw variables
-        pattern_escaped = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\}\}'
-        template = re.sub(pattern_escaped, 
-                         lambda m: html.escape(str(self._get_nested_value(context, m.group(1)) or '')), 
-                         template)
-        
-        return template
+        template_path = os.path.join(self.template_dir, template_name)
+        if not os.path.exists(template_path):
+            raise FileNotFoundError(f"Template not found: {template_path}")
+        return self.compile_file(template_path).render(context)
     
     def _get_nested_value(self, obj: Dict[str, Any], path: str) -> Any:
         """Get nested value from object using dot notation"""
-        parts = path.split('.')
-        current = obj
-        
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            elif hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return None
-        
-        return current
+        return _lookup(obj, tuple(path.split('.')))
 
 
 class ArticleTemplate(TemplateEngine):
@@ -139,6 +357,7 @@ class ArticleTemplate(TemplateEngine):
     def __init__(self):
         super().__init__()
         self.article_template = None
+        self._compiled_article = None
         
         # Import security middleware for nonce generation
         try:
@@ -149,9 +368,9 @@ class ArticleTemplate(TemplateEngine):
             self.security_middleware = security_middleware
     
     def load_article_template(self, template_path: str):
-        """Load the main article template"""
-        with open(template_path, 'r', encoding='utf-8') as f:
-            self.article_template = f.read()
+        """Load the main article template (compiled once per file version)"""
+        self._compiled_article = self.compile_file(template_path)
+        self.article_template = self._compiled_article.source
     
     def render_article(self, article_data: Dict[str, Any], base_path: str = '../../') -> str:
         """Render article with proper data structure and CSP nonces"""
@@ -193,7 +412,8 @@ class ArticleTemplate(TemplateEngine):
         }
         
         # Render template
-        rendered_html = self.render(self.article_template, context)
+        compiled = self._compiled_article or self.compile(self.article_template)
+        rendered_html = compiled.render(context)
         
         # Add nonces to any remaining inline scripts/styles that weren't templated
         rendered_html = self._add_nonces_to_inline_content(rendered_html, nonce)
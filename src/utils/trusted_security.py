@@ -9,6 +9,8 @@ Security implementation using trusted, industry-standard libraries:
 """
 
 import re
+import json
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Union
 from urllib.parse import urlparse
@@ -26,12 +28,17 @@ except ImportError:
 try:
     from .config import config
     from .logger import get_logger
+    from .sanitize_cache import SanitizeCache
 except ImportError:
     from src.utils.config import config
     from src.utils.logger import get_logger
+    from src.utils.sanitize_cache import SanitizeCache
 
 logger = get_logger(__name__)
 
+# Bump when sanitize_html() changes how it cleans, so cached results are dropped
+SANITIZER_RULES_VERSION = 1
+
 class TrustedSanitizer:
     """HTML sanitization using bleach - industry standard library"""
     
@@ -83,14 +90,40 @@ class TrustedSanitizer:
         self.ALLOWED_PROTOCOLS = additional_settings.get('allowed_protocols', 
                                                          ['http', 'https', 'mailto', 'tel'])
         
+        # Safe CSS properties for styling (configurable)
+        self.ALLOWED_CSS_PROPERTIES = additional_settings.get('allowed_css_properties', [
+            'color', 'background-color', 'font-size', 'font-weight',
+            'text-align', 'text-decoration', 'margin', 'padding',
+            'border', 'border-radius', 'display', 'float',
+        ])
+        
         # CSS sanitizer for safe styling
         if HAS_BLEACH:
-            css_properties = additional_settings.get('allowed_css_properties', [
-                'color', 'background-color', 'font-size', 'font-weight',
-                'text-align', 'text-decoration', 'margin', 'padding',
-                'border', 'border-radius', 'display', 'float',
-            ])
-            self.css_sanitizer = CSSSanitizer(allowed_css_properties=css_properties)
+            self.css_sanitizer = CSSSanitizer(allowed_css_properties=self.ALLOWED_CSS_PROPERTIES)
+        
+        # Results are cached per policy, so changing the allowed tags,
+        # attributes, protocols or CSS properties in config.yaml invalidates them
+        self.policy_version = self.get_policy_version()
+        self.cache = SanitizeCache(
+            self.policy_version,
+            max_entries=config.get('security.sanitize_cache.max_entries', 10000),
+            path=config.get('security.sanitize_cache.path', 'data/sanitize_cache.db') or None,
+            max_stored=config.get('security.sanitize_cache.max_stored', 200000)
+        )
+    
+    def get_policy_version(self) -> str:
+        """Hash of everything that decides what sanitize_html() returns"""
+        policy = {
+            'rules': SANITIZER_RULES_VERSION,
+            'bleach': bleach.__version__ if HAS_BLEACH else None,
+            'tags': sorted(self.ALLOWED_TAGS),
+            'attributes': {tag: sorted(attrs) if isinstance(attrs, (list, tuple)) else repr(attrs)
+                           for tag, attrs in self.ALLOWED_ATTRIBUTES.items()},
+            'protocols': sorted(self.ALLOWED_PROTOCOLS),
+            'css_properties': sorted(self.ALLOWED_CSS_PROPERTIES),
+        }
+        payload = json.dumps(policy, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
     
     def sanitize_html(self, content: str, allow_tags: bool = True) -> str:
         """
@@ -112,6 +145,11 @@ class TrustedSanitizer:
             logger.warning("bleach not available, using basic HTML escaping")
             return html.escape(content)
         
+        key = self.cache.make_key(content, allow_tags)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             if allow_tags:
                 # Use bleach to sanitize with allowed tags and attributes
@@ -137,7 +175,9 @@ class TrustedSanitizer:
                 # Strip all HTML tags
                 sanitized = bleach.clean(content, tags=[], strip=True)
             
-            return sanitized.strip()
+            sanitized = sanitized.strip()
+            self.cache.put(key, sanitized)
+            return sanitized
             
         except Exception as e:
             logger.error(f"HTML sanitization failed: {e}")
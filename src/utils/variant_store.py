@@ -0,0 +1,210 @@
+"""
+Image Variant Store
+Content-addressed storage for encoded image variants. Each (source hash,
+width, format, quality) is encoded and stored once, however many images
+share the same source bytes, and reference counted through image_variants
+"""
+
+import os
+import time
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+from ..database.db_manager import DatabaseManager
+
+logger = get_logger(__name__)
+
+SCHEMA_FILE = Path(__file__).parent.parent / 'database' / 'schema_updates' / 'variant_store.sql'
+
+# Subdirectory of the responsive images directory holding store files
+STORE_DIR = "store"
+
+
+def hash_file(path: Path) -> str:
+    """Content hash of a source image"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class VariantStore:
+    """Content-addressed, reference-counted image variant files"""
+
+    def __init__(self, responsive_dir: Path, db_manager: Optional[DatabaseManager] = None):
+        """
+        Initialize the store
+
+        Args:
+            responsive_dir: Directory variant filenames are relative to
+            db_manager: Database holding variant_store and image_variants
+        """
+        self.responsive_dir = Path(responsive_dir)
+        self.db = db_manager or DatabaseManager()
+        self._ready = False
+
+    @staticmethod
+    def relative_path(source_hash: str, width: int, height: int, format_name: str, quality: int) -> str:
+        """Store filename of a variant, relative to the responsive directory"""
+        format_ext = 'jpg' if format_name.upper() == 'JPEG' else format_name.lower()
+        return f"{STORE_DIR}/{source_hash[:2]}/{source_hash}_{width}x{height}_q{quality}.{format_ext}"
+
+    def ensure(self) -> bool:
+        """
+        Create the store table, the image_variants link column and the
+        reference counting triggers if they are missing
+
+        Returns:
+            True if the store is available
+        """
+        if self._ready:
+            return True
+        try:
+            with self.db.get_connection() as conn:
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(image_variants)")}
+                if 'store_id' not in columns:
+                    conn.execute("ALTER TABLE image_variants ADD COLUMN store_id INTEGER "
+                                 "REFERENCES variant_store(id)")
+                conn.executescript(SCHEMA_FILE.read_text())
+            self._ready = True
+        except Exception as e:
+            logger.error(f"Variant store unavailable: {e}")
+        return self._ready
+
+    def link(self, image_id: int, source_hash: str, variants: List[Dict[str, Any]]) -> None:
+        """
+        Register store entries and point an image's variant rows at them
+
+        The image's previous image_variants rows are replaced; the
+        triggers move reference counts from the old entries to the new.
+
+        Args:
+            image_id: images.id
+            source_hash: Hash of the image's source bytes
+            variants: Variant records (filename relative to the responsive directory)
+        """
+        self.ensure()
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM image_variants WHERE image_id = ?", (image_id,))
+            if not variants:
+                return
+
+            conn.executemany("""
+                INSERT INTO variant_store (source_hash, width, height, format, quality, local_filename, file_size)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source_hash, width, format, quality) DO UPDATE SET file_size = excluded.file_size
+            """, [(source_hash, v['width'], v['height'], v['format'], v['quality'], v['filename'], v['file_size'])
+                  for v in variants])
+
+            placeholders = ', '.join('?' for _ in variants)
+            store_ids = dict(conn.execute(
+                f"SELECT local_filename, id FROM variant_store WHERE local_filename IN ({placeholders})",
+                [v['filename'] for v in variants]).fetchall())
+
+            conn.executemany("""
+                INSERT INTO image_variants
+                (image_id, variant_type, width, height, format, local_filename, file_size, quality,
+                 is_optimized, store_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?)
+            """, [(image_id, v['variant_type'], v['width'], v['height'], v['format'], v['filename'],
+                   v['file_size'], v['quality'], store_ids[v['filename']]) for v in variants])
+
+    def smallest_variants(self, image_id: int) -> Dict[Tuple[str, str], str]:
+        """
+        Filenames of an image's smallest written variant of each kind
+
+        Planned rows whose files were never rendered (is_optimized = 0)
+        are ignored.
+
+        Returns:
+            (variant_type, format) -> filename relative to the responsive directory
+        """
+        files = {}
+        for row in self.db.execute_query("""
+            SELECT variant_type, format, local_filename FROM image_variants
+            WHERE image_id = ? AND is_optimized = 1
+            ORDER BY width DESC
+        """, (image_id,)):
+            files[(row['variant_type'], row['format'])] = row['local_filename']
+        return files
+
+    def linked_files(self) -> Dict[int, set]:
+        """image_id -> store filenames its variant rows point at"""
+        self.ensure()
+        linked: Dict[int, set] = {}
+        for row in self.db.execute_query(
+                "SELECT image_id, local_filename FROM image_variants WHERE store_id IS NOT NULL"):
+            linked.setdefault(row['image_id'], set()).add(row['local_filename'])
+        return linked
+
+    def collect_garbage(self, dry_run: bool = False, min_age: float = 3600) -> Dict[str, int]:
+        """
+        Delete store entries no image_variants row references, and their files
+
+        Files under the store directory that no entry tracks (left by an
+        interrupted run) are deleted too once older than min_age, so a
+        run that is still linking its output is not disturbed.
+
+        Args:
+            dry_run: Only report what would be deleted
+            min_age: Seconds before an untracked file may be deleted
+
+        Returns:
+            Counts of entries and files removed and bytes freed
+        """
+        stats = {'entries_removed': 0, 'files_removed': 0, 'bytes_freed': 0}
+        if not self.ensure():
+            return stats
+
+        with self.db.get_connection() as conn:
+            if dry_run:
+                orphans = conn.execute("""
+                    SELECT id, local_filename FROM variant_store s
+                    WHERE NOT EXISTS (SELECT 1 FROM image_variants WHERE store_id = s.id)
+                """).fetchall()
+            else:
+                # Recount first, in case rows changed while the triggers were missing
+                conn.execute("""
+                    UPDATE variant_store SET ref_count =
+                        (SELECT COUNT(*) FROM image_variants WHERE store_id = variant_store.id)
+                """)
+                orphans = conn.execute(
+                    "SELECT id, local_filename FROM variant_store WHERE ref_count <= 0").fetchall()
+                conn.executemany("DELETE FROM variant_store WHERE id = ?", [(row[0],) for row in orphans])
+            tracked = {row[0] for row in conn.execute("SELECT local_filename FROM variant_store")}
+        stats['entries_removed'] = len(orphans)
+
+        doomed = {self.responsive_dir / row[1] for row in orphans}
+        store_root = self.responsive_dir / STORE_DIR
+        if store_root.exists():
+            cutoff = time.time() - min_age
+            for path in store_root.rglob('*'):
+                relative = path.relative_to(self.responsive_dir).as_posix()
+                if path.is_file() and relative not in tracked and path.stat().st_mtime < cutoff:
+                    doomed.add(path)
+
+        for path in doomed:
+            if not path.exists():
+                continue
+            stats['bytes_freed'] += path.stat().st_size
+            stats['files_removed'] += 1
+            if not dry_run:
+                os.unlink(path)
+
+        logger.info(f"Variant store garbage collection{' (dry run)' if dry_run else ''}: {stats}")
+        return stats
+
+    def get_stats(self) -> Dict[str, int]:
+        """Entry, reference and byte totals for the store"""
+        if not self.ensure():
+            return {}
+        row = self.db.execute_one("""
+            SELECT COUNT(*) AS entries, COALESCE(SUM(ref_count), 0) AS references_total,
+                   COALESCE(SUM(file_size), 0) AS bytes_stored,
+                   COALESCE(SUM(CASE WHEN ref_count <= 0 THEN 1 ELSE 0 END), 0) AS unreferenced
+            FROM variant_store
+        """)
+        return dict(row) if row else {}